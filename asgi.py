@@ -0,0 +1,20 @@
+"""
+ASGI serving mode (optional). URL-heavy intake ke liye asyncio par chalta hai; Flask (main.py) default rehta hai.
+
+Chalane ke liye:
+    uvicorn asgi:application --host 0.0.0.0 --port 5000
+ya
+    python asgi.py
+"""
+from main import app, ai_manager, config, logger
+from backend.ai_agent_manager.asgi_app import create_asgi_app
+
+application = create_asgi_app(app, ai_manager, config)
+
+if __name__ == "__main__":
+    import uvicorn
+
+    host = config.get("server", {}).get("host", "0.0.0.0")
+    port = config.get("server", {}).get("port", 5000)
+    logger.info(f"Starting ASGI server on {host}:{port}")
+    uvicorn.run(application, host=host, port=port, log_config=None)
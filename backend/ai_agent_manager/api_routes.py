@@ -1,8 +1,12 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response
 from flask_cors import CORS
-from jsonschema import validate, ValidationError
 import logging
-from backend.ai_agent_manager.data_schema import get_campaign_details_schema, get_agent_response_schema
+from backend.ai_agent_manager import metrics
+from backend.ai_agent_manager.job_queue import QueueFullError, DuplicateJobError
+from backend.ai_agent_manager.state_store import InvalidCursorError
+from backend.ai_agent_manager.uploads import UploadTooLargeError, InvalidUploadError
+
+MAX_LIST_LIMIT = 200
 
 # Flask application instance banayein
 app = Flask(__name__)
@@ -22,42 +26,276 @@ def health_check():
     logger.info("Health check requested.")
     return jsonify({"status": "healthy", "message": "AI Agent Backend is running."}), 200
 
-@app.route("/api/v1/campaigns", methods=["POST"])
-def create_campaign():
+@app.route("/api/v1/ready", methods=["GET"])
+def readiness_check():
     """
-    Naya campaign shuru karne ke liye endpoint.
-    Frontend se campaign details JSON format mein receive karega.
+    Readiness endpoint: batata hai ki app kaam le sakta hai. Preload mode mein iska matlab heavy engines (OCR, PDF,
+    parsers) load aur warm ho chuke hain; lazy mode mein engines pehli request par load hote hain, isliye Manager bante hi ready.
+    """
+    ai_manager = app.config.get('AI_MANAGER')
+    if not ai_manager:
+        return jsonify({"status": "not_ready", "message": "AI Manager not initialized."}), 503
+
+    readiness = ai_manager.get_readiness()
+    if readiness["ready"]:
+        return jsonify({"status": "ready", **readiness}), 200
+    return jsonify({"status": "not_ready", **readiness}), 503
+
+@app.route("/api/v1/metrics", methods=["GET"])
+def metrics_endpoint():
+    """
+    Workflow stages aur Strategist tools ke counters/latency histograms Prometheus text format mein.
+    """
+    return Response(metrics.registry.render(), mimetype="text/plain; version=0.0.4")
+
+def parse_campaign_request(data, ai_manager):
+    """
+    POST /api/v1/campaigns ki body check aur validate karta hai.
+    Flask aur ASGI dono serving modes isi ko use karte hain.
+
+    Returns:
+        tuple: (campaign_details, None) valid hone par, warna (None, (response dict, HTTP status)).
     """
     # 1. JSON Request Body ko check karein
-    data = request.get_json()
     if not data:
         logger.warning("No JSON data received for /api/v1/campaigns.")
-        return jsonify({"status": "error", "message": "Request must contain JSON data."}), 400
+        return None, ({"status": "error", "message": "Request must contain JSON data."}, 400)
+
+    # 2. Manager instance ko check karein
+    if not ai_manager:
+        logger.critical("AI Manager instance not found in app config.")
+        return None, ({"status": "error", "message": "Server error: AI Manager not initialized."}, 500)
 
-    # 2. Schema Validation karein
+    # 3. Schema Validation karein (startup par compiled validator se)
     campaign_details = data.get("campaign_details")
     if not campaign_details:
         logger.warning("Missing 'campaign_details' in /api/v1/campaigns request.")
-        return jsonify({"status": "error", "message": "Missing 'campaign_details' in request."}), 400
+        return None, ({"status": "error", "message": "Missing 'campaign_details' in request."}, 400)
+
+    validation_error = ai_manager.validators.validate("campaign_details", campaign_details)
+    if validation_error:
+        logger.error(f"Validation error: {validation_error}")
+        return None, ({"status": "error", "message": f"Invalid campaign data: {validation_error}"}, 400)
+
+    if campaign_details["input_type"] == "screenshot_file" and ai_manager.upload_store.path_for(campaign_details["input_data"]) is None:
+        logger.warning(f"Campaign references unknown upload: {campaign_details['input_data']}")
+        return None, ({"status": "error", "message": f"Upload '{campaign_details['input_data']}' not found. Upload the screenshot to /api/v1/uploads first."}, 400)
+
+    logger.info(f"Received campaign request: {campaign_details.get('campaign_name', 'Unnamed')}")
+    return campaign_details, None
+
+def campaign_accepted_response(campaign_id):
+    """
+    Queue mein daale gaye campaign ka 202 response (dict, status).
+    """
+    return {
+        "status": "pending",
+        "message": "Campaign accepted for processing.",
+        "campaign_id": campaign_id,
+        "status_url": f"/api/v1/campaigns/{campaign_id}"
+    }, 202
+
+def campaign_submit_error_response(error):
+    """
+    Campaign queue karte waqt aayi exception ko response mein badalta hai.
+    Returns:
+        tuple: (response dict, HTTP status, extra headers dict)
+    """
+    if isinstance(error, QueueFullError):
+        logger.warning(f"Campaign rejected, job queue is full: {error}")
+        return {"status": "error", "message": "Server is busy. Please retry later."}, 503, {"Retry-After": "5"}
+    if isinstance(error, DuplicateJobError):
+        logger.warning(f"Duplicate campaign submission: {error}")
+        return {"status": "error", "message": str(error)}, 409, {}
+    logger.error(f"An unexpected error occurred while queueing the campaign: {error}", exc_info=error)
+    return {"status": "error", "message": "An internal server error occurred."}, 500, {}
+
+def upload_created_response(upload):
+    """
+    Save hue upload ka 201 response (dict, status), jisme campaign ke liye input fields bhi hote hain.
+    """
+    return {
+        "status": "success",
+        "message": "File uploaded successfully.",
+        **upload,
+        "campaign_input": {"input_type": "screenshot_file", "input_data": upload["upload_id"]}
+    }, 201
+
+def upload_error_response(error):
+    """
+    Upload ke dauran aayi exception ko (response dict, HTTP status) mein badalta hai.
+    """
+    if isinstance(error, UploadTooLargeError):
+        logger.warning(f"Upload rejected: {error}")
+        return {"status": "error", "message": str(error)}, 413
+    if isinstance(error, InvalidUploadError):
+        logger.warning(f"Upload rejected: {error}")
+        return {"status": "error", "message": str(error)}, 400
+    logger.error(f"An unexpected error occurred while saving the upload: {error}", exc_info=error)
+    return {"status": "error", "message": "An internal server error occurred."}, 500
+
+@app.route("/api/v1/uploads", methods=["POST"])
+def upload_file():
+    """
+    Screenshot upload endpoint. Body raw image bytes (Content-Type: image/png etc.) ya multipart/form-data
+    ('file' field) ho sakti hai. File chunks mein data_dir/media/uploads mein stream hoti hai; response ka
+    campaign_input campaign details mein use karein.
+    """
+    ai_manager = app.config.get('AI_MANAGER')
+    if not ai_manager:
+        logger.critical("AI Manager instance not found in app config.")
+        return jsonify({"status": "error", "message": "Server error: AI Manager not initialized."}), 500
 
-    schema = get_campaign_details_schema()
     try:
-        validate(instance=campaign_details, schema=schema)
-    except ValidationError as e:
-        logger.error(f"Validation error: {e.message}", exc_info=True)
-        return jsonify({"status": "error", "message": f"Invalid campaign data: {e.message}"}), 400
+        if request.mimetype == "multipart/form-data":
+            # Multipart body ko Werkzeug spooled temp file mein parse karta hai; wahan se bhi chunks mein copy hota hai
+            if request.content_length is not None and request.content_length > ai_manager.upload_store.max_bytes:
+                raise UploadTooLargeError(f"Upload size {request.content_length} bytes exceeds limit of {ai_manager.upload_store.max_bytes} bytes.")
+            uploaded_file = request.files.get("file")
+            if uploaded_file is None:
+                return jsonify({"status": "error", "message": "Multipart upload must contain a 'file' field."}), 400
+            upload = ai_manager.upload_store.save_stream(uploaded_file.stream)
+        else:
+            upload = ai_manager.upload_store.save_stream(request.stream, request.content_length)
+    except Exception as e:
+        payload, status_code = upload_error_response(e)
+        return jsonify(payload), status_code
+
+    payload, status_code = upload_created_response(upload)
+    return jsonify(payload), status_code
+
+@app.route("/api/v1/campaigns", methods=["POST"])
+def create_campaign():
+    """
+    Naya campaign shuru karne ke liye endpoint.
+    Frontend se campaign details JSON format mein receive karega.
+    """
+    ai_manager = app.config.get('AI_MANAGER')
+    campaign_details, error_response = parse_campaign_request(request.get_json(silent=True), ai_manager)
+    if error_response:
+        payload, status_code = error_response
+        return jsonify(payload), status_code
+
+    # 4. Manager ki job queue mein campaign daalein (workflow background mein chalega)
+    try:
+        campaign_id = ai_manager.submit_campaign(campaign_details)
+    except Exception as e:
+        payload, status_code, headers = campaign_submit_error_response(e)
+        return jsonify(payload), status_code, headers
+    payload, status_code = campaign_accepted_response(campaign_id)
+    return jsonify(payload), status_code
+
+@app.route("/api/v1/campaigns/batch", methods=["POST"])
+def create_campaign_batch():
+    """
+    Ek saath kai campaigns chalane ke liye endpoint.
+    Request mein 'campaign_details' campaigns ki array hoti hai; har campaign ka result alag se milta hai.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict) or not data:
+        logger.warning("No JSON data received for /api/v1/campaigns/batch.")
+        return jsonify({"status": "error", "message": "Request must contain JSON data."}), 400
+
+    campaign_details_list = data.get("campaign_details")
+    if not isinstance(campaign_details_list, list) or not campaign_details_list:
+        logger.warning("Missing or empty 'campaign_details' array in /api/v1/campaigns/batch request.")
+        return jsonify({"status": "error", "message": "'campaign_details' must be a non-empty array."}), 400
+
+    max_items = app.config.get("BATCH_MAX_ITEMS", 100)
+    if len(campaign_details_list) > max_items:
+        return jsonify({"status": "error", "message": f"Batch too large: maximum {max_items} campaigns allowed."}), 400
 
-    # 3. Manager instance ko access karein
     ai_manager = app.config.get('AI_MANAGER')
     if not ai_manager:
         logger.critical("AI Manager instance not found in app config.")
         return jsonify({"status": "error", "message": "Server error: AI Manager not initialized."}), 500
 
-    # 4. Manager ke workflow ko trigger karein
+    # Pehle saare campaigns single-campaign endpoint ki tarah validate karein (schema aur upload check); invalid
+    # campaigns ka error unki jagah par record hota hai
+    results = [None] * len(campaign_details_list)
+    valid_campaigns = []
+    for index, item in enumerate(campaign_details_list):
+        campaign_details, error_response = parse_campaign_request({"campaign_details": item}, ai_manager)
+        if error_response:
+            logger.warning(f"Batch item {index} rejected: {error_response[0]['message']}")
+            results[index] = error_response[0]
+        else:
+            valid_campaigns.append((index, campaign_details))
+
     try:
-        logger.info(f"Received campaign request: {campaign_details.get('campaign_name', 'Unnamed')}")
-        result = ai_manager.start_campaign_workflow(campaign_details)
-        return jsonify(result), 200
+        batch_results = ai_manager.run_campaign_batch([campaign_details for _, campaign_details in valid_campaigns])
     except Exception as e:
-        logger.error(f"An unexpected error occurred in the campaign workflow: {e}", exc_info=True)
-        return jsonify({"status": "error", "message": "An internal server error occurred."}), 500
\ No newline at end of file
+        logger.error(f"An unexpected error occurred in the batch workflow: {e}", exc_info=True)
+        return jsonify({"status": "error", "message": "An internal server error occurred."}), 500
+
+    for (index, _), result in zip(valid_campaigns, batch_results):
+        results[index] = result
+
+    succeeded = sum(1 for result in results if result["status"] == "success")
+    return jsonify({
+        "status": "success",
+        "message": f"Batch processed: {succeeded} succeeded, {len(results) - succeeded} failed.",
+        "results": [{"index": index, **result} for index, result in enumerate(results)]
+    }), 200
+
+@app.route("/api/v1/campaigns", methods=["GET"])
+def list_campaigns():
+    """
+    Campaigns ki paginated list (naye pehle).
+    Query params: limit (default 50, max 200), cursor (pichle response ka next_cursor), status.
+    """
+    ai_manager = app.config.get('AI_MANAGER')
+    if not ai_manager:
+        logger.critical("AI Manager instance not found in app config.")
+        return jsonify({"status": "error", "message": "Server error: AI Manager not initialized."}), 500
+
+    try:
+        limit = int(request.args.get("limit", 50))
+    except ValueError:
+        return jsonify({"status": "error", "message": "'limit' must be an integer."}), 400
+    if not 1 <= limit <= MAX_LIST_LIMIT:
+        return jsonify({"status": "error", "message": f"'limit' must be between 1 and {MAX_LIST_LIMIT}."}), 400
+
+    try:
+        campaigns, next_cursor = ai_manager.list_campaigns(limit=limit, cursor=request.args.get("cursor"), status=request.args.get("status"))
+    except InvalidCursorError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
+    return jsonify({"status": "success", "campaigns": campaigns, "next_cursor": next_cursor}), 200
+
+@app.route("/api/v1/campaigns/<campaign_id>", methods=["GET"])
+def get_campaign_status(campaign_id):
+    """
+    Ek campaign ke workflow ka progress batata hai.
+    Frontend is endpoint ko poll karke status check karega.
+    """
+    ai_manager = app.config.get('AI_MANAGER')
+    if not ai_manager:
+        logger.critical("AI Manager instance not found in app config.")
+        return jsonify({"status": "error", "message": "Server error: AI Manager not initialized."}), 500
+
+    workflow_status = ai_manager.get_workflow_status(campaign_id)
+    if workflow_status is None:
+        return jsonify({"status": "error", "message": f"Campaign '{campaign_id}' not found."}), 404
+
+    return jsonify({"status": "success", "campaign_id": campaign_id, "workflow": workflow_status}), 200
+
+@app.route("/api/v1/campaigns/<campaign_id>", methods=["DELETE"])
+def cancel_campaign(campaign_id):
+    """
+    Queued ya running campaign ko cancel karta hai.
+    Cancellation cooperative hai: workflow apne agle checkpoint par rukta hai aur status "cancelled" ho jaata hai,
+    isliye response 202 hai; frontend GET endpoint se final status dekh sakta hai.
+    """
+    ai_manager = app.config.get('AI_MANAGER')
+    if not ai_manager:
+        logger.critical("AI Manager instance not found in app config.")
+        return jsonify({"status": "error", "message": "Server error: AI Manager not initialized."}), 500
+
+    cancellation = ai_manager.cancel_campaign(campaign_id)
+    if cancellation is None:
+        return jsonify({"status": "error", "message": f"Campaign '{campaign_id}' not found."}), 404
+    if not cancellation["cancelled"]:
+        return jsonify({"status": "error", "campaign_id": campaign_id, "message": cancellation["message"]}), 409
+
+    return jsonify({"status": "success", "campaign_id": campaign_id, "message": cancellation["message"]}), 202
@@ -0,0 +1,325 @@
+import asyncio
+import io
+import json
+import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from backend.ai_agent_manager.api_routes import (
+    parse_campaign_request, campaign_accepted_response, campaign_submit_error_response,
+    upload_created_response, upload_error_response
+)
+from backend.ai_agent_manager.job_queue import QueueFullError, DuplicateJobError
+from backend.ai_agent_manager.uploads import InvalidUploadError
+
+try:
+    import httpx # Optional: non-blocking URL fetches ke liye
+except ImportError:
+    httpx = None
+
+URL_INPUT_TYPES = ("url", "discord_link")
+
+
+class AsyncCampaignRunner:
+    """
+    Yeh class ASGI mode mein campaigns ko event loop par chalati hai.
+    URL inputs event loop par non-blocking fetch hote hain, isliye hazaron fetch-bound campaigns ek process mein
+    ek saath chal sakte hain. OCR/PDF jaisa CPU-heavy kaam (poora Manager workflow) ek bounded executor mein jaata hai.
+    """
+    def __init__(self, manager, config):
+        """
+        Args:
+            manager (Manager): AI Agent Manager instance.
+            config (dict): Application ki configuration settings.
+        """
+        self.manager = manager
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        asgi_config = config.get("asgi", {})
+        # Ek process mein maximum kitne campaigns (fetch + workflow) ek saath chal sakte hain
+        self.max_inflight = max(1, int(asgi_config.get("max_inflight", 5000)))
+        self.max_connections = max(1, int(asgi_config.get("max_connections", 500)))
+        cpu_workers = int(asgi_config.get("cpu_workers", 0)) or (os.cpu_count() or 2)
+        self.cpu_executor = ThreadPoolExecutor(max_workers=cpu_workers, thread_name_prefix="asgi-workflow")
+
+        self.client = None
+        self._tasks = {} # campaign_id -> asyncio.Task (None jab tak state store mein likha ja raha hai)
+        self.logger.info(f"AsyncCampaignRunner initialized (max inflight: {self.max_inflight}, workflow workers: {cpu_workers}, "
+                         f"async HTTP: {'httpx' if httpx else 'executor fallback'}).")
+
+    async def start(self):
+        if httpx is not None:
+            limits = httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=min(100, self.max_connections))
+            self.client = httpx.AsyncClient(limits=limits)
+
+    async def close(self):
+        tasks = [task for task in self._tasks.values() if task is not None]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if self.client is not None:
+            await self.client.aclose()
+        self.cpu_executor.shutdown(wait=True)
+
+    async def submit(self, campaign_details) -> str:
+        """
+        Campaign ko background task ke roop mein shuru karta hai aur turant uski id return karta hai.
+        Raises:
+            QueueFullError: Agar max_inflight campaigns pehle se chal rahe hain.
+            DuplicateJobError: Agar same campaign id pehle se chal rahi hai.
+        """
+        campaign_details = self.manager.prepare_campaign(campaign_details)
+        campaign_id = campaign_details["campaign_id"]
+        if campaign_id in self._tasks or self.manager.job_queue.is_active(campaign_id):
+            raise DuplicateJobError(f"Job '{campaign_id}' is already queued or running.")
+        if len(self._tasks) >= self.max_inflight:
+            raise QueueFullError(f"Too many campaigns in flight (max: {self.max_inflight}).")
+
+        loop = asyncio.get_running_loop()
+        # Id pehle reserve karein taaki state store likhte waqt duplicate submission na ho sake;
+        # Deadline bhi yahin se shuru hota hai, taaki async fetch aur workflow dono ek hi budget mein rahein
+        self.manager.open_deadline(campaign_id)
+        self._tasks[campaign_id] = None
+        try:
+            await loop.run_in_executor(None, self.manager.record_queued_campaign, campaign_details, "Campaign queued for processing.")
+        except Exception:
+            self._tasks.pop(campaign_id, None)
+            self.manager.close_deadline(campaign_id)
+            raise
+        task = loop.create_task(self._run(campaign_details))
+        self._tasks[campaign_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(campaign_id, None))
+        return campaign_id
+
+    async def _run(self, campaign_details):
+        campaign_id = campaign_details["campaign_id"]
+        prefetched_text = None
+        prefetch_error = None
+        loop = asyncio.get_running_loop()
+        deadline = self.manager.get_deadline(campaign_id)
+        # Cancel ya expire ho chuke campaign ka fetch nahi hota; workflow turant sahi status likh deta hai
+        aborted = deadline is not None and (deadline.cancelled or deadline.expired)
+        if campaign_details.get("input_type") in URL_INPUT_TYPES and not aborted:
+            remove_callback = None
+            try:
+                url_fetcher = await self._get_url_fetcher()
+                fetch_task = asyncio.ensure_future(url_fetcher.fetch_async(campaign_details["input_data"], self.client))
+                if deadline is not None:
+                    # Cancel request (kisi bhi thread se) chal rahe fetch ko event loop par hi rok deti hai
+                    remove_callback = deadline.on_cancel(lambda: loop.call_soon_threadsafe(fetch_task.cancel))
+                # Budget khatam hone par wait_for fetch task cancel kar deta hai
+                fetch_result = await asyncio.wait_for(fetch_task, timeout=deadline.remaining() if deadline is not None else None)
+                prefetched_text = fetch_result["text"]
+                self.logger.info(f"[{campaign_id}] URL fetched asynchronously (from local store: {fetch_result['from_store']}).")
+            except asyncio.CancelledError:
+                if deadline is None or not deadline.cancelled:
+                    raise
+                self.logger.info(f"[{campaign_id}] Async URL fetch cancelled.")
+            except asyncio.TimeoutError:
+                self.logger.warning(f"[{campaign_id}] Async URL fetch ran out of the campaign budget.")
+            except Exception as e:
+                # Fetch ki galti final hai: workflow dobara (blocking) fetch nahi karta, campaign isi error ke saath fail hota hai
+                self.logger.warning(f"[{campaign_id}] Async URL fetch failed: {e}")
+                prefetch_error = f"Could not fetch content from URL: {e}"
+            finally:
+                if remove_callback is not None:
+                    remove_callback()
+
+        # Cancel/timeout par workflow shuru hote hi deadline check se sahi status (cancelled/timed_out) likhta hai
+        await loop.run_in_executor(self.cpu_executor, partial(self.manager.start_campaign_workflow, campaign_details,
+                                                              prefetched_text=prefetched_text, prefetch_error=prefetch_error))
+
+    async def _get_url_fetcher(self):
+        # DocumentParser pehli baar load hone mein heavy imports karta hai, isliye executor mein
+        loop = asyncio.get_running_loop()
+        document_parser = await loop.run_in_executor(None, lambda: self.manager.strategist_agent.document_parser)
+        return document_parser.url_fetcher
+
+
+class ASGIApp:
+    """
+    Yeh ek chhota ASGI application hai jo api_routes ke endpoints ko asyncio par serve karta hai.
+    POST /api/v1/campaigns aur raw-body uploads natively async hain; baaki saare endpoints usi Flask app ko WSGI ke through
+    executor mein call karte hain, isliye unka behaviour dono serving modes mein ek jaisa rehta hai.
+    """
+    def __init__(self, flask_app, manager, config):
+        """
+        Args:
+            flask_app (Flask): api_routes ka Flask app.
+            manager (Manager): AI Agent Manager instance.
+            config (dict): Application ki configuration settings.
+        """
+        self.flask_app = flask_app
+        self.manager = manager
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        asgi_config = config.get("asgi", {})
+        self.max_body_bytes = int(asgi_config.get("max_body_mb", 32)) * 1024 * 1024
+        self.wsgi_executor = ThreadPoolExecutor(max_workers=int(asgi_config.get("wsgi_workers", 8)), thread_name_prefix="asgi-wsgi")
+        self.runner = AsyncCampaignRunner(manager, config)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            path = scope["path"].rstrip("/")
+            if scope["method"] == "POST" and path == "/api/v1/uploads" and not self._header(scope, b"content-type").startswith("multipart/"):
+                # Raw uploads body ko memory mein jama kiye bina seedha disk par stream hote hain
+                await self._upload(scope, receive, send)
+                return
+            try:
+                body = await self._read_body(receive)
+            except ValueError:
+                await self._send_json(send, {"status": "error", "message": "Request body too large."}, 413)
+                return
+            if scope["method"] == "POST" and path == "/api/v1/campaigns":
+                await self._create_campaign(body, send)
+            else:
+                await self._call_wsgi(scope, body, send)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await self.runner.start()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.runner.close()
+                self.wsgi_executor.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _read_body(self, receive) -> bytes:
+        chunks = []
+        received = 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                break
+            chunk = message.get("body", b"")
+            received += len(chunk)
+            if received > self.max_body_bytes:
+                raise ValueError("Request body too large.")
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                break
+        return b"".join(chunks)
+
+    async def _create_campaign(self, body, send):
+        try:
+            data = json.loads(body) if body else None
+        except ValueError:
+            data = None
+        # Validation CPU-light hai (compiled validators), isliye seedha event loop par
+        campaign_details, error_response = parse_campaign_request(data if isinstance(data, dict) else None, self.manager)
+        if error_response:
+            await self._send_json(send, *error_response)
+            return
+        try:
+            campaign_id = await self.runner.submit(campaign_details)
+        except Exception as e:
+            payload, status_code, headers = campaign_submit_error_response(e)
+            await self._send_json(send, payload, status_code, headers)
+            return
+        await self._send_json(send, *campaign_accepted_response(campaign_id))
+
+    async def _upload(self, scope, receive, send):
+        loop = asyncio.get_running_loop()
+        content_length = self._header(scope, b"content-length")
+        upload_store = self.manager.upload_store
+        try:
+            writer = upload_store.open_writer(int(content_length) if content_length.isdigit() else None)
+        except Exception as e:
+            await self._send_json(send, *upload_error_response(e))
+            return
+        try:
+            while True:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    raise InvalidUploadError("Client disconnected before the upload completed.")
+                chunk = message.get("body", b"")
+                if chunk:
+                    await loop.run_in_executor(None, writer.write, chunk)
+                if not message.get("more_body", False):
+                    break
+            upload = await loop.run_in_executor(None, writer.commit)
+        except Exception as e:
+            writer.abort()
+            await self._send_json(send, *upload_error_response(e))
+            return
+        self.logger.info(f"Upload {upload['upload_id']} saved ({upload['size_bytes']} bytes, {upload['format']}).")
+        await self._send_json(send, *upload_created_response(upload))
+
+    @staticmethod
+    def _header(scope, name: bytes) -> str:
+        for header_name, value in scope.get("headers", []):
+            if header_name.lower() == name:
+                return value.decode("latin-1")
+        return ""
+
+    async def _send_json(self, send, payload, status_code, headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        response_headers = [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode("ascii"))]
+        response_headers.extend((name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in (headers or {}).items())
+        # Flask app ki tarah CORS sabhi origins ke liye
+        response_headers.append((b"access-control-allow-origin", b"*"))
+        await send({"type": "http.response.start", "status": status_code, "headers": response_headers})
+        await send({"type": "http.response.body", "body": body})
+
+    async def _call_wsgi(self, scope, body, send):
+        loop = asyncio.get_running_loop()
+        status_code, headers, response_body = await loop.run_in_executor(self.wsgi_executor, self._run_wsgi, scope, body)
+        await send({"type": "http.response.start", "status": status_code, "headers": headers})
+        await send({"type": "http.response.body", "body": response_body})
+
+    def _run_wsgi(self, scope, body):
+        server_name, server_port = scope.get("server") or ("localhost", 80)
+        environ = {
+            "REQUEST_METHOD": scope["method"],
+            "SCRIPT_NAME": scope.get("root_path", ""),
+            "PATH_INFO": scope["path"],
+            "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+            "SERVER_NAME": str(server_name),
+            "SERVER_PORT": str(server_port),
+            "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+            "CONTENT_LENGTH": str(len(body)),
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": scope.get("scheme", "http"),
+            "wsgi.input": io.BytesIO(body),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": False,
+            "wsgi.run_once": False,
+        }
+        if scope.get("client"):
+            environ["REMOTE_ADDR"] = scope["client"][0]
+        for name, value in scope.get("headers", []):
+            name = name.decode("latin-1").upper().replace("-", "_")
+            value = value.decode("latin-1")
+            if name == "CONTENT_TYPE":
+                environ["CONTENT_TYPE"] = value
+            elif name != "CONTENT_LENGTH":
+                key = f"HTTP_{name}"
+                environ[key] = f"{environ[key]},{value}" if key in environ else value
+
+        response = {}
+
+        def start_response(status, headers, exc_info=None):
+            response["status"] = int(status.split(" ", 1)[0])
+            response["headers"] = [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers]
+
+        result = self.flask_app(environ, start_response)
+        try:
+            response_body = b"".join(result)
+        finally:
+            if hasattr(result, "close"):
+                result.close()
+        return response["status"], response["headers"], response_body
+
+
+def create_asgi_app(flask_app, manager, config) -> ASGIApp:
+    """
+    Flask app aur Manager se ASGI application banata hai (uvicorn jaise ASGI server ke liye).
+    """
+    return ASGIApp(flask_app, manager, config)
@@ -0,0 +1,217 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    campaign_id TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    output TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (campaign_id, stage)
+);
+CREATE INDEX IF NOT EXISTS idx_checkpoints_created ON checkpoints (created_at);
+CREATE TABLE IF NOT EXISTS leases (
+    campaign_id TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    heartbeat_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_leases_owner ON leases (owner);
+CREATE TABLE IF NOT EXISTS cancellations (
+    campaign_id TEXT PRIMARY KEY,
+    reason TEXT NOT NULL,
+    requested_at REAL NOT NULL
+);
+"""
+
+
+def fingerprint(*parts) -> str:
+    """
+    Stage input ka sha256 (hex): parts ka canonical JSON (sorted keys), isliye dict ka order fark nahi daalta.
+    """
+    raw = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def file_digest(path: str) -> str:
+    """
+    File ke content ka sha256 (hex). Stage fingerprint mein file ka path nahi, uska content jaata hai, taaki same path par
+    badli hui file purana checkpoint na utha le.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class CheckpointStore:
+    """
+    Yeh class campaign workflow ke har stage ka validated output (checkpoint) SQLite mein rakhti hai, campaign_id aur
+    stage input ke fingerprint ke saath. Stage dobara usi input ke saath chale (restart ke baad resume ya same campaign ka
+    re-submission) to checkpoint se output mil jaata hai aur stage ka kaam (OCR, downloads) skip hota hai.
+
+    Saath hi har active campaign ki lease rakhti hai: jo process campaign chala raha hai woh heartbeat se lease taaza rakhta
+    hai. Jis adhure campaign ki lease lease_sec se purani ho (process mar gaya) use koi bhi process claim karke resume kar
+    sakta hai; claim ek conditional UPDATE hai, isliye kai workers mein se sirf ek hi use uthata hai.
+    Cancel requests bhi yahin likhi jaati hain, taaki campaign chala rahe process tak pahunchen chahe request kisi bhi
+    worker par aayi ho; lease ka owner heartbeat ke saath unhe padhta hai.
+    """
+    def __init__(self, config):
+        """
+        CheckpointStore ko initialize karta hai aur tables banata hai.
+        Args:
+            config (dict): Application ki configuration settings.
+        """
+        self.config = config
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        checkpoint_config = config.get("checkpoints", {})
+        data_dir = config.get("paths", {}).get("data_dir", "backend/data")
+        self.enabled = checkpoint_config.get("enabled", True)
+        self.heartbeat_sec = max(0.1, float(checkpoint_config.get("heartbeat_sec", 5)))
+        self.lease_sec = max(self.heartbeat_sec * 2, float(checkpoint_config.get("lease_sec", 30)))
+        self.retention_sec = float(checkpoint_config.get("retention_days", 7)) * 86400
+        self.db_path = checkpoint_config.get("path") or os.path.join(data_dir, "state", "checkpoints.db")
+        # Is process ki pehchaan; leases isi naam se li jaati hain
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:12]}"
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+        self.logger.info(f"CheckpointStore opened at {self.db_path} (enabled: {self.enabled}, owner: {self.owner}).")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def load(self, campaign_id: str, stage: str, input_fingerprint: str):
+        """
+        Stage ka checkpoint output, sirf tab jab woh isi input fingerprint ke liye bana ho.
+        Returns:
+            Stage output (JSON se), ya None agar checkpoint nahi hai ya input badal gaya hai.
+        """
+        if not self.enabled:
+            return None
+        row = self._connect().execute(
+            "SELECT output FROM checkpoints WHERE campaign_id = ? AND stage = ? AND fingerprint = ?",
+            (campaign_id, stage, input_fingerprint)
+        ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def save(self, campaign_id: str, stage: str, input_fingerprint: str, output):
+        """
+        Stage ka validated output checkpoint ke roop mein likhta hai (stage ka pichla checkpoint badal jaata hai).
+        """
+        if not self.enabled:
+            return
+        with self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO checkpoints (campaign_id, stage, fingerprint, output, created_at) VALUES (?, ?, ?, ?, ?)",
+                         (campaign_id, stage, input_fingerprint, json.dumps(output), time.time()))
+
+    def discard(self, campaign_id: str, stage: str):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM checkpoints WHERE campaign_id = ? AND stage = ?", (campaign_id, stage))
+
+    def acquire(self, campaign_id: str) -> bool:
+        """
+        Campaign ki lease is process ke liye leta hai.
+        Returns:
+            bool: False agar koi doosra zinda process (taaza lease) campaign chala raha hai.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO leases (campaign_id, owner, heartbeat_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (campaign_id) DO UPDATE SET owner = excluded.owner, heartbeat_at = excluded.heartbeat_at "
+                "WHERE leases.owner = excluded.owner OR leases.heartbeat_at < ?",
+                (campaign_id, self.owner, now, now - self.lease_sec)
+            )
+        return cursor.rowcount == 1
+
+    def release(self, campaign_id: str):
+        with self._connect() as conn:
+            cursor = conn.execute("DELETE FROM leases WHERE campaign_id = ? AND owner = ?", (campaign_id, self.owner))
+            if cursor.rowcount:
+                # Run khatam; uske liye aayi cancel request ab agle submission par nahi lagni chahiye
+                conn.execute("DELETE FROM cancellations WHERE campaign_id = ?", (campaign_id,))
+
+    def request_cancel(self, campaign_id: str, reason: str):
+        """
+        Campaign ke liye cancel request likhta hai; jis process ke paas lease hai woh agle heartbeat par use cancel karta
+        hai (lease kisi ke paas na ho to resume karne wala process deadline kholte hi).
+        """
+        with self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO cancellations (campaign_id, reason, requested_at) VALUES (?, ?, ?)",
+                         (campaign_id, reason, time.time()))
+
+    def cancel_reason(self, campaign_id: str):
+        """
+        Campaign ki pending cancel request ka reason, ya None.
+        """
+        row = self._connect().execute("SELECT reason FROM cancellations WHERE campaign_id = ?", (campaign_id,)).fetchone()
+        return row[0] if row is not None else None
+
+    def owned_cancellations(self) -> list:
+        """
+        Is process ki leases wale campaigns ki pending cancel requests.
+        Returns:
+            list: (campaign_id, reason) tuples.
+        """
+        return self._connect().execute(
+            "SELECT cancellations.campaign_id, cancellations.reason FROM cancellations "
+            "JOIN leases ON leases.campaign_id = cancellations.campaign_id WHERE leases.owner = ?", (self.owner,)
+        ).fetchall()
+
+    def heartbeat(self) -> int:
+        """
+        Is process ki saari leases taaza karta hai.
+        Returns:
+            int: Kitni leases refresh hui.
+        """
+        with self._connect() as conn:
+            return conn.execute("UPDATE leases SET heartbeat_at = ? WHERE owner = ?", (time.time(), self.owner)).rowcount
+
+    def claim_orphans(self, campaign_ids) -> list:
+        """
+        Diye gaye adhure (queued/running) campaigns mein se woh claim karta hai jinki lease kisi doosre owner ki hai aur
+        lease_sec se purani hai, ya lease hai hi nahi (jaise process lease lene se pehle mar gaya).
+        Returns:
+            list: Is process ke claim kiye campaign ids.
+        """
+        claimed = []
+        now = time.time()
+        with self._connect() as conn:
+            for campaign_id in campaign_ids:
+                cursor = conn.execute(
+                    "INSERT INTO leases (campaign_id, owner, heartbeat_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT (campaign_id) DO UPDATE SET owner = excluded.owner, heartbeat_at = excluded.heartbeat_at "
+                    "WHERE leases.owner != excluded.owner AND leases.heartbeat_at < ?",
+                    (campaign_id, self.owner, now, now - self.lease_sec)
+                )
+                if cursor.rowcount == 1:
+                    claimed.append(campaign_id)
+        return claimed
+
+    def prune(self) -> int:
+        """
+        retention_days se purane checkpoints hatata hai.
+        Returns:
+            int: Kitne checkpoints hataye gaye.
+        """
+        cutoff = time.time() - self.retention_sec
+        with self._connect() as conn:
+            conn.execute("DELETE FROM cancellations WHERE requested_at < ?", (cutoff,))
+            return conn.execute("DELETE FROM checkpoints WHERE created_at < ?", (cutoff,)).rowcount
@@ -7,8 +7,8 @@ def get_campaign_details_schema():
         "properties": {
             "campaign_id": {"type": "string", "description": "Unique ID for the campaign"},
             "campaign_name": {"type": "string", "description": "Name of the campaign"},
-            "input_type": {"type": "string", "enum": ["screenshot", "text_file", "discord_link"], "description": "Type of input provided"},
-            "input_data": {"type": "string", "description": "Base64 encoded image data, file path, or URL"},
+            "input_type": {"type": "string", "enum": ["screenshot", "screenshot_file", "text_file", "pdf_file", "docx_file", "url", "discord_link"], "description": "Type of input provided"},
+            "input_data": {"type": "string", "minLength": 1, "description": "Base64 encoded image data, upload id (screenshot_file), file path, or URL"},
             "required_length_sec": {"type": "string", "description": "Desired video length range (e.g., '15-60s')"},
             "target_product": {"type": "string", "description": "Product name or topic of the campaign"},
             "target_audience": {"type": "string", "description": "Target audience (e.g., 'gamers', 'tech enthusiasts')"},
@@ -17,9 +17,24 @@ def get_campaign_details_schema():
                 "items": {"type": "string", "enum": ["youtube", "instagram"]},
                 "description": "Platforms to publish to"
             },
-            "brand_logo_path": {"type": "string", "nullable": True, "description": "Optional path to brand logo image"}
+            "brand_logo_path": {"type": ["string", "null"], "description": "Optional path to brand logo image"}
         },
-        "required": ["campaign_name", "input_type", "input_data", "required_length_sec", "target_product", "social_media_platforms"]
+        "required": ["campaign_name", "input_type", "input_data", "required_length_sec", "target_product", "social_media_platforms"],
+        # File/URL input types ka input_data usi format ka hona chahiye jo unka extraction tool padhta hai
+        "allOf": [
+            {
+                "if": {"properties": {"input_type": {"const": "pdf_file"}}, "required": ["input_type"]},
+                "then": {"properties": {"input_data": {"pattern": "[.][Pp][Dd][Ff]$"}}}
+            },
+            {
+                "if": {"properties": {"input_type": {"const": "docx_file"}}, "required": ["input_type"]},
+                "then": {"properties": {"input_data": {"pattern": "[.][Dd][Oo][Cc][Xx]$"}}}
+            },
+            {
+                "if": {"properties": {"input_type": {"const": "url"}}, "required": ["input_type"]},
+                "then": {"properties": {"input_data": {"pattern": "^[Hh][Tt][Tt][Pp][Ss]?://[^\\s/]+"}}}
+            }
+        ]
     }
 
 def get_agent_response_schema():
@@ -31,7 +46,7 @@ def get_agent_response_schema():
         "properties": {
             "status": {"type": "string", "enum": ["success", "error", "pending"], "description": "Status of the agent's operation"},
             "message": {"type": "string", "description": "A human-readable message about the operation"},
-            "data": {"type": "object", "nullable": True, "description": "Any data returned by the agent (e.g., video links, analytics)"}
+            "data": {"type": ["object", "null"], "description": "Any data returned by the agent (e.g., video links, analytics)"}
         },
         "required": ["status", "message"]
     }
@@ -56,7 +71,7 @@ def get_strategist_output_schema():
             "campaign_name": {"type": "string"},
             "video_length": {"type": "string"},
             "target_product": {"type": "string"},
-            "target_audience": {"type": "string", "nullable": True},
+            "target_audience": {"type": ["string", "null"]},
             "social_media_platforms": {
                 "type": "array",
                 "items": {"type": "string"}
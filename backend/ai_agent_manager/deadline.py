@@ -0,0 +1,151 @@
+import threading
+import time
+
+
+class CampaignAbortedError(Exception):
+    """
+    Jab campaign ka kaam beech mein roka jaata hai (deadline khatam ya cancel) tab raise hota hai.
+    Tools ise apne error dict mein nahi badalte, taaki yeh seedha Manager tak pahunche.
+    """
+    pass
+
+
+class DeadlineExceededError(CampaignAbortedError):
+    """
+    Jab campaign ka time budget khatam ho jaata hai tab raise hota hai.
+    """
+    pass
+
+
+class CampaignCancelledError(CampaignAbortedError):
+    """
+    Jab campaign ko DELETE /api/v1/campaigns/<id> se cancel kiya jaata hai tab raise hota hai.
+    """
+    pass
+
+
+class Deadline:
+    """
+    Ek campaign ka time budget aur cancellation flag.
+    Manager har campaign ke submit hote hi ek Deadline banata hai (queue ka intezaar bhi budget mein gina jaata hai)
+    aur use Strategist, Researcher aur unke tools tak pass karta hai. Tools apne timeouts (OCR process, HTTP request,
+    PDF page loop) baaki budget tak seemit karte hain aur lambe loops ke beech check() karte hain, isliye cancel ya
+    budget khatam hone par kaam agle check par ruk jaata hai.
+    """
+    def __init__(self, budget_sec: float = None, campaign_id: str = "unknown_campaign"):
+        """
+        Args:
+            budget_sec (float): Campaign ka kul samay (seconds). None ya 0 ka matlab koi limit nahi.
+            campaign_id (str): Messages ke liye campaign id.
+        """
+        self.campaign_id = campaign_id
+        self.budget_sec = float(budget_sec) if budget_sec else None
+        self.started_at = time.monotonic()
+        self.expires_at = self.started_at + self.budget_sec if self.budget_sec else None
+        self.reason = None
+        self._cancelled = threading.Event()
+        self._callbacks = []
+        self._callbacks_lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def remaining(self):
+        """
+        Budget ka baaki samay (seconds), ya None agar koi limit nahi.
+        """
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def cancel(self, reason: str = "Campaign cancelled by request."):
+        """
+        Campaign ko cancel mark karta hai; chal raha kaam agle check() par ruk jaata hai.
+        """
+        with self._callbacks_lock:
+            if self._cancelled.is_set():
+                return
+            self.reason = reason
+            self._cancelled.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def on_cancel(self, callback):
+        """
+        Cancel hone par callback() chalata hai (cancel karne wale thread mein; pehle se cancel ho to turant). Aise kaam ke
+        liye jo check() tak nahi pahunchta, jaise event loop par chal raha async fetch.
+        Returns:
+            callable: Callback hatane wala function (kaam poora hone par bulayein).
+        """
+        with self._callbacks_lock:
+            if not self._cancelled.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._remove_callback(callback)
+        callback()
+        return lambda: None
+
+    def _remove_callback(self, callback):
+        with self._callbacks_lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def check(self):
+        """
+        Raises:
+            CampaignCancelledError: Agar campaign cancel ho chuka hai.
+            DeadlineExceededError: Agar budget khatam ho chuka hai.
+        """
+        if self._cancelled.is_set():
+            raise CampaignCancelledError(self.reason)
+        if self.expired:
+            raise DeadlineExceededError(f"Campaign exceeded its time budget of {self.budget_sec:g} seconds.")
+
+    def timeout(self, default: float = None):
+        """
+        Kisi tool call ka timeout: default aur baaki budget mein se jo chhota ho.
+        Returns:
+            float | None: Seconds, ya None agar na default hai na budget.
+        Raises:
+            CampaignAbortedError: Agar campaign pehle hi cancel ya expire ho chuka hai.
+        """
+        self.check()
+        remaining = self.remaining()
+        if remaining is None:
+            return default
+        return remaining if default is None else min(float(default), remaining)
+
+    def stop_at(self):
+        """
+        Budget khatam hone ka wall-clock samay (time.time()), doosre processes (jaise PDF workers) ko dene ke liye.
+        """
+        remaining = self.remaining()
+        return None if remaining is None else time.time() + remaining
+
+    def sleep(self, seconds: float):
+        """
+        Retry backoff jaisa intezaar jo cancel hote hi toot jaata hai aur budget se lamba nahi hota.
+        """
+        remaining = self.remaining()
+        self._cancelled.wait(seconds if remaining is None else min(seconds, remaining))
+        self.check()
+
+
+def check_deadline(deadline):
+    """
+    deadline diya ho to uska check() chalata hai (tools mein deadline optional hai).
+    """
+    if deadline is not None:
+        deadline.check()
+
+
+def limit_timeout(deadline, default=None):
+    """
+    deadline diya ho to default ko baaki budget tak seemit karta hai, warna default hi return karta hai.
+    """
+    return deadline.timeout(default) if deadline is not None else default
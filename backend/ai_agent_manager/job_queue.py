@@ -0,0 +1,112 @@
+import logging
+import queue
+import threading
+
+
+class QueueFullError(Exception):
+    """
+    Jab job queue apni maximum depth tak bhar chuki ho tab raise hota hai.
+    """
+    pass
+
+
+class DuplicateJobError(Exception):
+    """
+    Jab same job id pehle se queue mein ya run ho rahi ho tab raise hota hai.
+    """
+    pass
+
+
+class JobQueue:
+    """
+    Yeh ek bounded background job queue hai jo fixed number of worker threads par chalti hai.
+    API request ko turant return karne deti hai aur heavy kaam (OCR, PDF, URL) background mein hota hai.
+    """
+    _SENTINEL = object()
+
+    def __init__(self, worker_count: int, max_depth: int, name: str = "JobQueue"):
+        """
+        JobQueue ko initialize karta hai aur worker threads start karta hai.
+        Args:
+            worker_count (int): Kitne worker threads jobs chalayenge.
+            max_depth (int): Queue mein maximum pending jobs.
+            name (str): Worker threads ke naam ka prefix.
+        """
+        self.worker_count = max(1, int(worker_count))
+        self.max_depth = max(1, int(max_depth))
+        self.name = name
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self._queue = queue.Queue(maxsize=self.max_depth)
+        self._active_ids = set() # Queued ya running jobs ki ids
+        self._lock = threading.Lock()
+        self._workers = []
+
+        for index in range(self.worker_count):
+            worker = threading.Thread(target=self._worker_loop, name=f"{name}-worker-{index}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+        self.logger.info(f"JobQueue started with {self.worker_count} workers (max depth: {self.max_depth}).")
+
+    def submit(self, job_id: str, func, *args, **kwargs):
+        """
+        Ek naya job queue mein daalta hai. Yeh method block nahi karta.
+
+        Args:
+            job_id (str): Job ki unique id.
+            func (callable): Worker thread mein chalne wala function.
+        Raises:
+            DuplicateJobError: Agar same id ka job pehle se active hai.
+            QueueFullError: Agar queue bhari hui hai.
+        """
+        with self._lock:
+            if job_id in self._active_ids:
+                raise DuplicateJobError(f"Job '{job_id}' is already queued or running.")
+            try:
+                self._queue.put_nowait((job_id, func, args, kwargs))
+            except queue.Full:
+                raise QueueFullError(f"Job queue is full (max depth: {self.max_depth}).")
+            self._active_ids.add(job_id)
+        self.logger.info(f"[{job_id}] Job queued. Pending jobs: {self._queue.qsize()}")
+
+    def is_active(self, job_id: str) -> bool:
+        """
+        Batata hai ki job abhi queue mein hai ya run ho raha hai.
+        """
+        with self._lock:
+            return job_id in self._active_ids
+
+    def depth(self) -> int:
+        """
+        Queue mein pending jobs ki sankhya return karta hai.
+        """
+        return self._queue.qsize()
+
+    def shutdown(self, wait: bool = True):
+        """
+        Sabhi workers ko band karta hai. Pending jobs pehle poore kiye jaate hain.
+        """
+        for _ in self._workers:
+            self._queue.put(self._SENTINEL)
+        if wait:
+            for worker in self._workers:
+                worker.join()
+        self.logger.info("JobQueue shut down.")
+
+    def _worker_loop(self):
+        while True:
+            item = self._queue.get()
+            if item is self._SENTINEL:
+                self._queue.task_done()
+                break
+
+            job_id, func, args, kwargs = item
+            try:
+                func(*args, **kwargs)
+            except Exception as e:
+                self.logger.error(f"[{job_id}] Unhandled error in background job: {e}", exc_info=True)
+            finally:
+                with self._lock:
+                    self._active_ids.discard(job_id)
+                self._queue.task_done()
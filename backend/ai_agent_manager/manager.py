@@ -1,5 +1,26 @@
+import hashlib
 import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from backend.strategist_agent.strategist import Strategist # Strategist class ko import karein
+from backend.strategist_agent.tools.extraction_cache import FILE_INPUT_TYPES, URL_INPUT_TYPES
+from backend.researcher_agent.researcher import Researcher
+from backend.marketer_agent.marketer import Marketer
+from backend.ai_agent_manager.job_queue import JobQueue, DuplicateJobError, QueueFullError
+from backend.ai_agent_manager.validators import ValidatorRegistry
+from backend.ai_agent_manager.pipeline import Pipeline
+from backend.ai_agent_manager.state_store import StateStore, TERMINAL_STATUSES
+from backend.ai_agent_manager.uploads import UploadStore, resolve_upload_path
+from backend.ai_agent_manager.media_store import MediaStore
+from backend.ai_agent_manager.checkpoints import CheckpointStore, fingerprint, file_digest
+from backend.ai_agent_manager import metrics
+from backend.ai_agent_manager.structured_logging import campaign_context, stage_context
+from backend.ai_agent_manager.deadline import Deadline, CampaignAbortedError, CampaignCancelledError
 
 class Manager:
     """
@@ -16,54 +37,632 @@ class Manager:
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.info("Manager initialized with provided configuration.")
 
+        # Saare schemas ke validators startup par ek baar compile hote hain
+        self.validators = ValidatorRegistry(config)
+
         # Strategist Agent ko initialize karein
         self.strategist_agent = Strategist(config)
         self.logger.info("Strategist Agent initialized within Manager.")
 
-        self.campaigns = {} # Active campaigns ka record.
-        self.workflow_status = {} # Har campaign ke workflow ka status.
+        # Content-addressed media store (hash se dedupe, campaign references, quota par LRU eviction)
+        self.media_store = MediaStore(config)
+
+        # Researcher Agent: videos dhoondhkar data_dir/raw_videos mein download karta hai
+        self.researcher_agent = Researcher(config, media_store=self.media_store)
+        self.logger.info("Researcher Agent initialized within Manager.")
+
+        # Marketer Agent: jama kiye video metadata ke index se hashtags aur title phrases suggest karta hai
+        self.marketer_agent = Marketer(config)
+        self.logger.info("Marketer Agent initialized within Manager.")
+
+        # Campaigns aur unke workflow status ka durable record (SQLite, saare workers ke beech shared)
+        self.state_store = StateStore(config)
+        # Streamed screenshot uploads (data_dir/media/uploads)
+        self.upload_store = UploadStore(config)
+        # Har stage ke validated output ke checkpoints aur active campaigns ki leases (crash ke baad resume ke liye)
+        self.checkpoints = CheckpointStore(config)
+
+        # Background job queue jo campaigns ko API thread se alag chalati hai
+        queue_config = config.get("job_queue", {})
+        self.job_queue = JobQueue(
+            worker_count=queue_config.get("workers", 2),
+            max_depth=queue_config.get("max_depth", 50),
+            name="CampaignQueue"
+        )
+        # Har active (queued ya running) campaign ka time budget aur cancellation flag
+        self.campaign_budget_sec = float(queue_config.get("campaign_budget_sec", 900) or 0)
+        self._deadlines = {}
+        self._deadlines_lock = threading.Lock()
+
+        # Preload mode mein Strategist tools background mein pehle se load aur warm ho jaate hain
+        if config.get("startup", {}).get("preload_tools", False):
+            threading.Thread(target=self.strategist_agent.warm_up, name="strategist-warmup", daemon=True).start()
+            self.logger.info("Strategist tools preload started in background.")
+
+        # Agents ki streaming pipeline; aage ke agents bhi isi mein register honge
+        self.pipeline = self._build_pipeline(config.get("pipeline", {}).get("stages", {}))
+
+        # Batch submissions ke items is executor par bounded concurrency ke saath chalte hain
+        batch_config = config.get("batch", {})
+        self.batch_concurrency = max(1, int(batch_config.get("concurrency", 4)))
+        self.batch_executor = ThreadPoolExecutor(max_workers=self.batch_concurrency, thread_name_prefix="campaign-batch")
+
+        # Background thread: is process ki leases taaza rakhta hai aur mare hue processes ke adhure campaigns resume karta hai
+        self.resume_interrupted = config.get("checkpoints", {}).get("resume_interrupted", True)
+        threading.Thread(target=self._lease_loop, name="campaign-leases", daemon=True).start()
+
+    def submit_campaign(self, campaign_details):
+        """
+        Campaign ko background job queue mein daalta hai aur turant return karta hai.
+        Workflow ka progress state store mein update hota rehta hai.
+
+        Args:
+            campaign_details (dict): Campaign ki saari jaankari.
+        Returns:
+            str: Campaign (job) id jisse status poll kiya ja sakta hai.
+        Raises:
+            QueueFullError: Agar job queue bhari hui hai.
+            DuplicateJobError: Agar same campaign id pehle se chal rahi hai.
+        """
+        campaign_details = self.prepare_campaign(campaign_details)
+        campaign_id = campaign_details["campaign_id"]
+
+        # Budget submit hote hi shuru hota hai, taaki overload mein queue ka intezaar bhi tail latency mein bandha rahe
+        self.open_deadline(campaign_id)
+        try:
+            # Queued row submit se pehle likhi jaati hai; baad mein likhne par tez chalne wala worker ka final status
+            # (completed/failed) wapas queued ho sakta tha aur resume use dobara chala deta
+            self.record_queued_campaign(campaign_details, "Campaign queued for processing.")
+            try:
+                self.job_queue.submit(campaign_id, self.start_campaign_workflow, campaign_details)
+            except QueueFullError as e:
+                # Queued row chhodne par resume scan ise chala deta, jab ki client ko error mil chuka hai
+                self._update_status(campaign_id, status="failed", stage=None, message=f"Campaign could not be queued: {e}",
+                                    finished_at=time.time())
+                raise
+        except Exception:
+            self.close_deadline(campaign_id)
+            raise
+        return campaign_id
+
+    def prepare_campaign(self, campaign_details):
+        """
+        Campaign details ki copy return karta hai jisme campaign_id zaroor ho (na ho to naya uuid).
+        """
+        campaign_details = dict(campaign_details)
+        campaign_details["campaign_id"] = campaign_details.get("campaign_id") or uuid.uuid4().hex
+        return campaign_details
+
+    def open_deadline(self, campaign_id):
+        """
+        Campaign ke liye naya Deadline (config ka campaign_budget_sec) register karta hai.
+        Returns:
+            Deadline: Campaign ka budget/cancellation object.
+        Raises:
+            DuplicateJobError: Agar same id ka campaign pehle se queued ya running hai.
+        """
+        with self._deadlines_lock:
+            if campaign_id in self._deadlines:
+                raise DuplicateJobError(f"Job '{campaign_id}' is already queued or running.")
+            # Lease se doosre worker process mein chal raha same campaign bhi pakda jaata hai
+            if not self.checkpoints.acquire(campaign_id):
+                raise DuplicateJobError(f"Job '{campaign_id}' is already queued or running in another worker.")
+            deadline = self._deadlines[campaign_id] = Deadline(self.campaign_budget_sec, campaign_id)
+        # Kisi doosre worker par aayi cancel request (jaise process marne se pehle) resume par bhi lagti hai
+        reason = self.checkpoints.cancel_reason(campaign_id)
+        if reason is not None:
+            deadline.cancel(reason)
+        return deadline
+
+    def get_deadline(self, campaign_id):
+        with self._deadlines_lock:
+            return self._deadlines.get(campaign_id)
 
-    def start_campaign_workflow(self, campaign_details):
+    def close_deadline(self, campaign_id):
+        with self._deadlines_lock:
+            self._deadlines.pop(campaign_id, None)
+            try:
+                self.checkpoints.release(campaign_id)
+            except sqlite3.Error as e:
+                # Lease apne aap lease_sec baad purani ho jaayegi
+                self.logger.error(f"[{campaign_id}] Failed to release campaign lease: {e}")
+
+    def _lease_loop(self):
+        last_prune = 0.0
+        while True:
+            try:
+                self.checkpoints.heartbeat()
+                self.apply_cancel_requests()
+                if self.resume_interrupted:
+                    self.resume_interrupted_campaigns()
+                if time.time() - last_prune > 3600:
+                    last_prune = time.time()
+                    self.checkpoints.prune()
+                    self.sweep_campaign_media()
+                    self.prune_uploads()
+            except sqlite3.Error as e:
+                self.logger.error(f"Campaign lease maintenance failed: {e}")
+            time.sleep(self.checkpoints.heartbeat_sec)
+
+    def resume_interrupted_campaigns(self):
+        """
+        Queued/running campaigns jinki lease purani hai (unka process mar gaya, jaise restart ya crash) claim karke
+        dobara job queue mein daalta hai. Workflow checkpoints se poore ho chuke stages skip karta hai aur pehle adhure
+        stage se aage chalta hai.
+
+        Returns:
+            list: Resume kiye gaye campaign ids.
+        """
+        with self._deadlines_lock:
+            local = set(self._deadlines)
+        candidates = [campaign_id for campaign_id in self.state_store.list_unfinished() if campaign_id not in local]
+        resumed = []
+        for campaign_id in self.checkpoints.claim_orphans(candidates):
+            campaign_details = self.state_store.get_campaign(campaign_id)
+            if campaign_details is None:
+                self.checkpoints.release(campaign_id)
+                continue
+            try:
+                self.open_deadline(campaign_id)
+            except DuplicateJobError:
+                # Claim ki hui lease chhodni hai, warna campaign lease_sec tak kisi ko nahi milta; lekin agar isi process
+                # mein is beech same campaign submit ho gaya hai to lease ab usi run ki hai
+                if self.get_deadline(campaign_id) is None:
+                    self.checkpoints.release(campaign_id)
+                continue
+            # Status submit se pehle, taaki worker ka likha running/final status queued se overwrite na ho
+            self._update_status(campaign_id, status="queued", stage=None, message="Campaign resumed after an interrupted run.")
+            try:
+                self.job_queue.submit(campaign_id, self.start_campaign_workflow, campaign_details)
+            except (QueueFullError, DuplicateJobError) as e:
+                # Campaign unfinished (queued) hi rehta hai; lease chhodne par agla scan ise phir uthayega
+                self.close_deadline(campaign_id)
+                self.logger.warning(f"[{campaign_id}] Could not resume interrupted campaign yet: {e}")
+                continue
+            self.logger.info(f"[{campaign_id}] Resuming interrupted campaign.")
+            resumed.append(campaign_id)
+        return resumed
+
+    def _load_checkpoint(self, campaign_id, stage, input_fingerprint, schema_name):
+        """
+        Stage ka checkpoint (same input fingerprint), schema se dobara validate karke. Galat ya purane schema wala
+        checkpoint hata diya jaata hai aur stage normal chalta hai.
+        """
+        try:
+            output = self.checkpoints.load(campaign_id, stage, input_fingerprint)
+            if output is not None and schema_name:
+                self._check_handoff(campaign_id, schema_name, output)
+        except ValueError as e:
+            self.logger.warning(f"[{campaign_id}] Discarding invalid {stage} checkpoint: {e}")
+            self.checkpoints.discard(campaign_id, stage)
+            return None
+        except sqlite3.Error as e:
+            self.logger.error(f"[{campaign_id}] Failed to load {stage} checkpoint: {e}")
+            return None
+        if output is not None:
+            self.logger.info(f"[{campaign_id}] {stage} stage input unchanged, using its checkpoint.")
+            metrics.stage_checkpoints_total.inc(stage=stage, outcome="hit")
+        return output
+
+    def _save_checkpoint(self, campaign_id, stage, input_fingerprint, output):
+        try:
+            self.checkpoints.save(campaign_id, stage, input_fingerprint, output)
+            metrics.stage_checkpoints_total.inc(stage=stage, outcome="saved")
+        except sqlite3.Error as e:
+            # Checkpoint na likhna workflow ko fail nahi karta; bas resume par yeh stage dobara chalega
+            self.logger.error(f"[{campaign_id}] Failed to save {stage} checkpoint: {e}")
+
+    def cancel_campaign(self, campaign_id):
+        """
+        Queued ya running campaign ko cooperatively cancel karta hai: uska Deadline cancel mark hota hai aur
+        chal rahe tools (OCR process, HTTP fetch, PDF page loop, video downloads) agle check par ruk jaate hain.
+        Workflow phir status "cancelled" likhta hai; media references release_on_finish ya retention sweep se chhoote hain.
+        Campaign kisi doosre worker process mein chal raha ho to cancel request shared checkpoint store mein jaati hai
+        aur woh process use agle heartbeat par lagata hai.
+
+        Returns:
+            dict | None: {"cancelled": bool, "workflow_status": str, "message": str}, ya None agar campaign nahi mila.
+        """
+        workflow_status = self.state_store.get_status(campaign_id)
+        if workflow_status is None:
+            return None
+        current = workflow_status.get("status")
+        if current in TERMINAL_STATUSES:
+            return {"cancelled": False, "workflow_status": current, "message": f"Campaign has already finished with status '{current}'."}
+
+        reason = "Campaign cancelled by request."
+        deadline = self.get_deadline(campaign_id)
+        if deadline is None:
+            self.checkpoints.request_cancel(campaign_id, reason)
+            self.logger.info(f"[{campaign_id}] Cancellation recorded for the worker running the campaign (status: {current}).")
+            return {"cancelled": True, "workflow_status": current,
+                    "message": "Cancellation requested; the worker running the campaign will stop it at its next checkpoint."}
+
+        deadline.cancel(reason)
+        self.logger.info(f"[{campaign_id}] Cancellation requested (status: {current}).")
+        return {"cancelled": True, "workflow_status": current, "message": "Cancellation requested; the campaign will stop at its next checkpoint."}
+
+    def apply_cancel_requests(self) -> list:
+        """
+        Doosre workers par aayi cancel requests in processes ke campaigns ke Deadlines par lagata hai.
+        Returns:
+            list: Cancel kiye gaye campaign ids.
+        """
+        cancelled = []
+        for campaign_id, reason in self.checkpoints.owned_cancellations():
+            deadline = self.get_deadline(campaign_id)
+            if deadline is not None and not deadline.cancelled:
+                deadline.cancel(reason)
+                self.logger.info(f"[{campaign_id}] Cancellation requested from another worker.")
+                cancelled.append(campaign_id)
+        return cancelled
+
+    def record_queued_campaign(self, campaign_details, message):
+        """
+        Campaign ko "queued" status ke saath state store mein likhta hai.
+        """
+        self.state_store.create_campaign(campaign_details["campaign_id"], campaign_details, status="queued", stage=None,
+                                         message=message, submitted_at=time.time())
+
+    def run_campaign_batch(self, campaign_details_list):
+        """
+        Kai campaigns ke workflows ko bounded concurrency ke saath parallel chalata hai
+        aur sabke poore hone ka intezaar karta hai. Ek campaign fail hone se baaki par asar nahi hota.
+
+        Args:
+            campaign_details_list (list): Validated campaign details ki list.
+        Returns:
+            list: Har campaign ka result dict, input ke order mein.
+        """
+        futures = []
+        for campaign_details in campaign_details_list:
+            campaign_details = self.prepare_campaign(campaign_details)
+            campaign_id = campaign_details["campaign_id"]
+
+            try:
+                self.open_deadline(campaign_id)
+            except DuplicateJobError:
+                futures.append({"status": "error", "message": f"Campaign '{campaign_id}' is already queued or running.", "campaign_id": campaign_id})
+                continue
+
+            try:
+                self.record_queued_campaign(campaign_details, "Campaign queued as part of a batch.")
+                futures.append(self.batch_executor.submit(self.start_campaign_workflow, campaign_details))
+            except Exception:
+                self.close_deadline(campaign_id)
+                raise
+
+        self.logger.info(f"Running batch of {len(campaign_details_list)} campaigns (concurrency: {self.batch_concurrency}).")
+        results = []
+        for future in futures:
+            if isinstance(future, dict):
+                results.append(future)
+                continue
+            try:
+                results.append(future.result())
+            except Exception as e:
+                self.logger.error(f"Unexpected error in batch campaign: {e}", exc_info=True)
+                results.append({"status": "error", "message": f"Campaign workflow failed: {e}"})
+        return results
+
+    def get_readiness(self):
+        """
+        Batata hai ki Manager kaam le sakta hai ya nahi (preload mode mein Strategist tools warm hone ke baad).
+        """
+        return self.strategist_agent.get_readiness()
+
+    def get_workflow_status(self, campaign_id):
+        """
+        Ek campaign ke workflow ka current status return karta hai.
+        Returns:
+            dict | None: Status ki copy, ya None agar campaign nahi mila.
+        """
+        return self.state_store.get_status(campaign_id)
+
+    def list_campaigns(self, limit=50, cursor=None, status=None):
+        """
+        Campaigns ko naye se purane order mein page-by-page return karta hai.
+        Returns:
+            tuple: (campaigns list, next_cursor ya None)
+        """
+        return self.state_store.list_campaigns(limit=limit, cursor=cursor, status=status)
+
+    def _update_status(self, campaign_id, **fields):
+        self.state_store.update_status(campaign_id, **fields)
+
+    def _build_strategist_handoff(self, campaign_details, action_plan):
+        """
+        Campaign details aur Strategist ke action plan se strategist output schema wala handoff object banata hai.
+        """
+        handoff = {
+            "campaign_id": campaign_details.get("campaign_id", "default_id"),
+            "campaign_name": campaign_details.get("campaign_name", "Unnamed Campaign"),
+            "video_length": campaign_details.get("required_length_sec"),
+            "target_product": action_plan.get("product") or campaign_details.get("target_product"),
+            "target_audience": action_plan.get("audience") or campaign_details.get("target_audience"),
+            "social_media_platforms": campaign_details.get("social_media_platforms", []),
+            "action_plan": action_plan
+        }
+        return handoff
+
+    def _release_campaign_media(self, campaign_id):
+        """
+        Campaign ke raw video references chhodta hai; objects agle campaigns ke liye store mein rehte hain jab tak quota ke liye evict na hon.
+        """
+        try:
+            self.media_store.release(campaign_id)
+        except (OSError, sqlite3.Error) as e:
+            self.logger.error(f"[{campaign_id}] Failed to release campaign media: {e}")
+
+    def sweep_campaign_media(self, cutoff: float = None) -> list:
+        """
+        Jin khatam hue campaigns ke raw video links media_store.retention_hours se purane hain, unke references chhodta
+        hai; isse woh objects quota ke liye evict ho sakte hain. Queued/running campaigns (kisi bhi process mein) chhode
+        nahi jaate.
+
+        Args:
+            cutoff (float): Is time.time() se purane references; default retention_hours pehle.
+        Returns:
+            list: Jin campaigns ke references chhode gaye.
+        """
+        if cutoff is None:
+            if not self.media_store.retention_sec:
+                return []
+            cutoff = time.time() - self.media_store.retention_sec
+        with self._deadlines_lock:
+            local = set(self._deadlines)
+        released = []
+        for campaign_id in self.media_store.campaigns_linked_before(cutoff):
+            if campaign_id in local:
+                continue
+            workflow_status = self.state_store.get_status(campaign_id)
+            if workflow_status is not None and workflow_status.get("status") not in TERMINAL_STATUSES:
+                continue
+            self._release_campaign_media(campaign_id)
+            released.append(campaign_id)
+        if released:
+            self.logger.info(f"Released media of {len(released)} finished campaigns past the retention window.")
+        return released
+
+    def prune_uploads(self) -> int:
+        """
+        Purane screenshot uploads hatata hai, un uploads ko chhodkar jo kisi queued/running campaign ka input hain.
+        Returns:
+            int: Kitni files hatayi gayi.
+        """
+        keep = set()
+        for campaign_id in self.state_store.list_unfinished():
+            campaign_details = self.state_store.get_campaign(campaign_id) or {}
+            if campaign_details.get("input_type") == "screenshot_file":
+                keep.add(campaign_details.get("input_data"))
+        try:
+            return self.upload_store.prune(keep)
+        except OSError as e:
+            self.logger.error(f"Failed to prune uploads: {e}")
+            return 0
+
+    @contextmanager
+    def _track_stage(self, stage, campaign_details):
+        """
+        Workflow stage ka latency aur outcome metrics mein record karne wala context manager; block ke log records par
+        stage bhi lagta hai.
+        """
+        input_type = campaign_details.get("input_type", "unknown")
+        with stage_context(stage), metrics.track(metrics.workflow_stage_seconds, metrics.workflow_stage_total, stage=stage,
+                                                 input_type=input_type,
+                                                 size_bucket=metrics.input_size_bucket(input_type, campaign_details.get("input_data"))) as labels:
+            yield labels
+
+    def _check_handoff(self, campaign_id, schema_name, data):
+        """
+        Stage handoff ko compiled schema se validate karta hai; invalid hone par workflow rok deta hai.
+        """
+        validation_error = self.validators.validate_handoff(schema_name, data)
+        if validation_error:
+            raise ValueError(f"Invalid {schema_name} handoff: {validation_error}")
+        self.logger.debug(f"[{campaign_id}] Handoff '{schema_name}' validated.")
+
+    def _build_pipeline(self, stages_config):
+        """
+        Workflow ke stages ko unki concurrency aur queue size config ke saath register karta hai.
+        """
+        pipeline = Pipeline(name="CampaignPipeline")
+        for name, handler in (("strategist", self._run_strategist_stage), ("researcher", self._run_researcher_stage)):
+            stage_config = stages_config.get(name, {})
+            pipeline.register_stage(name, handler, concurrency=stage_config.get("concurrency", 1), queue_size=stage_config.get("queue_size", 8))
+        return pipeline
+
+    def _run_strategist_stage(self, campaign_details, context):
+        """
+        Pipeline stage: campaign details se Strategist ka validated handoff banata hai.
+        Details aur input content (file ya fetch kiye URL text ka hash) same hon to pichle run ka checkpoint use hota hai.
+        """
+        campaign_id = context["campaign_id"]
+        deadline = context["deadline"]
+        prefetched_text = context.get("prefetched_text")
+        with self._track_stage("strategist", campaign_details):
+            deadline.check()
+            self._update_status(campaign_id, stage="strategist", message="Strategist Agent is analyzing the campaign.")
+            self._check_handoff(campaign_id, "strategist_input", campaign_details)
+            if context.get("prefetch_error"):
+                raise Exception(f"Strategist Agent failed: Strategist failed to process input: {context['prefetch_error']}")
+
+            # URL ka content fetch kiye bina pata nahi chalta; conditional GET (unchanged content HTTP store se) pehle hi
+            # chalta hai aur wahi text Strategist ko milta hai, isliye alag HEAD request nahi lagti
+            if prefetched_text is None and campaign_details.get("input_type") in URL_INPUT_TYPES:
+                fetch_result = self.strategist_agent.fetch_url_text(campaign_details, deadline)
+                if fetch_result["status"] == "error":
+                    raise Exception(f"Strategist Agent failed: Strategist failed to process input: {fetch_result['message']}")
+                prefetched_text = fetch_result["extracted_text"]
+
+            # Input content ki pehchaan checkpoint ki apni hai (extraction cache band ho tab bhi). None ka matlab content
+            # pehchana nahi ja sakta (jaise gayab file); tab checkpoint na padha jaata hai na likha
+            if prefetched_text is not None:
+                content_id = hashlib.sha256(prefetched_text.encode("utf-8")).hexdigest()
+            else:
+                content_id = self._input_content_id(campaign_details)
+            input_fingerprint = fingerprint(campaign_details, content_id)
+            strategist_handoff = None
+            if content_id is not None:
+                strategist_handoff = self._load_checkpoint(campaign_id, "strategist", input_fingerprint, "strategist_output")
+
+            if strategist_handoff is None:
+                self.logger.info(f"[{campaign_id}] Calling Strategist Agent with campaign details...")
+                strategist_output = self.strategist_agent.run(campaign_details, extracted_text=prefetched_text, deadline=deadline)
+
+                if strategist_output["status"] == "error":
+                    raise Exception(f"Strategist Agent failed: {strategist_output.get('message', 'Unknown error')}")
+
+                self.logger.info("[%s] Strategist Agent finished. Action Plan created: %s", campaign_id, strategist_output.get('action_plan', 'No plan found'))
+                strategist_handoff = self._build_strategist_handoff(campaign_details, strategist_output["action_plan"])
+                self._check_handoff(campaign_id, "strategist_output", strategist_handoff)
+                if content_id is not None:
+                    self._save_checkpoint(campaign_id, "strategist", input_fingerprint, strategist_handoff)
+        yield strategist_handoff
+
+    def _input_content_id(self, campaign_details):
+        """
+        File inputs ke content ka hash (screenshot uploads ka upload id file path mein badal kar).
+        Returns:
+            str | None: Content hash; inline screenshot/text ke liye "inline" (data details mein hi hai, jo fingerprint
+                mein jaati hain); None agar file nahi mili ya padhi nahi ja saki.
+        """
+        input_type = campaign_details.get("input_type")
+        if input_type not in FILE_INPUT_TYPES:
+            return "inline"
+        path = campaign_details.get("input_data")
+        if input_type == "screenshot_file":
+            path = resolve_upload_path(self.config, path)
+        if not path or not os.path.isfile(path):
+            return None
+        try:
+            return file_digest(path)
+        except OSError as e:
+            self.logger.warning(f"[{campaign_details.get('campaign_id')}] Could not hash input file for the checkpoint: {e}")
+            return None
+
+    def _run_researcher_stage(self, strategist_handoff, context):
+        """
+        Pipeline stage: action plan ke hisaab se videos download karta hai aur har video download hote hi alag item ke
+        roop mein yield karta hai, taaki agla stage pehla video milte hi kaam shuru kar sake.
+        """
+        campaign_id = context["campaign_id"]
+        deadline = context["deadline"]
+        with self._track_stage("researcher", context["campaign_details"]):
+            deadline.check()
+            self._update_status(campaign_id, stage="researcher", message="Researcher Agent is finding videos.")
+            researcher_input = {
+                "research_keywords": strategist_handoff["action_plan"]["research_keywords"],
+                "download_count": strategist_handoff["action_plan"]["download_count"]
+            }
+            self._check_handoff(campaign_id, "researcher_input", researcher_input)
+            context["research_keywords"] = researcher_input["research_keywords"]
+
+            # Same action plan ke videos pehle aa chuke hon (aur files ya media store mein hon) to search/downloads skip
+            input_fingerprint = fingerprint(researcher_input)
+            videos = self._load_checkpoint(campaign_id, "researcher", input_fingerprint, "researcher_output")
+            if videos is not None and self.researcher_agent.restore_videos(videos, campaign_id):
+                yield from videos
+                return
+
+            self.logger.info(f"[{campaign_id}] Calling Researcher Agent with action plan...")
+            videos = []
+            try:
+                for video in self.researcher_agent.iter_videos(researcher_input, campaign_id, deadline):
+                    self._check_handoff(campaign_id, "researcher_output", [video])
+                    videos.append(video)
+                    yield video
+            except RuntimeError as e:
+                raise Exception(f"Researcher Agent failed: {e}")
+
+            self.logger.info(f"[{campaign_id}] Researcher Agent finished. {len(videos)} videos downloaded.")
+            self._save_checkpoint(campaign_id, "researcher", input_fingerprint, videos)
+
+    def _run_marketer_step(self, videos, context):
+        """
+        Campaign ke saare videos aane ke baad: unka metadata tag index mein jodta hai aur research keywords ke liye
+        hashtags/title phrases suggest karta hai. Index ki galti workflow ko fail nahi karti, sirf suggestions chhoot jaate hain.
+        Returns:
+            dict | None: {"hashtags": [...], "title_phrases": [...]}
+        """
+        campaign_id = context["campaign_id"]
+        keywords = context.get("research_keywords", [])
+        with self._track_stage("marketer", context["campaign_details"]):
+            context["deadline"].check()
+            self._update_status(campaign_id, stage="marketer", message="Marketer Agent is ranking hashtags.")
+            # Downloads kisi bhi order mein poore hote hain, isliye videos ki pehchaan sorted source URLs se
+            input_fingerprint = fingerprint(keywords, sorted((video.get("metadata") or {}).get("source_url") or video.get("video_path") for video in videos))
+            marketing = self._load_checkpoint(campaign_id, "marketer", input_fingerprint, None)
+            if marketing is not None:
+                return marketing
+            try:
+                self.marketer_agent.record_campaign(campaign_id, videos)
+                suggestions = self.marketer_agent.suggest(keywords, campaign_id)
+            except sqlite3.Error as e:
+                self.logger.error(f"[{campaign_id}] Marketer Agent failed to update the tag index: {e}")
+                return None
+            marketing = {
+                "hashtags": [item["tag"] for item in suggestions["hashtags"]],
+                "title_phrases": [item["phrase"] for item in suggestions["title_phrases"]]
+            }
+            self._save_checkpoint(campaign_id, "marketer", input_fingerprint, marketing)
+        return marketing
+
+    def start_campaign_workflow(self, campaign_details, prefetched_text=None, prefetch_error=None):
         """
         Ek naye campaign workflow ko shuru karta hai.
-        Yeh method Strategist agent ko campaign details pass karega
-        aur fir poore pipeline ko manage karega.
+        Campaign details pipeline ke pehle stage (Strategist) mein jaati hain aur har stage ke outputs
+        streaming tarike se agle stage tak pahunchte hain.
 
         Args:
             campaign_details (dict): Campaign ki saari jaankari.
+            prefetched_text (str): Pehle se fetch kiya gaya input text (ASGI mode), Strategist extraction skip karta hai.
+            prefetch_error (str): ASGI mode mein input fetch ki galti; campaign isi error ke saath fail hota hai (dobara fetch nahi).
         Returns:
             dict: Campaign processing status aur results ka summary.
         """
         campaign_id = campaign_details.get("campaign_id", "default_id")
         campaign_name = campaign_details.get("campaign_name", "Unnamed Campaign")
         
-        self.logger.info(f"[{campaign_id}] Starting workflow for campaign: {campaign_name}")
-        
-        try:
-            # Step 1: Strategist Agent ko call karein
-            self.logger.info(f"[{campaign_id}] Calling Strategist Agent with campaign details...")
-            strategist_output = self.strategist_agent.run(campaign_details)
-            
-            if strategist_output["status"] == "error":
-                raise Exception(f"Strategist Agent failed: {strategist_output.get('message', 'Unknown error')}")
-            
-            self.logger.info(f"[{campaign_id}] Strategist Agent finished. Action Plan created: {strategist_output.get('action_plan', 'No plan found')}")
+        # Submit par bana Deadline (queue wait samet); seedha call hone par yahin banta hai
+        deadline = self.get_deadline(campaign_id) or self.open_deadline(campaign_id)
 
-            # Step 2: Researcher Agent ko call karein (Placeholder)
-            self.logger.info(f"[{campaign_id}] Calling Researcher Agent with action plan...")
-            # researcher_output = self.researcher_agent.run(strategist_output["action_plan"]) # Future mein aise call hoga
-            researcher_output = {"status": "success", "videos": "placeholder"} # Abhi ke liye placeholder
+        # Is campaign ke saare log records (pipeline threads samet) par campaign_id lagta hai
+        with campaign_context(campaign_id):
+            try:
+                # Queue mein rehte hue cancel/expire hua campaign chalna shuru hi nahi karta
+                deadline.check()
+                self.logger.info(f"[{campaign_id}] Starting workflow for campaign: {campaign_name}")
+                self._update_status(campaign_id, status="running", stage="strategist", message="Strategist Agent is analyzing the campaign.", started_at=time.time())
 
-            if researcher_output["status"] == "error":
-                raise Exception(f"Researcher Agent failed: {researcher_output.get('message', 'Unknown error')}")
+                context = {"campaign_id": campaign_id, "campaign_details": campaign_details, "prefetched_text": prefetched_text,
+                           "prefetch_error": prefetch_error, "deadline": deadline}
+                outputs = self.pipeline.run([campaign_details], context)
+            
+                marketing = self._run_marketer_step(outputs, context)
 
-            self.logger.info(f"[{campaign_id}] Researcher Agent finished. Videos found.")
+                self.logger.info(f"[{campaign_id}] Campaign workflow completed successfully ({len(outputs)} items from the last stage).")
+                result = {"status": "success", "message": "Campaign workflow initiated successfully.", "campaign_id": campaign_id}
+                if marketing:
+                    result["marketing"] = marketing
+                self._update_status(campaign_id, status="completed", stage=None, message="Campaign workflow completed successfully.", result=result, finished_at=time.time())
+                return result
 
-            # Is tarah se aage ke agents ko call kiya jayega.
+            except CampaignAbortedError as e:
+                status = "cancelled" if isinstance(e, CampaignCancelledError) else "timed_out"
+                self.logger.warning(f"[{campaign_id}] Campaign workflow stopped ({status}): {e}")
+                metrics.campaigns_aborted_total.inc(reason=status)
+                result = {"status": "error", "message": str(e), "campaign_id": campaign_id}
+                self._update_status(campaign_id, status=status, stage=None, message=result["message"], result=result, finished_at=time.time())
+                return result
             
-            self.logger.info(f"[{campaign_id}] Campaign workflow completed successfully.")
-            return {"status": "success", "message": "Campaign workflow initiated successfully.", "campaign_id": campaign_id}
-            
-        except Exception as e:
-            self.logger.error(f"[{campaign_id}] Critical error in campaign workflow: {e}", exc_info=True)
-            return {"status": "error", "message": f"Campaign workflow failed: {e}"}
\ No newline at end of file
+            except Exception as e:
+                self.logger.error(f"[{campaign_id}] Critical error in campaign workflow: {e}", exc_info=True)
+                result = {"status": "error", "message": f"Campaign workflow failed: {e}", "campaign_id": campaign_id}
+                self._update_status(campaign_id, status="failed", message=result["message"], result=result, finished_at=time.time())
+                return result
+
+            finally:
+                self.close_deadline(campaign_id)
+                if self.media_store.release_on_finish:
+                    self._release_campaign_media(campaign_id)
@@ -0,0 +1,260 @@
+import hashlib
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    digest TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_objects_last_used ON objects (last_used);
+CREATE TABLE IF NOT EXISTS refs (
+    digest TEXT NOT NULL,
+    campaign_id TEXT NOT NULL,
+    path TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (campaign_id, path)
+);
+CREATE INDEX IF NOT EXISTS idx_refs_digest ON refs (digest);
+CREATE TABLE IF NOT EXISTS sources (
+    source_url TEXT PRIMARY KEY,
+    digest TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sources_digest ON sources (digest);
+"""
+
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def file_digest(file_path: str) -> str:
+    """
+    File ka sha256 (hex), blocks mein padhkar.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class MediaStore:
+    """
+    Yeh class data_dir ki media files ka content-addressed store hai. Har file ek baar apne sha256 ke naam se
+    (media/store/objects/ab/<digest>) rakhi jaati hai; campaigns ko uske hardlinks milte hain aur har link ek reference hai.
+    Ek SQLite index objects ka size, last use, references aur source URL -> digest rakhta hai, isliye lookups aur eviction
+    directory tree walk kiye bina hote hain. Quota se upar jaane par sabse purane use hue bina-reference objects hata diye jaate hain.
+    Store kai worker processes ke beech shared hai, isliye check -> link aur evict dono index ke SQLite write lock
+    (BEGIN IMMEDIATE) ke andar hote hain; ek process ka evict doosre process ke link ke beech se object nahi hata sakta.
+    """
+    def __init__(self, config):
+        """
+        MediaStore ko initialize karta hai aur index banata hai.
+        Args:
+            config (dict): Application ki configuration settings.
+        """
+        self.config = config
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        store_config = config.get("media_store", {})
+        data_dir = config.get("paths", {}).get("data_dir", "backend/data")
+        self.enabled = store_config.get("enabled", True)
+        self.quota_bytes = int(float(store_config.get("quota_gb", 50)) * 1024 ** 3)
+        # True par workflow khatam hote hi (kisi bhi status par) campaign ke raw video links hat jaate hain; result ke
+        # video paths phir nahi milte, aur resubmit/resume tabhi link dobara bana pata hai jab object evict na hua ho
+        self.release_on_finish = store_config.get("release_on_finish", False)
+        # Khatam hue campaigns ke references itne ghante baad chhode jaate hain (Manager ka sweep); tab tak result ke
+        # video paths maujood rehte hain. 0 ka matlab kabhi nahi (tab quota sirf release_on_finish se lagta hai)
+        self.retention_sec = float(store_config.get("retention_hours", 24)) * 3600
+        self.objects_dir = store_config.get("path") or os.path.join(data_dir, "media", "store", "objects")
+        self.db_path = store_config.get("index_path") or os.path.join(data_dir, "state", "media_store.db")
+
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+        self.logger.info(f"MediaStore opened at {self.objects_dir} (quota: {self.quota_bytes} bytes).")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _write_lock(self):
+        # Thread lock is process ke threads ko line mein rakhta hai; BEGIN IMMEDIATE baaki processes ko
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+
+    def object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], digest)
+
+    def lookup_source(self, source_url: str):
+        """
+        Source URL pehle store ho chuka hai to uska digest (file maujood ho tabhi), warna None.
+        """
+        row = self._connect().execute("SELECT digest FROM sources WHERE source_url = ?", (source_url,)).fetchone()
+        if row is None or not os.path.isfile(self.object_path(row[0])):
+            return None
+        return row[0]
+
+    def add_file(self, file_path: str, campaign_id: str, dest_path: str, source_url: str = None) -> dict:
+        """
+        File ko store mein le jaata hai (same content pehle se ho to naya copy hata diya jaata hai) aur campaign ke liye
+        dest_path par hardlink banata hai. Iske baad quota enforce hota hai.
+
+        Args:
+            file_path (str): Nayi file (jaise poora hua download); yeh store mein move ho jaati hai.
+            campaign_id (str): Reference rakhne wala campaign.
+            dest_path (str): Campaign ki file ka path (hardlink).
+            source_url (str): Agar file kisi URL se aayi hai to agli baar download skip karne ke liye.
+        Returns:
+            dict: {"digest": "...", "path": dest_path, "size_bytes": int, "deduplicated": bool}
+        """
+        digest = file_digest(file_path)
+        size = os.path.getsize(file_path)
+        object_path = self.object_path(digest)
+        now = time.time()
+        with self._write_lock() as conn:
+            deduplicated = os.path.isfile(object_path)
+            if deduplicated:
+                os.remove(file_path)
+            else:
+                os.makedirs(os.path.dirname(object_path), exist_ok=True)
+                os.replace(file_path, object_path)
+            conn.execute("INSERT INTO objects (digest, size, created_at, last_used) VALUES (?, ?, ?, ?) "
+                         "ON CONFLICT (digest) DO UPDATE SET last_used = excluded.last_used", (digest, size, now, now))
+            if source_url:
+                conn.execute("INSERT OR REPLACE INTO sources (source_url, digest) VALUES (?, ?)", (source_url, digest))
+            self._link(conn, digest, campaign_id, dest_path)
+        self.enforce_quota()
+        return {"digest": digest, "path": dest_path, "size_bytes": size, "deduplicated": deduplicated}
+
+    def link(self, digest: str, campaign_id: str, dest_path: str) -> str:
+        """
+        Stored object ka campaign ke liye hardlink (reference) banata hai.
+        Returns:
+            str: dest_path
+        Raises:
+            FileNotFoundError: Agar object store mein nahi hai (jaise evict ho chuka).
+        """
+        with self._write_lock() as conn:
+            self._link(conn, digest, campaign_id, dest_path)
+        return dest_path
+
+    def _link(self, conn, digest, campaign_id, dest_path):
+        object_path = self.object_path(digest)
+        if not os.path.isfile(object_path):
+            raise FileNotFoundError(f"Media object {digest} is not in the store.")
+        os.makedirs(os.path.dirname(os.path.abspath(dest_path)), exist_ok=True)
+        temp_path = f"{dest_path}.{uuid.uuid4().hex}.tmp"
+        try:
+            os.link(object_path, temp_path)
+        except OSError:
+            # Hardlinks support nahi (jaise alag filesystem); copy hi sahi
+            shutil.copyfile(object_path, temp_path)
+        os.replace(temp_path, dest_path)
+        conn.execute("INSERT OR REPLACE INTO refs (digest, campaign_id, path, created_at) VALUES (?, ?, ?, ?)",
+                     (digest, campaign_id, dest_path, time.time()))
+        conn.execute("UPDATE objects SET last_used = ? WHERE digest = ?", (time.time(), digest))
+
+    def release(self, campaign_id: str, remove_files: bool = True) -> int:
+        """
+        Campaign ke saare references chhodta hai (aur unke hardlinks hata deta hai). Objects store mein rehte hain
+        jab tak quota ke liye evict na hon, taaki agle campaigns unhe dobara use kar saken.
+        Returns:
+            int: Kitne references chhode gaye.
+        """
+        with self._write_lock() as conn:
+            rows = conn.execute("SELECT path FROM refs WHERE campaign_id = ?", (campaign_id,)).fetchall()
+            conn.execute("DELETE FROM refs WHERE campaign_id = ?", (campaign_id,))
+        if remove_files:
+            for (path,) in rows:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            # Campaign ki khaali directories bhi hata dein
+            for directory in {os.path.dirname(path) for (path,) in rows}:
+                try:
+                    os.rmdir(directory)
+                except OSError:
+                    pass
+        if rows:
+            self.logger.info(f"[{campaign_id}] Released {len(rows)} media references.")
+            self.enforce_quota()
+        return len(rows)
+
+    def campaigns_linked_before(self, cutoff: float) -> list:
+        """
+        Woh campaigns jinka sabse naya reference bhi cutoff (time.time()) se purana hai.
+        Returns:
+            list: Campaign ids (purane pehle).
+        """
+        rows = self._connect().execute(
+            "SELECT campaign_id FROM refs GROUP BY campaign_id HAVING MAX(created_at) < ? ORDER BY MAX(created_at)", (cutoff,)
+        ).fetchall()
+        return [campaign_id for (campaign_id,) in rows]
+
+    def enforce_quota(self) -> int:
+        """
+        Kul size quota se upar ho to sabse purane use hue bina-reference objects hatata hai.
+        Returns:
+            int: Free kiye gaye bytes.
+        """
+        freed = 0
+        # Refs check aur file delete ek hi write lock mein, taaki doosra process beech mein naya link na bana sake
+        with self._write_lock() as conn:
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM objects").fetchone()[0]
+            if total <= self.quota_bytes:
+                return 0
+            candidates = conn.execute(
+                "SELECT digest, size FROM objects WHERE NOT EXISTS (SELECT 1 FROM refs WHERE refs.digest = objects.digest) "
+                "ORDER BY last_used"
+            )
+            evicted = []
+            for digest, size in candidates:
+                if total - freed <= self.quota_bytes:
+                    break
+                evicted.append(digest)
+                freed += size
+            candidates.close()
+            for digest in evicted:
+                conn.execute("DELETE FROM objects WHERE digest = ?", (digest,))
+                conn.execute("DELETE FROM sources WHERE digest = ?", (digest,))
+            for digest in evicted:
+                try:
+                    os.remove(self.object_path(digest))
+                except OSError:
+                    pass
+        if evicted:
+            self.logger.info(f"Evicted {len(evicted)} unreferenced media objects ({freed} bytes) to stay under quota.")
+        if total - freed > self.quota_bytes:
+            self.logger.warning(f"Media store is over quota ({total - freed} bytes) but all remaining objects are referenced.")
+        return freed
+
+    def get_stats(self) -> dict:
+        conn = self._connect()
+        objects, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM objects").fetchone()
+        referenced = conn.execute("SELECT COUNT(DISTINCT digest) FROM refs").fetchone()[0]
+        return {"objects": objects, "size_bytes": total, "referenced_objects": referenced, "quota_bytes": self.quota_bytes}
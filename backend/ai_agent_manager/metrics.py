@@ -0,0 +1,191 @@
+import bisect
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+# Input size buckets (bytes) jo labels mein jaate hain: (upper limit, label)
+SIZE_BUCKETS = ((64 * 1024, "lt_64kb"), (1024 * 1024, "64kb_1mb"), (10 * 1024 * 1024, "1mb_10mb"))
+
+
+def size_bucket(num_bytes) -> str:
+    """
+    Input size ko ek chhote, fixed label mein badalta hai taaki metrics ki cardinality kam rahe.
+    """
+    if num_bytes is None:
+        return "unknown"
+    for limit, label in SIZE_BUCKETS:
+        if num_bytes < limit:
+            return label
+    return "gte_10mb"
+
+
+def input_size_bucket(input_type: str, input_data) -> str:
+    """
+    Campaign input ka size bucket: screenshot ke liye decoded bytes, files ke liye file size.
+    URLs ka size pehle se pata nahi hota, isliye "unknown".
+    """
+    if not isinstance(input_data, str):
+        return "unknown"
+    if input_type == "screenshot":
+        return size_bucket(len(input_data) * 3 // 4)
+    try:
+        return size_bucket(os.path.getsize(input_data)) if os.path.isfile(input_data) else "unknown"
+    except (OSError, ValueError):
+        return "unknown"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labelnames, labelvalues, extra=None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, labelvalues)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    """
+    Sirf badhne wala counter, labels ke saath.
+    """
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {value}")
+        return lines
+
+
+class Histogram:
+    """
+    Latency histogram (cumulative buckets, sum aur count), labels ke saath.
+    """
+    def __init__(self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = DEFAULT_LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values = {} # labels -> [bucket counts..., +Inf count, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            state[index] += 1
+            state[-1] += value
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((key, list(state)) for key, state in self._values.items())
+        for key, state in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, state):
+                cumulative += count
+                bucket_labels = _format_labels(self.labelnames, key, f'le="{bound}"')
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            cumulative += state[len(self.buckets)]
+            bucket_labels = _format_labels(self.labelnames, key, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {state[-1]}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Yeh class application ke saare metrics rakhti hai aur unhe Prometheus text format mein render karti hai.
+    """
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: tuple = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def _get_or_create(self, metric_class, name, documentation, labelnames, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = metric_class(name, documentation, labelnames, **kwargs)
+            elif not isinstance(metric, metric_class):
+                raise ValueError(f"Metric '{name}' is already registered with a different type.")
+            return metric
+
+    def render(self) -> str:
+        """
+        Saare metrics ko Prometheus text exposition format (version 0.0.4) mein return karta hai.
+        """
+        with self._lock:
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Application ka default registry aur uske metrics
+registry = MetricsRegistry()
+
+STAGE_LABELS = ("stage", "input_type", "outcome", "size_bucket")
+TOOL_LABELS = ("tool", "input_type", "outcome", "size_bucket")
+
+workflow_stage_seconds = registry.histogram(
+    "campaign_workflow_stage_duration_seconds", "Duration of each Manager workflow stage.", STAGE_LABELS)
+workflow_stage_total = registry.counter(
+    "campaign_workflow_stage_total", "Number of Manager workflow stage runs.", STAGE_LABELS)
+strategist_tool_seconds = registry.histogram(
+    "strategist_tool_duration_seconds", "Duration of each Strategist tool call.", TOOL_LABELS)
+strategist_tool_total = registry.counter(
+    "strategist_tool_total", "Number of Strategist tool calls.", TOOL_LABELS)
+campaigns_aborted_total = registry.counter(
+    "campaigns_aborted_total", "Campaigns stopped before finishing, by reason (cancelled or timed_out).", ("reason",))
+stage_checkpoints_total = registry.counter(
+    "campaign_stage_checkpoints_total", "Workflow stage checkpoints saved or reused instead of re-running the stage.", ("stage", "outcome"))
+
+
+@contextmanager
+def track(histogram: Histogram, counter: Counter, **labels):
+    """
+    Block ka samay naapkar histogram aur counter update karta hai.
+    Block ke andar labels["outcome"] set kiya ja sakta hai; exception par outcome "error" hota hai.
+
+    Example:
+        with track(strategist_tool_seconds, strategist_tool_total, tool="ocr", input_type="screenshot") as labels:
+            result = ocr()
+            labels["outcome"] = result["status"]
+    """
+    labels.setdefault("outcome", "success")
+    start = time.perf_counter()
+    try:
+        yield labels
+    except BaseException:
+        labels["outcome"] = "error"
+        raise
+    finally:
+        histogram.observe(time.perf_counter() - start, **labels)
+        counter.inc(**labels)
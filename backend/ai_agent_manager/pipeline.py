@@ -0,0 +1,192 @@
+import contextvars
+import logging
+import queue
+import threading
+
+
+class PipelineStage:
+    """
+    Pipeline ka ek stage (ek agent). Handler har input item ke liye zero ya zyada output items
+    yield karta hai; har output turant agle stage ko chala jaata hai.
+    Stage ke concurrency jitne worker threads saare campaigns ke beech shared hote hain, isliye limit bhi shared hai.
+    """
+    def __init__(self, name: str, handler, concurrency: int = 1, queue_size: int = 8):
+        """
+        Args:
+            name (str): Stage ka naam (jaise "strategist", "researcher").
+            handler (callable): handler(item, context) -> iterable of output items (generator bhi ho sakta hai).
+            concurrency (int): Is stage ke kitne items ek saath process ho sakte hain (worker threads).
+            queue_size (int): Stage ki input queue ka maximum size (backpressure).
+        """
+        self.name = name
+        self.handler = handler
+        self.concurrency = max(1, int(concurrency))
+        self.queue_size = max(1, int(queue_size))
+        self.queue = queue.Queue(maxsize=self.queue_size)
+        self.workers = []
+
+
+class _PipelineRun:
+    """
+    Ek Pipeline.run() call ki state: context, results, error aur kitne items abhi kisi stage mein baaki hain.
+    """
+    def __init__(self, context):
+        self.context = context
+        # Caller ke contextvars (jaise logging ka campaign_id); har task ko iski apni copy milti hai
+        self.contextvars = contextvars.copy_context()
+        self.stop = threading.Event()
+        self.errors = []
+        self.results = []
+        self._pending = 0
+        self._cond = threading.Condition()
+
+    def add_task(self):
+        with self._cond:
+            self._pending += 1
+
+    def task_done(self):
+        with self._cond:
+            self._pending -= 1
+            if self._pending == 0:
+                self._cond.notify_all()
+
+    def add_result(self, output):
+        with self._cond:
+            self.results.append(output)
+
+    def fail(self, error):
+        with self._cond:
+            self.errors.append(error)
+        self.stop.set()
+
+    def wait(self):
+        with self._cond:
+            while self._pending:
+                self._cond.wait()
+
+
+class Pipeline:
+    """
+    Yeh class registered stages ko streaming tarike se chalati hai.
+    Har stage ke paas persistent worker threads aur bounded input queue hoti hai, isliye agla stage
+    pehla item milte hi kaam shuru kar deta hai jab ki pichla stage baaki items bana raha hota hai.
+    Workers pehle run par shuru hote hain aur saare runs ke beech reuse hote hain; queues par blocking get hota hai
+    (koi polling nahi), aur close() har worker tak sentinel pahunchata hai.
+    """
+    _SENTINEL = object()
+
+    def __init__(self, name: str = "Pipeline"):
+        self.name = name
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.stages = []
+        self._started = False
+        self._start_lock = threading.Lock()
+
+    def register_stage(self, name: str, handler, concurrency: int = 1, queue_size: int = 8) -> PipelineStage:
+        """
+        Pipeline ke end mein ek naya stage jodta hai.
+        Raises:
+            ValueError: Agar same naam ka stage pehle se registered hai.
+            RuntimeError: Agar pipeline ke workers shuru ho chuke hain.
+        """
+        if self._started:
+            raise RuntimeError(f"Pipeline '{self.name}' is already running; register stages before the first run.")
+        if any(stage.name == name for stage in self.stages):
+            raise ValueError(f"Pipeline stage '{name}' is already registered.")
+        stage = PipelineStage(name, handler, concurrency, queue_size)
+        self.stages.append(stage)
+        self.logger.info(f"[{self.name}] Registered stage '{name}' (concurrency: {stage.concurrency}, queue size: {stage.queue_size}).")
+        return stage
+
+    def run(self, items, context=None) -> list:
+        """
+        Input items ko saare stages se guzaarta hai aur aakhri stage ke outputs return karta hai.
+        Kisi bhi stage mein exception aane par is run ke baaki items chhod diye jaate hain aur wahi exception raise hota hai.
+
+        Args:
+            items (iterable): Pehle stage ke input items.
+            context (dict): Har handler ko milne wala shared context (jaise campaign_id).
+        Returns:
+            list: Aakhri stage ke output items, jis order mein woh bane.
+        """
+        if not self.stages:
+            return list(items)
+        self._start_workers()
+
+        run = _PipelineRun(context)
+        try:
+            for item in items:
+                if run.stop.is_set():
+                    break
+                # Bhari queue par block hota hai (backpressure)
+                run.add_task()
+                self.stages[0].queue.put((run, item))
+        except BaseException:
+            run.stop.set()
+            raise
+
+        run.wait()
+        if run.errors:
+            raise run.errors[0]
+        return run.results
+
+    def close(self):
+        """
+        Har stage ke workers ko sentinel bhej kar band karta hai (pehle se queue mein pade items poore hone ke baad).
+        """
+        with self._start_lock:
+            if not self._started:
+                return
+            for stage in self.stages:
+                for _ in stage.workers:
+                    stage.queue.put(self._SENTINEL)
+            for stage in self.stages:
+                for thread in stage.workers:
+                    thread.join()
+                stage.workers = []
+            self._started = False
+
+    def _start_workers(self):
+        with self._start_lock:
+            if self._started:
+                return
+            for index, stage in enumerate(self.stages):
+                for worker_index in range(stage.concurrency):
+                    thread = threading.Thread(target=self._worker, args=(index,), name=f"{self.name}-{stage.name}-{worker_index}", daemon=True)
+                    thread.start()
+                    stage.workers.append(thread)
+            self._started = True
+
+    def _worker(self, index):
+        stage = self.stages[index]
+        while True:
+            task = stage.queue.get()
+            if task is self._SENTINEL:
+                return
+            run, item = task
+            try:
+                # Fail/stop ho chuke run ke bache items bina chalaye nikal jaate hain
+                if not run.stop.is_set():
+                    run.contextvars.copy().run(self._process, index, run, item)
+            except Exception as e:
+                self.logger.error(f"[{self.name}] Stage '{stage.name}' failed: {e}")
+                run.fail(e)
+            finally:
+                run.task_done()
+
+    def _process(self, index, run, item):
+        outputs = iter(self.stages[index].handler(item, run.context) or ())
+        try:
+            for output in outputs:
+                if run.stop.is_set():
+                    return
+                if index + 1 < len(self.stages):
+                    # Task pehle gina jaata hai taaki run ka pending count beech mein zero na ho
+                    run.add_task()
+                    self.stages[index + 1].queue.put((run, output))
+                else:
+                    run.add_result(output)
+        finally:
+            close = getattr(outputs, "close", None)
+            if close is not None:
+                close()
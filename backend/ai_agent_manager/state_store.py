@@ -0,0 +1,317 @@
+import base64
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+# Status ke woh fields jo alag columns mein store hote hain
+STATUS_FIELDS = ("status", "stage", "message", "result", "submitted_at", "started_at", "finished_at")
+TERMINAL_STATUSES = ("completed", "failed", "cancelled", "timed_out")
+# Adhure campaigns ke status (process marne par inhe resume kiya jaata hai)
+ACTIVE_STATUSES = ("queued", "running")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS campaigns (
+    campaign_id TEXT PRIMARY KEY,
+    campaign_name TEXT,
+    details TEXT,
+    status TEXT NOT NULL,
+    stage TEXT,
+    message TEXT,
+    result TEXT,
+    submitted_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_campaigns_submitted ON campaigns (submitted_at DESC, campaign_id DESC);
+CREATE INDEX IF NOT EXISTS idx_campaigns_status_submitted ON campaigns (status, submitted_at DESC, campaign_id DESC);
+"""
+
+
+class InvalidCursorError(ValueError):
+    """
+    Jab list endpoint ka pagination cursor decode nahi ho pata.
+    """
+    pass
+
+
+def _encode_cursor(submitted_at: float, campaign_id: str) -> str:
+    raw = json.dumps([submitted_at, campaign_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> tuple:
+    try:
+        submitted_at, campaign_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return float(submitted_at), str(campaign_id)
+    except (ValueError, TypeError, UnicodeError):
+        raise InvalidCursorError("Invalid pagination cursor.")
+
+
+class StateStore:
+    """
+    Yeh class campaigns aur unke workflow status ko SQLite (WAL mode) mein durable tarike se rakhti hai.
+    Restart ke baad bhi state bachi rehti hai aur kai gunicorn workers ek hi database share kar sakte hain.
+    Status updates memory mein jama hote hain aur background thread unhe ek transaction mein likhta hai.
+    """
+    def __init__(self, config):
+        """
+        StateStore ko initialize karta hai, database aur tables banata hai aur writer thread start karta hai.
+        Args:
+            config (dict): Application ki configuration settings.
+        """
+        self.config = config
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        store_config = config.get("state_store", {})
+        data_dir = config.get("paths", {}).get("data_dir", "backend/data")
+        self.db_path = store_config.get("path") or os.path.join(data_dir, "state", "campaigns.db")
+        # Status updates kitni der tak jama hokar ek saath likhe jaayenge
+        self.flush_interval = max(0.0, store_config.get("flush_interval_ms", 200) / 1000)
+        self.max_batch = max(1, int(store_config.get("max_batch", 500)))
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+        self._pending = {} # campaign_id -> abhi tak na likhe gaye status fields
+        self._inflight = [] # Woh batches jo is samay database mein likhe ja rahe hain
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._writer = threading.Thread(target=self._writer_loop, name="StateStore-writer", daemon=True)
+        self._writer.start()
+        self.logger.info(f"StateStore opened at {self.db_path} (flush interval: {self.flush_interval * 1000:.0f} ms).")
+
+    def _connect(self) -> sqlite3.Connection:
+        # Har thread ka apna connection hota hai; sqlite3 connections threads ke beech share nahi hote
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def create_campaign(self, campaign_id: str, campaign_details: dict, **status_fields):
+        """
+        Naya campaign turant likhta hai. Agar same id ka campaign pehle se hai to use sirf tab
+        overwrite karta hai jab woh completed/failed ho chuka ho (resubmission).
+        """
+        self.flush_campaign(campaign_id)
+        now = time.time()
+        row = self._status_row(status_fields)
+        row["submitted_at"] = row["submitted_at"] or now
+        with self._write_lock, self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO campaigns (campaign_id, campaign_name, details, status, stage, message, result,
+                                       submitted_at, started_at, finished_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (campaign_id) DO UPDATE SET
+                    campaign_name = excluded.campaign_name, details = excluded.details, updated_at = excluded.updated_at
+                """,
+                (campaign_id, campaign_details.get("campaign_name"), json.dumps(campaign_details), row["status"] or "queued",
+                 row["stage"], row["message"], row["result"], row["submitted_at"], row["started_at"], row["finished_at"], now)
+            )
+            # Chal rahe campaign ka status (jo worker ne shayad pehle hi likh diya ho) overwrite nahi hota
+            conn.execute(
+                f"""
+                UPDATE campaigns SET status = ?, stage = ?, message = ?, result = ?,
+                                     submitted_at = ?, started_at = ?, finished_at = ?
+                WHERE campaign_id = ? AND status IN ({', '.join('?' * len(TERMINAL_STATUSES))})
+                """,
+                (row["status"] or "queued", row["stage"], row["message"], row["result"], row["submitted_at"],
+                 row["started_at"], row["finished_at"], campaign_id, *TERMINAL_STATUSES)
+            )
+
+    def update_status(self, campaign_id: str, **fields):
+        """
+        Status update ko batch mein jodta hai. Completed/failed status turant likha jaata hai
+        taaki doosre workers ko final result bina deri ke mile.
+        """
+        unknown = set(fields) - set(STATUS_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown status fields: {', '.join(sorted(unknown))}")
+        with self._pending_lock:
+            self._pending.setdefault(campaign_id, {}).update(fields)
+            pending_count = len(self._pending)
+        if fields.get("status") in TERMINAL_STATUSES:
+            self.flush_campaign(campaign_id)
+        elif pending_count >= self.max_batch or self.flush_interval == 0:
+            self.flush()
+        else:
+            self._wakeup.set()
+
+    def get_status(self, campaign_id: str):
+        """
+        Campaign ka workflow status (abhi tak na likhe gaye updates ke saath) return karta hai.
+        Returns:
+            dict | None: Status fields, ya None agar campaign nahi mila.
+        """
+        # Pending aur likhe ja rahe updates pehle padhein taaki flush ke beech koi update chhoot na jaaye
+        with self._pending_lock:
+            pending = {}
+            for batch in self._inflight:
+                pending.update(batch.get(campaign_id, {}))
+            pending.update(self._pending.get(campaign_id, {}))
+        row = self._connect().execute(
+            f"SELECT {', '.join(STATUS_FIELDS)} FROM campaigns WHERE campaign_id = ?", (campaign_id,)
+        ).fetchone()
+        if row is None and not pending:
+            return None
+
+        status = {}
+        if row is not None:
+            status = {field: row[field] for field in STATUS_FIELDS if row[field] is not None}
+            if "result" in status:
+                status["result"] = json.loads(status["result"])
+        status.update(pending)
+        return status
+
+    def get_campaign(self, campaign_id: str):
+        """
+        Campaign ki original details return karta hai, ya None agar campaign nahi mila.
+        """
+        row = self._connect().execute("SELECT details FROM campaigns WHERE campaign_id = ?", (campaign_id,)).fetchone()
+        return json.loads(row["details"]) if row is not None and row["details"] else None
+
+    def list_unfinished(self) -> list:
+        """
+        Queued ya running campaigns ki ids (status index se), restart ke baad resume ke liye.
+        """
+        rows = self._connect().execute(
+            f"SELECT campaign_id FROM campaigns WHERE status IN ({', '.join('?' * len(ACTIVE_STATUSES))}) ORDER BY submitted_at",
+            ACTIVE_STATUSES
+        ).fetchall()
+        return [row["campaign_id"] for row in rows]
+
+    def list_campaigns(self, limit: int = 50, cursor: str = None, status: str = None) -> tuple:
+        """
+        Campaigns ko naye se purane order mein keyset pagination ke saath list karta hai.
+        OFFSET ki jagah cursor (pichle page ka aakhri submitted_at aur campaign_id) use hota hai,
+        isliye bahut saare campaigns hone par bhi har page index se seedha milta hai.
+
+        Args:
+            limit (int): Ek page mein maximum campaigns.
+            cursor (str): Pichle response ka next_cursor.
+            status (str): Sirf is status wale campaigns.
+        Returns:
+            tuple: (campaigns list, next_cursor ya None)
+        Raises:
+            InvalidCursorError: Agar cursor galat hai.
+        """
+        self.flush()
+        conditions, params = [], []
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+        if cursor:
+            submitted_at, campaign_id = _decode_cursor(cursor)
+            conditions.append("(submitted_at < ? OR (submitted_at = ? AND campaign_id < ?))")
+            params.extend([submitted_at, submitted_at, campaign_id])
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = self._connect().execute(
+            f"""
+            SELECT campaign_id, campaign_name, status, stage, submitted_at, started_at, finished_at
+            FROM campaigns {where}
+            ORDER BY submitted_at DESC, campaign_id DESC
+            LIMIT ?
+            """,
+            (*params, limit + 1)
+        ).fetchall()
+
+        campaigns = [dict(row) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            last = campaigns[-1]
+            next_cursor = _encode_cursor(last["submitted_at"], last["campaign_id"])
+        return campaigns, next_cursor
+
+    def flush_campaign(self, campaign_id: str):
+        """
+        Sirf ek campaign ke pending updates turant likhta hai.
+        """
+        with self._pending_lock:
+            fields = self._pending.pop(campaign_id, None)
+            batch = {campaign_id: fields} if fields else None
+            if batch:
+                self._inflight.append(batch)
+        if batch:
+            self._write_pending(batch)
+
+    def flush(self):
+        """
+        Saare pending status updates ek transaction mein likhta hai.
+        """
+        with self._pending_lock:
+            batch, self._pending = self._pending, {}
+            if batch:
+                self._inflight.append(batch)
+        if batch:
+            self._write_pending(batch)
+
+    def _write_pending(self, batch: dict):
+        # Batch pehle se self._inflight mein hota hai (usi lock ke andar jahan pending se nikala gaya)
+        try:
+            self._write_batch(batch)
+        except sqlite3.Error:
+            # Likhna fail hua to updates wapas pending mein daalein; naye updates purane par bhaari rehte hain
+            with self._pending_lock:
+                for campaign_id, fields in batch.items():
+                    self._pending[campaign_id] = {**fields, **self._pending.get(campaign_id, {})}
+            raise
+        finally:
+            with self._pending_lock:
+                self._inflight.remove(batch)
+
+    def close(self):
+        """
+        Writer thread rokta hai aur bache hue updates likh deta hai.
+        """
+        self._closed = True
+        self._wakeup.set()
+        self._writer.join(timeout=5)
+        self.flush()
+
+    def _status_row(self, fields: dict) -> dict:
+        row = {field: fields.get(field) for field in STATUS_FIELDS}
+        if row["result"] is not None:
+            row["result"] = json.dumps(row["result"])
+        return row
+
+    def _write_batch(self, batch: dict):
+        now = time.time()
+        with self._write_lock, self._connect() as conn:
+            for campaign_id, fields in batch.items():
+                row = self._status_row(fields)
+                columns = [field for field in STATUS_FIELDS if field in fields]
+                # Agar campaign row abhi bani nahi hai (jaise batch campaigns) to yahin ban jaati hai
+                values = {"campaign_id": campaign_id, "status": "queued", "submitted_at": now}
+                values.update((column, row[column]) for column in columns)
+                values["updated_at"] = now
+                updates = ", ".join(f"{column} = excluded.{column}" for column in columns + ["updated_at"])
+                conn.execute(
+                    f"INSERT INTO campaigns ({', '.join(values)}) VALUES ({', '.join('?' * len(values))}) "
+                    f"ON CONFLICT (campaign_id) DO UPDATE SET {updates}",
+                    tuple(values.values())
+                )
+        self.logger.debug(f"Flushed status updates for {len(batch)} campaigns.")
+
+    def _writer_loop(self):
+        while not self._closed:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            if not self._closed and self.flush_interval:
+                # Thoda rukne se is beech aane wale updates bhi isi transaction mein chale jaate hain
+                time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except sqlite3.Error as e:
+                self.logger.error(f"Failed to flush campaign status updates: {e}", exc_info=True)
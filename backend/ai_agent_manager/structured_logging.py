@@ -0,0 +1,239 @@
+import atexit
+import contextvars
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import threading
+import time
+from contextlib import contextmanager
+from backend.ai_agent_manager import metrics
+
+# Abhi chal rahe campaign ki id aur workflow stage; har log record mein apne aap jud jaate hain
+campaign_id_var = contextvars.ContextVar("campaign_id", default=None)
+stage_var = contextvars.ContextVar("stage", default=None)
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+log_records_dropped_total = metrics.registry.counter(
+    "log_records_dropped_total", "Log records dropped before reaching the log writer.", ("logger", "reason"))
+
+
+@contextmanager
+def campaign_context(campaign_id):
+    """
+    Block ke andar (aur usse shuru hue pipeline threads mein) likhe gaye har log record par campaign_id lagata hai.
+    """
+    token = campaign_id_var.set(campaign_id)
+    try:
+        yield
+    finally:
+        campaign_id_var.reset(token)
+
+
+@contextmanager
+def stage_context(stage):
+    """
+    Block ke andar likhe gaye har log record par workflow stage (jaise "strategist") lagata hai.
+    """
+    token = stage_var.set(stage)
+    try:
+        yield
+    finally:
+        stage_var.reset(token)
+
+
+class CampaignContextFilter(logging.Filter):
+    """
+    Record par likhne wale thread ka campaign_id aur stage lagata hai (queue mein jaane se pehle, taaki writer thread ko
+    sahi values milein).
+    """
+    def filter(self, record):
+        if not hasattr(record, "campaign_id"):
+            record.campaign_id = campaign_id_var.get()
+        if not hasattr(record, "stage"):
+            record.stage = stage_var.get()
+        return True
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Har logger ke liye sampling aur rate limit. Sirf WARNING se neeche ke records par lagta hai;
+    warnings aur errors hamesha likhe jaate hain. Chhode gaye records ki ginti us logger ke agle likhe gaye
+    record mein "suppressed" field ke roop mein aati hai.
+    """
+    def __init__(self, rate_limits: dict = None, sampling: dict = None):
+        """
+        Args:
+            rate_limits (dict): Logger naam -> har second maximum records.
+            sampling (dict): Logger naam -> rakhe jaane wale records ka hissa (0.0 - 1.0).
+        """
+        super().__init__()
+        self.rate_limits = {name: float(rate) for name, rate in (rate_limits or {}).items()}
+        self.sampling = {name: float(rate) for name, rate in (sampling or {}).items()}
+        self._buckets = {} # Logger naam -> [tokens, last refill time]
+        self._suppressed = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING:
+            return True
+        name = record.name
+        rate = self.rate_limits.get(name)
+        sample_rate = self.sampling.get(name)
+        if rate is None and sample_rate is None:
+            return True
+
+        with self._lock:
+            reason = None
+            if sample_rate is not None and random.random() >= sample_rate:
+                reason = "sampled"
+            elif rate is not None:
+                # Token bucket: ek second ka burst, phir "rate" records/second
+                now = time.monotonic()
+                tokens, last = self._buckets.get(name, (rate, now))
+                tokens = min(rate, tokens + (now - last) * rate)
+                if tokens >= 1.0:
+                    tokens -= 1.0
+                else:
+                    reason = "rate_limited"
+                self._buckets[name] = (tokens, now)
+
+            if reason is not None:
+                self._suppressed[name] = self._suppressed.get(name, 0) + 1
+            else:
+                suppressed = self._suppressed.pop(name, 0)
+        if reason is not None:
+            log_records_dropped_total.inc(logger=name, reason=reason)
+            return False
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Record ko background writer ki queue mein daalta hai. Queue bhari ho to record chhod deta hai
+    (aur ginta hai) lekin request thread ko kabhi block nahi karta.
+    """
+    def prepare(self, record):
+        # Message aur exception yahin text ban jaate hain (args baad mein badal sakte hain);
+        # JSON/text formatting writer thread mein hoti hai
+        message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record = copy.copy(record)
+        record.message = message
+        record.msg = message
+        record.args = None
+        record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            log_records_dropped_total.inc(logger=record.name, reason="queue_full")
+
+
+class LogListener(logging.handlers.QueueListener):
+    """
+    Background writer thread. stop() dobara call karna safe hai (process exit par bhi chalta hai).
+    """
+    def stop(self):
+        if self._thread is not None:
+            super().stop()
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Har record ko ek line ke JSON object mein badalta hai:
+    {"ts", "level", "logger", "message", "thread", "campaign_id", "stage", "suppressed", "exc_info"}
+    """
+    def format(self, record):
+        entry = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        campaign_id = getattr(record, "campaign_id", None)
+        if campaign_id is not None:
+            entry["campaign_id"] = campaign_id
+        stage = getattr(record, "stage", None)
+        if stage is not None:
+            entry["stage"] = stage
+        suppressed = getattr(record, "suppressed", None)
+        if suppressed:
+            entry["suppressed"] = suppressed
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+    def formatTime(self, record, datefmt=None):
+        return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)) + f".{int(record.msecs):03d}Z"
+
+
+def _make_formatter(name: str) -> logging.Formatter:
+    return JSONFormatter() if name == "json" else logging.Formatter(TEXT_FORMAT)
+
+
+def setup_logging(config, level: str = None, log_file: str = None) -> LogListener:
+    """
+    Root logger ko queue-based logging par set karta hai: request threads sirf record queue mein daalte hain,
+    aur ek background listener thread use log file (JSON) aur console par likhta hai.
+    Gunicorn ke kai worker processes ek hi file mein likhte hain, isliye default rotation "external" hai: WatchedFileHandler
+    append karta hai aur logrotate jaisa bahari tool file rotate kare to use dobara khol leta hai. rotation = "size" par
+    har process apni file (app.<pid>.log) khud rotate karta hai, taaki ek process doosre ki file ke neeche se rename na kare.
+
+    Args:
+        config (dict): Application ki configuration settings ([logging] section).
+        level (str): Log level; diya ho to config ko override karta hai.
+        log_file (str): Log file ka path; diya ho to config ko override karta hai.
+    Returns:
+        LogListener: Chalta hua listener (process exit par apne aap flush aur stop hota hai).
+    """
+    logging_config = config.get("logging", {})
+    level = (level or logging_config.get("level", "INFO")).upper()
+    log_file = log_file or logging_config.get("file", "logs/app.log")
+    os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
+
+    if logging_config.get("rotation", "external") == "size":
+        root_name, extension = os.path.splitext(log_file)
+        file_handler = logging.handlers.RotatingFileHandler(
+            f"{root_name}.{os.getpid()}{extension}",
+            maxBytes=int(float(logging_config.get("max_mb", 50)) * 1024 * 1024),
+            backupCount=int(logging_config.get("backup_count", 5)),
+            encoding="utf-8",
+        )
+    else:
+        file_handler = logging.handlers.WatchedFileHandler(log_file, encoding="utf-8")
+    file_handler.setFormatter(_make_formatter(logging_config.get("file_format", "json")))
+    handlers = [file_handler]
+    if logging_config.get("console", True):
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(_make_formatter(logging_config.get("console_format", "text")))
+        handlers.append(console_handler)
+
+    log_queue = queue.Queue(maxsize=int(logging_config.get("queue_size", 10000)))
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    queue_handler.addFilter(CampaignContextFilter())
+    queue_handler.addFilter(RateLimitFilter(logging_config.get("rate_limits", {}), logging_config.get("sampling", {})))
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+    root.addHandler(queue_handler)
+    root.setLevel(getattr(logging, level, logging.INFO))
+
+    listener = LogListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
@@ -0,0 +1,207 @@
+import logging
+import os
+import re
+import time
+import uuid
+
+# Upload ids sirf uuid4 hex hote hain, isliye path traversal ka sawaal nahi uthta
+UPLOAD_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+# Image formats jo upload ho sakte hain: (file ki shuruaati bytes, format)
+IMAGE_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"\xff\xd8\xff", "jpeg"),
+    (b"GIF87a", "gif"),
+    (b"GIF89a", "gif"),
+    (b"BM", "bmp"),
+    (b"II*\x00", "tiff"),
+    (b"MM\x00*", "tiff"),
+)
+SIGNATURE_BYTES = 12
+
+
+class UploadTooLargeError(Exception):
+    """
+    Jab upload configured size limit se bada ho tab raise hota hai.
+    """
+    pass
+
+
+class InvalidUploadError(ValueError):
+    """
+    Jab upload khali ho ya supported image format ka na ho tab raise hota hai.
+    """
+    pass
+
+
+def upload_dir(config) -> str:
+    return os.path.join(config.get("paths", {}).get("data_dir", "backend/data"), "media", "uploads")
+
+
+def resolve_upload_path(config, upload_id: str):
+    """
+    Upload id ko data_dir/media/uploads ke andar file path mein badalta hai.
+    Returns:
+        str | None: File ka path, ya None agar id galat hai ya file maujood nahi.
+    """
+    if not isinstance(upload_id, str) or not UPLOAD_ID_PATTERN.match(upload_id):
+        return None
+    path = os.path.join(upload_dir(config), upload_id)
+    return path if os.path.isfile(path) else None
+
+
+def _detect_image_format(head: bytes):
+    for signature, image_format in IMAGE_SIGNATURES:
+        if head.startswith(signature):
+            return image_format
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    return None
+
+
+class UploadWriter:
+    """
+    Ek upload ko chunk-by-chunk temporary file mein likhta hai; commit() par file apni jagah pahunchti hai.
+    Poori file kabhi memory mein nahi hoti.
+    """
+    def __init__(self, directory: str, max_bytes: int):
+        self.upload_id = uuid.uuid4().hex
+        self.max_bytes = max_bytes
+        self.path = os.path.join(directory, self.upload_id)
+        self._part_path = self.path + ".part"
+        self._file = open(self._part_path, "wb")
+        self._head = b""
+        self.size = 0
+
+    def write(self, chunk: bytes):
+        """
+        Raises:
+            UploadTooLargeError: Agar ab tak ke bytes limit se zyada ho gaye.
+        """
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise UploadTooLargeError(f"Upload exceeds limit of {self.max_bytes} bytes.")
+        if len(self._head) < SIGNATURE_BYTES:
+            self._head += chunk[:SIGNATURE_BYTES - len(self._head)]
+        self._file.write(chunk)
+
+    def commit(self) -> dict:
+        """
+        File ko finalize karta hai.
+        Returns:
+            dict: {"upload_id": "...", "size_bytes": int, "format": "png"}
+        Raises:
+            InvalidUploadError: Agar upload khali hai ya image nahi hai.
+        """
+        self._file.close()
+        image_format = _detect_image_format(self._head)
+        if not self.size or image_format is None:
+            self.abort()
+            raise InvalidUploadError("Upload must be a non-empty PNG, JPEG, GIF, BMP, TIFF or WebP image.")
+        os.replace(self._part_path, self.path)
+        return {"upload_id": self.upload_id, "size_bytes": self.size, "format": image_format}
+
+    def abort(self):
+        """
+        Adhoori file hata deta hai.
+        """
+        self._file.close()
+        try:
+            os.remove(self._part_path)
+        except OSError:
+            pass
+
+
+class UploadStore:
+    """
+    Yeh class screenshot uploads ko data_dir/media/uploads mein stream karke save karti hai.
+    Campaigns phir upload id se file ko reference karte hain (input_type "screenshot_file"),
+    isliye image base64-in-JSON ki tarah request body mein nahi aati. retention_hours se purane uploads (aur mare hue
+    requests ki bachi .part files) prune() se hat jaate hain.
+    """
+    def __init__(self, config):
+        """
+        UploadStore ko initialize karta hai.
+        Args:
+            config (dict): Application ki configuration settings.
+        """
+        self.config = config
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        uploads_config = config.get("uploads", {})
+        self.max_bytes = int(uploads_config.get("max_mb", 20) * 1024 * 1024)
+        self.chunk_size = int(uploads_config.get("chunk_size", 64 * 1024))
+        self.retention_sec = float(uploads_config.get("retention_hours", 24)) * 3600
+        self.directory = upload_dir(config)
+        os.makedirs(self.directory, exist_ok=True)
+        self.logger.info(f"UploadStore ready at {self.directory} (max size: {self.max_bytes} bytes).")
+
+    def open_writer(self, content_length: int = None) -> UploadWriter:
+        """
+        Naye upload ke liye writer kholta hai.
+        Raises:
+            UploadTooLargeError: Agar declared Content-Length hi limit se zyada hai.
+        """
+        if content_length is not None and content_length > self.max_bytes:
+            raise UploadTooLargeError(f"Upload size {content_length} bytes exceeds limit of {self.max_bytes} bytes.")
+        return UploadWriter(self.directory, self.max_bytes)
+
+    def save_stream(self, stream, content_length: int = None) -> dict:
+        """
+        File-like stream ko chunks mein padhkar save karta hai.
+
+        Args:
+            stream: read(size) wala object (jaise request.stream).
+            content_length (int): Declared size, agar pata ho.
+        Returns:
+            dict: {"upload_id": "...", "size_bytes": int, "format": "png"}
+        Raises:
+            UploadTooLargeError, InvalidUploadError
+        """
+        writer = self.open_writer(content_length)
+        try:
+            for chunk in iter(lambda: stream.read(self.chunk_size), b""):
+                writer.write(chunk)
+        except BaseException:
+            writer.abort()
+            raise
+        upload = writer.commit()
+        self.logger.info(f"Upload {upload['upload_id']} saved ({upload['size_bytes']} bytes, {upload['format']}).")
+        return upload
+
+    def path_for(self, upload_id: str):
+        """
+        Upload id ka file path, ya None agar upload nahi mila.
+        """
+        return resolve_upload_path(self.config, upload_id)
+
+    def prune(self, keep=(), cutoff: float = None) -> int:
+        """
+        retention_hours se purani uploads aur adhoori .part files hatata hai.
+
+        Args:
+            keep (iterable): Upload ids jo abhi kisi adhure campaign ke input hain; yeh nahi hatte.
+            cutoff (float): Is time.time() se purani files; default retention_hours pehle.
+        Returns:
+            int: Kitni files hatayi gayi.
+        """
+        if cutoff is None:
+            if not self.retention_sec:
+                return 0
+            cutoff = time.time() - self.retention_sec
+        keep = set(keep)
+        removed = 0
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                upload_id = entry.name[:-len(".part")] if entry.name.endswith(".part") else entry.name
+                if upload_id in keep or not UPLOAD_ID_PATTERN.match(upload_id):
+                    continue
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                        removed += 1
+                except OSError:
+                    continue
+        if removed:
+            self.logger.info(f"Removed {removed} uploads older than the retention window.")
+        return removed
@@ -0,0 +1,82 @@
+import logging
+from jsonschema import Draft7Validator
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+from backend.ai_agent_manager import data_schema
+
+# Registry mein register hone wale schemas: naam -> schema function
+SCHEMA_GETTERS = {
+    "campaign_details": data_schema.get_campaign_details_schema,
+    "agent_response": data_schema.get_agent_response_schema,
+    "strategist_input": data_schema.get_strategist_input_schema,
+    "strategist_output": data_schema.get_strategist_output_schema,
+    "researcher_input": data_schema.get_researcher_input_schema,
+    "researcher_output": data_schema.get_researcher_output_schema,
+    "storyteller_input": data_schema.get_storyteller_input_schema,
+    "storyteller_output": data_schema.get_storyteller_output_schema,
+    "editor_input": data_schema.get_editor_input_schema,
+    "editor_output": data_schema.get_editor_output_schema,
+    "marketer_input": data_schema.get_marketer_input_schema,
+    "marketer_output": data_schema.get_marketer_output_schema,
+}
+
+
+class ValidatorRegistry:
+    """
+    Yeh class saare JSON schemas ke validators ko startup par ek baar compile karke rakhti hai.
+    API requests aur agents ke beech handoffs dono isi se validate hote hain.
+    """
+    def __init__(self, config):
+        """
+        ValidatorRegistry ko initialize karta hai aur saare schemas compile karta hai.
+        Args:
+            config (dict): Application ki configuration settings.
+        """
+        self.config = config
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        validation_config = config.get("validation", {})
+        # Stage handoff validation production profile mein band ki ja sakti hai
+        self.validate_handoffs = validation_config.get("handoffs", True)
+
+        self._validators = {}
+        for name, schema_getter in SCHEMA_GETTERS.items():
+            self.register(name, schema_getter())
+        self.logger.info(f"ValidatorRegistry compiled {len(self._validators)} schemas (handoff validation: {self.validate_handoffs}).")
+
+    def register(self, name: str, schema: dict):
+        """
+        Ek schema ko check karke uska validator compile aur register karta hai.
+        Raises:
+            jsonschema.exceptions.SchemaError: Agar schema khud galat hai.
+        """
+        validator_class = validator_for(schema, default=Draft7Validator)
+        validator_class.check_schema(schema)
+        self._validators[name] = validator_class(schema)
+
+    def validate(self, name: str, instance):
+        """
+        Instance ko registered schema ke against validate karta hai.
+
+        Args:
+            name (str): Schema ka naam (jaise 'campaign_details').
+            instance: Validate karne wala data.
+        Returns:
+            str | None: Error message, ya None agar data valid hai.
+        """
+        validator = self._validators[name]
+        # Fast path: valid data par error objects banaye hi nahi jaate
+        if validator.is_valid(instance):
+            return None
+        error = best_match(validator.iter_errors(instance))
+        return error.message if error is not None else "Invalid data."
+
+    def validate_handoff(self, name: str, instance):
+        """
+        Agents ke beech handoff data validate karta hai, agar config mein handoff validation on hai.
+        Returns:
+            str | None: Error message, ya None agar data valid hai ya validation band hai.
+        """
+        if not self.validate_handoffs:
+            return None
+        return self.validate(name, instance)
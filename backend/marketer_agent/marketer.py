@@ -0,0 +1,38 @@
+import logging
+from backend.marketer_agent.tools.tag_index import TagIndex
+
+
+class Marketer:
+    """
+    Yeh Marketer Agent class hai.
+    Yeh Researcher ke jama kiye video metadata se campaign ke liye hashtags aur title phrases suggest karti hai.
+    Har campaign ke videos TagIndex mein jud jaate hain, isliye suggestions pichle saare campaigns se seekhte hain.
+    """
+    def __init__(self, config):
+        self.config = config
+        self.logger = logging.getLogger(self.__class__.__name__)
+        marketer_config = config.get("marketer", {})
+        self.top_k_hashtags = int(marketer_config.get("top_k_hashtags", 10))
+        self.top_k_phrases = int(marketer_config.get("top_k_phrases", 5))
+        self.tag_index = TagIndex(config)
+        self.logger.info("Marketer Agent initialized with provided configuration.")
+
+    def record_campaign(self, campaign_id: str, videos: list) -> int:
+        """
+        Campaign ke researcher_output videos ko tag index mein jodta hai.
+        Returns:
+            int: Kitne naye videos index hue.
+        """
+        added = self.tag_index.add_videos(campaign_id, videos)
+        self.logger.info(f"[{campaign_id}] Marketer Agent: Indexed {added} new videos ({len(videos)} received).")
+        return added
+
+    def suggest(self, research_keywords: list, campaign_id: str = "unknown_campaign") -> dict:
+        """
+        Research keywords ke liye top hashtags aur title phrases.
+        Returns:
+            dict: {"status": "success", "hashtags": [...], "title_phrases": [...], "matched_terms": int}
+        """
+        suggestions = self.tag_index.suggest(research_keywords, self.top_k_hashtags, self.top_k_phrases)
+        self.logger.info("[%s] Marketer Agent: Suggested hashtags %s", campaign_id, [item["tag"] for item in suggestions["hashtags"]])
+        return suggestions
@@ -0,0 +1,262 @@
+import heapq
+import json
+import logging
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+from array import array
+
+_TOKEN = re.compile(r"[^\W_]+")
+_HASHTAG_CHARS = re.compile(r"[\W_]+")
+
+# Phrases ke shuru/aakhir mein aur query terms mein yeh words kuch nahi batate
+STOPWORDS = frozenset(
+    "a an and are as at be by for from how i in is it its my new of on or our the this to top vs what why with you your "
+    "hai hain ka ke ki ko mein se aur".split()
+)
+
+
+def tokenize(text: str) -> list:
+    """
+    Lowercase word tokens (underscore/punctuation par toot-te hain).
+    """
+    return _TOKEN.findall(str(text or "").lower())
+
+
+def normalize_hashtag(tag: str) -> str:
+    """
+    Tag ko hashtag key mein badalta hai: "Fitness Tracker" / "#fitness_tracker" -> "fitnesstracker".
+    """
+    return _HASHTAG_CHARS.sub("", str(tag or "").lower())
+
+
+def query_terms(tokens: list) -> set:
+    """
+    Tokens ke unigrams (stopwords chhodkar) aur bigrams; yahi inverted index ke terms hain.
+    """
+    terms = {token for token in tokens if token not in STOPWORDS and len(token) > 1}
+    terms.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:]) if a not in STOPWORDS or b not in STOPWORDS)
+    return terms
+
+
+def title_phrases(tokens: list, max_ngram: int) -> set:
+    """
+    Title ke 2..max_ngram word n-grams jo stopword se shuru ya khatam nahi hote.
+    """
+    phrases = set()
+    for size in range(2, max_ngram + 1):
+        for start in range(len(tokens) - size + 1):
+            gram = tokens[start:start + size]
+            if gram[0] in STOPWORDS or gram[-1] in STOPWORDS:
+                continue
+            phrases.add(" ".join(gram))
+    return phrases
+
+
+class TagIndex:
+    """
+    Yeh class Researcher ke jama kiye video metadata (title, description, tags, virality_score) ka inverted index hai.
+    Har term (title/tags ke unigrams aur bigrams, description ke unigrams) ki posting list compact array mein video ids
+    rakhti hai; har video ke hashtags aur title n-grams interned ids ke roop mein. Har campaign khatam hone par naye videos
+    postings ke aakhir mein jud jaate hain. Suggestions ke liye sirf query terms ki postings (har term ke sabse naye
+    max_postings_per_term videos) score hoti hain aur heap se top-k chune jaate hain, isliye saare stored videos scan nahi hote.
+    Metadata SQLite (data_dir) mein persist hota hai aur startup par index dobara ban jaata hai. Uske baad har query aur
+    add se pehle sirf pichle padhe rowid ke baad wali rows padhi jaati hain, isliye doosre worker processes ke jode videos
+    bhi index mein aa jaate hain.
+    """
+    def __init__(self, config):
+        """
+        TagIndex ko initialize karta hai aur stored metadata load karta hai.
+        Args:
+            config (dict): Application ki configuration settings.
+        """
+        self.config = config
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        index_config = config.get("marketer", {}).get("tag_index", {})
+        self.enabled = index_config.get("enabled", True)
+        self.max_ngram = max(2, int(index_config.get("max_ngram", 3)))
+        self.max_postings_per_term = max(1, int(index_config.get("max_postings_per_term", 2000)))
+        self.max_scored_videos = max(1, int(index_config.get("max_scored_videos", 1000)))
+        # Startup load itni der mein poora na ho to query khaali ranking deti hai (campaign ruka nahi rehta)
+        self.load_wait_sec = float(index_config.get("load_wait_sec", 5))
+
+        self._postings = {} # Term -> array of video ids (add order mein)
+        self._video_weights = array("f") # Video id -> virality weight
+        self._video_tags = [] # Video id -> tuple of hashtag ids
+        self._video_phrases = [] # Video id -> tuple of phrase ids
+        self._tags, self._tag_ids = [], {}
+        self._phrases, self._phrase_ids = [], {}
+        self._source_urls = set()
+        self._last_rowid = 0 # SQLite ki aakhri row jo index ho chuki hai
+        self._lock = threading.RLock()
+        self.stats = {"queries": 0}
+
+        data_dir = config.get("paths", {}).get("data_dir", "backend/data")
+        self.db_path = index_config.get("path") or os.path.join(data_dir, "state", "tag_index.db")
+        self._local = threading.local()
+        self._loaded = threading.Event()
+        if self.enabled:
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+            with self._connect() as conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS videos (source_url TEXT PRIMARY KEY, campaign_id TEXT NOT NULL, "
+                             "metadata TEXT NOT NULL, created_at REAL NOT NULL)")
+            # Bade index ko dobara banane mein time lagta hai; startup ko rokne ki jagah background mein load hota hai
+            threading.Thread(target=self._load, name="tag-index-load", daemon=True).start()
+        else:
+            self._loaded.set()
+        self.logger.info(f"TagIndex initialized (enabled: {self.enabled}, path: {self.db_path}).")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _load(self):
+        try:
+            self._refresh()
+            self.logger.info(f"TagIndex loaded {len(self._video_weights)} videos ({len(self._postings)} terms).")
+        except (sqlite3.Error, ValueError) as e:
+            self.logger.error(f"Failed to load the tag index: {e}")
+        finally:
+            self._loaded.set()
+
+    def _refresh(self):
+        # Pichli baar ke baad (is ya kisi aur process se) jude videos; rowid primary key index se seedha milta hai
+        with self._lock:
+            rows = self._connect().execute("SELECT rowid, source_url, metadata FROM videos WHERE rowid > ? ORDER BY rowid",
+                                           (self._last_rowid,)).fetchall()
+            for rowid, source_url, metadata in rows:
+                if source_url not in self._source_urls:
+                    self._index(source_url, json.loads(metadata))
+                self._last_rowid = rowid
+
+    def wait_until_loaded(self, timeout: float = None) -> bool:
+        return self._loaded.wait(timeout)
+
+    @staticmethod
+    def _intern(value: str, names: list, ids: dict) -> int:
+        value_id = ids.get(value)
+        if value_id is None:
+            value_id = ids[value] = len(names)
+            names.append(value)
+        return value_id
+
+    def _index(self, source_url: str, metadata: dict):
+        video_id = len(self._video_weights)
+        self._source_urls.add(source_url)
+
+        title_tokens = tokenize(metadata.get("title"))
+        terms = query_terms(title_tokens)
+        terms.update(token for token in tokenize(metadata.get("description")) if token not in STOPWORDS and len(token) > 1)
+        tags = set()
+        for tag in metadata.get("tags") or []:
+            key = normalize_hashtag(tag)
+            if key:
+                tags.add(self._intern(key, self._tags, self._tag_ids))
+                terms |= query_terms(tokenize(tag))
+        phrases = {self._intern(phrase, self._phrases, self._phrase_ids) for phrase in title_phrases(title_tokens, self.max_ngram)}
+
+        # Viral videos ke tags/phrases ka weight zyada, par log scale par taaki ek video baaki sab ko na dabaa de
+        self._video_weights.append(1.0 + math.log1p(max(0.0, float(metadata.get("virality_score", 0) or 0))))
+        self._video_tags.append(tuple(tags))
+        self._video_phrases.append(tuple(phrases))
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is None:
+                self._postings[term] = array("I", (video_id,))
+            else:
+                postings.append(video_id)
+
+    def add_videos(self, campaign_id: str, videos: list) -> int:
+        """
+        Campaign ke researcher_output videos ko index mein jodta hai (ek transaction mein). Jo source URL pehle se
+        indexed hai woh dobara nahi gina jaata.
+
+        Args:
+            campaign_id (str): Videos lane wala campaign.
+            videos (list): researcher_output schema ke items ({"video_path", "metadata": {...}}).
+        Returns:
+            int: Kitne naye videos index hue.
+        """
+        if not self.enabled:
+            return 0
+        rows = []
+        for video in videos:
+            metadata = video.get("metadata") or {}
+            source_url = metadata.get("source_url") or video.get("video_path")
+            if source_url:
+                rows.append((source_url, campaign_id, json.dumps(metadata), time.time()))
+        added = 0
+        if rows:
+            # Pehle SQLite mein (saare workers ke beech shared); in-memory index wahan se refresh hota hai
+            with self._connect() as conn:
+                added = conn.executemany("INSERT OR IGNORE INTO videos (source_url, campaign_id, metadata, created_at) VALUES (?, ?, ?, ?)", rows).rowcount
+        # Startup load abhi chal raha ho to naye rows wahi padh lega
+        if self._loaded.is_set():
+            self._refresh()
+        return added
+
+    def suggest(self, keywords: list, top_k_hashtags: int = 10, top_k_phrases: int = 5) -> dict:
+        """
+        Research keywords ke liye top-k hashtags aur title phrases.
+        Har video ka score = (matched query terms ke idf ka jod) x virality weight; sabse achhe max_scored_videos videos ke
+        har hashtag/phrase ko unke scores milte hain aur heapq.nlargest top-k nikalta hai. Bahut common terms ki sirf sabse nayi
+        max_postings_per_term postings dekhi jaati hain (idf waise bhi unhe kam weight deta hai).
+
+        Args:
+            keywords (list): research_keywords (words ya phrases).
+        Returns:
+            dict: {"status": "success", "hashtags": [{"tag", "score"}], "title_phrases": [{"phrase", "score"}], "matched_terms": int}
+        """
+        terms = set()
+        for keyword in keywords or []:
+            terms |= query_terms(tokenize(keyword))
+
+        video_scores = {}
+        tag_scores, phrase_scores = {}, {}
+        matched = 0
+        if not self._loaded.wait(self.load_wait_sec):
+            self.logger.warning("Tag index is still loading; returning an empty ranking.")
+            return {"status": "success", "hashtags": [], "title_phrases": [], "matched_terms": 0}
+        with self._lock:
+            if self.enabled:
+                self._refresh()
+            self.stats["queries"] += 1
+            total = max(1, len(self._video_weights))
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                matched += 1
+                idf = math.log(1.0 + total / len(postings))
+                for video_id in postings[-self.max_postings_per_term:]:
+                    video_scores[video_id] = video_scores.get(video_id, 0.0) + idf
+            weights = self._video_weights
+            # Sirf sabse relevant videos (zyada terms match, zyada viral) ke tags/phrases gine jaate hain
+            scored = heapq.nlargest(self.max_scored_videos, ((score * weights[video_id], video_id) for video_id, score in video_scores.items()))
+            for score, video_id in scored:
+                for tag_id in self._video_tags[video_id]:
+                    tag_scores[tag_id] = tag_scores.get(tag_id, 0.0) + score
+                for phrase_id in self._video_phrases[video_id]:
+                    phrase_scores[phrase_id] = phrase_scores.get(phrase_id, 0.0) + score
+            top_tags = [(self._tags[tag_id], score) for tag_id, score in heapq.nlargest(top_k_hashtags, tag_scores.items(), key=lambda item: item[1])]
+            top_phrases = [(self._phrases[phrase_id], score) for phrase_id, score in heapq.nlargest(top_k_phrases, phrase_scores.items(), key=lambda item: item[1])]
+
+        return {
+            "status": "success",
+            "hashtags": [{"tag": f"#{tag}", "score": round(score, 4)} for tag, score in top_tags],
+            "title_phrases": [{"phrase": phrase, "score": round(score, 4)} for phrase, score in top_phrases],
+            "matched_terms": matched
+        }
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {**self.stats, "videos": len(self._video_weights), "terms": len(self._postings),
+                    "hashtags": len(self._tags), "title_phrases": len(self._phrases)}
@@ -0,0 +1,141 @@
+import logging
+import os
+import re
+from backend.researcher_agent.tools.download_manager import DownloadManager
+from backend.researcher_agent.tools.video_catalog import VideoCatalog
+from backend.ai_agent_manager.deadline import check_deadline
+
+_UNSAFE_PATH_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+class Researcher:
+    """
+    Yeh Researcher Agent class hai.
+    Yeh action plan ke research keywords se videos dhoondhti hai aur unhe data_dir/raw_videos mein download karti hai.
+    MediaStore diya ho to har video content-addressed store mein jaati hai aur campaign ko
+    raw_videos/<campaign_id>/ mein uska hardlink milta hai; pehle store ho chuke source URL dobara download nahi hote.
+    """
+    def __init__(self, config, media_store=None):
+        self.config = config
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.video_catalog = VideoCatalog(config)
+        self.download_manager = DownloadManager(config)
+        self.media_store = media_store if media_store is not None and media_store.enabled else None
+        self.logger.info("Researcher Agent initialized with provided configuration.")
+
+    def _campaign_video_path(self, campaign_id: str, file_name: str) -> str:
+        campaign_dir = _UNSAFE_PATH_CHARS.sub("_", str(campaign_id)).lstrip(".") or "campaign"
+        return os.path.join(self.download_manager.directory, campaign_dir, file_name)
+
+    def _video_item(self, video_path: str, url: str, entry: dict) -> dict:
+        return {
+            "video_path": video_path,
+            "metadata": {
+                "title": str(entry.get("title", "")),
+                "description": str(entry.get("description", "")),
+                "tags": [str(tag) for tag in entry.get("tags", [])],
+                "source_url": url,
+                "virality_score": float(entry.get("virality_score", 0) or 0)
+            }
+        }
+
+    def iter_videos(self, researcher_input: dict, campaign_id: str = "unknown_campaign", deadline=None):
+        """
+        Videos ko download hote hi ek-ek karke yield karta hai (researcher_output schema ka ek item).
+        Jo downloads fail hote hain woh log hokar chhod diye jaate hain.
+
+        Args:
+            researcher_input (dict): {"research_keywords": [...], "download_count": int}
+            deadline (Deadline): Campaign ka budget/cancellation; downloads tak jaata hai.
+        Yields:
+            dict: {"video_path": "...", "metadata": {"title", "description", "tags", "source_url", "virality_score"}}
+        Raises:
+            RuntimeError: Agar catalog load na ho, ya ek bhi video download na ho sake.
+            CampaignAbortedError: Agar campaign cancel ya expire ho jaaye.
+        """
+        keywords = researcher_input.get("research_keywords", [])
+        download_count = int(researcher_input.get("download_count", 0))
+        search_result = self.video_catalog.search(keywords, download_count, deadline)
+        if search_result["status"] == "error":
+            raise RuntimeError(search_result["message"])
+
+        candidates = {entry["url"]: entry for entry in search_result["videos"]}
+        if not candidates:
+            self.logger.info(f"[{campaign_id}] Researcher Agent: No videos found for keywords {keywords}. {search_result.get('message', '')}".rstrip())
+            return
+
+        downloaded, errors = 0, []
+        to_download = []
+        for url, entry in candidates.items():
+            check_deadline(deadline)
+            digest = self.media_store.lookup_source(url) if self.media_store else None
+            if digest is None:
+                to_download.append(url)
+                continue
+            file_name = os.path.basename(self.download_manager.target_path(url))
+            try:
+                video_path = self.media_store.link(digest, campaign_id, self._campaign_video_path(campaign_id, file_name))
+            except FileNotFoundError:
+                # Beech mein evict ho gaya; dobara download karein
+                to_download.append(url)
+                continue
+            downloaded += 1
+            yield self._video_item(video_path, url, entry)
+
+        if to_download:
+            self.logger.info(f"[{campaign_id}] Researcher Agent: Downloading {len(to_download)} videos ({downloaded} reused from media store).")
+        for url, result in self.download_manager.download_many(to_download, deadline):
+            if result["status"] == "error":
+                errors.append(result["message"])
+                continue
+            video_path = result["path"]
+            if self.media_store:
+                try:
+                    campaign_path = self._campaign_video_path(campaign_id, os.path.basename(video_path))
+                    video_path = self.media_store.add_file(video_path, campaign_id, campaign_path, source_url=url)["path"]
+                except OSError as e:
+                    errors.append(f"Failed to store {url}: {e}")
+                    continue
+            downloaded += 1
+            yield self._video_item(video_path, url, candidates[url])
+
+        if errors:
+            self.logger.warning(f"[{campaign_id}] Researcher Agent: {len(errors)} of {len(candidates)} downloads failed.")
+            if not downloaded:
+                raise RuntimeError(f"All {len(errors)} video downloads failed. First error: {errors[0]}")
+
+    def restore_videos(self, videos: list, campaign_id: str = "unknown_campaign") -> bool:
+        """
+        Checkpoint se aaye videos ki files campaign directory mein hain ya nahi; jo nahi hain (jaise campaign khatam hone par
+        references chhod diye gaye) unhe media store se dobara link karta hai.
+
+        Args:
+            videos (list): researcher_output schema ke items.
+        Returns:
+            bool: False agar koi video na apni jagah hai na media store mein (evict ho gaya); tab stage dobara chalna chahiye.
+        """
+        for video in videos:
+            video_path = video.get("video_path")
+            if video_path and os.path.isfile(video_path):
+                continue
+            source_url = (video.get("metadata") or {}).get("source_url")
+            digest = self.media_store.lookup_source(source_url) if self.media_store and source_url and video_path else None
+            if digest is None:
+                return False
+            try:
+                self.media_store.link(digest, campaign_id, video_path)
+            except OSError:
+                return False
+        return True
+
+    def run(self, researcher_input: dict, campaign_id: str = "unknown_campaign", deadline=None) -> dict:
+        """
+        Researcher agent ka mukhya execution method; saare videos download hone ke baad list return karta hai.
+        Returns:
+            dict: {"status": "success", "videos": [...], "message": "..."} ya {"status": "error", "message": "..."}
+        """
+        try:
+            videos = list(self.iter_videos(researcher_input, campaign_id, deadline))
+        except RuntimeError as e:
+            return {"status": "error", "message": str(e)}
+        return {"status": "success", "videos": videos, "message": f"Researcher downloaded {len(videos)} videos."}
@@ -0,0 +1,303 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from backend.ai_agent_manager.deadline import check_deadline, limit_timeout
+
+_CONTENT_RANGE = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+|\*)", re.IGNORECASE)
+_UNSATISFIED_RANGE = re.compile(r"bytes\s+\*/(\d+)", re.IGNORECASE)
+_EXTENSION = re.compile(r"^\.[A-Za-z0-9]{1,5}$")
+
+
+class DownloadError(Exception):
+    """
+    Jab video download poora na ho sake (HTTP error, size limit, server ka galat response) tab raise hota hai.
+    """
+    pass
+
+
+class BandwidthLimiter:
+    """
+    Saare downloads ke beech shared bandwidth cap. Har thread apne padhe hue bytes ke liye time slot reserve karta hai
+    aur lock ke bahar utna sota hai, isliye kul speed bytes_per_sec ke aas-paas rehti hai.
+    """
+    def __init__(self, bytes_per_sec: float, burst_seconds: float = 0.25):
+        self.bytes_per_sec = float(bytes_per_sec)
+        self.burst_seconds = burst_seconds
+        self._next_free = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, num_bytes: int):
+        if self.bytes_per_sec <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            # Khaali baithe samay ka thoda sa burst hi bachaya jaata hai
+            self._next_free = max(self._next_free, now - self.burst_seconds)
+            wait = self._next_free - now
+            self._next_free += num_bytes / self.bytes_per_sec
+        if wait > 0:
+            time.sleep(wait)
+
+
+class DownloadManager:
+    """
+    Yeh class Researcher ke videos data_dir/raw_videos mein download karti hai.
+    Har file chunked HTTP Range requests se aati hai aur pehle "<naam>.part" mein likhi jaati hai (sath mein
+    ".part.json" mein ETag/size); beech mein rukne (network error, process restart) par download wahi se aage badhta hai.
+    Poori hone par file atomic rename se apni jagah pahunchti hai. Kai downloads ek saath chalte hain,
+    lekin har host par connections aur kul bandwidth config se seemit rehte hain.
+    """
+    def __init__(self, config):
+        """
+        DownloadManager ko initialize karta hai.
+        Args:
+            config (dict): Application ki configuration settings.
+        """
+        self.config = config
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        download_config = config.get("researcher", {}).get("downloads", {})
+        self.max_concurrent = max(1, int(download_config.get("max_concurrent", 4)))
+        self.per_host_limit = max(1, int(download_config.get("per_host_limit", 2)))
+        self.chunk_bytes = max(64 * 1024, int(float(download_config.get("chunk_mb", 8)) * 1024 * 1024))
+        self.block_size = int(download_config.get("block_size", 64 * 1024))
+        self.timeout = download_config.get("timeout_sec", 30)
+        self.retries = int(download_config.get("retries", 3))
+        self.max_bytes = int(float(download_config.get("max_file_mb", 1024)) * 1024 * 1024)
+        self.limiter = BandwidthLimiter(float(download_config.get("max_bandwidth_mb_per_sec", 0)) * 1024 * 1024)
+
+        data_dir = config.get("paths", {}).get("data_dir", "backend/data")
+        self.directory = os.path.join(data_dir, "raw_videos")
+        os.makedirs(self.directory, exist_ok=True)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.max_concurrent, pool_maxsize=max(self.per_host_limit, self.max_concurrent))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"User-Agent": download_config.get("user_agent", "AIContentCreatorAgent/0.1")})
+
+        self.executor = ThreadPoolExecutor(max_workers=self.max_concurrent, thread_name_prefix="video-download")
+        self._host_slots = {}
+        self._path_locks = {} # path -> [lock, users]
+        self._lock = threading.Lock()
+        self.logger.info(f"DownloadManager initialized (concurrency: {self.max_concurrent}, per host: {self.per_host_limit}, "
+                         f"chunk: {self.chunk_bytes} bytes, bandwidth cap: {self.limiter.bytes_per_sec or 'none'}).")
+
+    def target_path(self, url: str) -> str:
+        """
+        URL ka raw_videos mein final path. Naam URL ke hash se banta hai, isliye same URL dobara download nahi hota.
+        """
+        extension = os.path.splitext(urlparse(url).path)[1]
+        if not _EXTENSION.match(extension):
+            extension = ".mp4"
+        return os.path.join(self.directory, hashlib.sha256(url.encode("utf-8")).hexdigest()[:32] + extension.lower())
+
+    def download(self, url: str, deadline=None) -> dict:
+        """
+        Ek URL download karta hai (ya pehle se poori file ho to wahi return karta hai).
+        deadline (Deadline) di ho to request timeout baaki budget tak seemit hota hai aur har block par cancel check
+        hota hai; ruka hua download .part file mein rehta hai aur agli baar wahin se resume hota hai.
+        Returns:
+            dict: {"status": "success", "path": "...", "size_bytes": int, "resumed": bool, "from_store": bool}
+                  ya {"status": "error", "message": "..."}
+        Raises:
+            CampaignAbortedError: Agar campaign cancel ya expire ho jaaye.
+        """
+        try:
+            return {"status": "success", **self._download(url, deadline)}
+        except (DownloadError, requests.exceptions.RequestException, OSError) as e:
+            self.logger.error(f"Download failed for {url}: {e}")
+            return {"status": "error", "message": f"Download failed for {url}: {e}"}
+
+    def download_many(self, urls, deadline=None):
+        """
+        Kai URLs ek saath download karta hai aur har result poora hote hi yield karta hai.
+        Yields:
+            tuple: (url, download() ka result dict)
+        """
+        futures = {self.executor.submit(self.download, url, deadline): url for url in urls}
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            # Consumer beech mein ruk jaaye to jo downloads shuru nahi hue unhe chhod dein
+            for future in futures:
+                future.cancel()
+
+    @contextmanager
+    def _host_slot(self, url: str):
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(self.per_host_limit)
+        with slot:
+            yield
+
+    @contextmanager
+    def _path_lock(self, path: str):
+        # Same URL ke do downloads ek hi .part file mein na likhein; aakhri user ke jaate hi entry hat jaati hai
+        with self._lock:
+            entry = self._path_locks.get(path)
+            if entry is None:
+                entry = self._path_locks[path] = [threading.Lock(), 0]
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._path_locks[path]
+
+    def _download(self, url: str, deadline=None) -> dict:
+        final_path = self.target_path(url)
+        with self._path_lock(final_path):
+            if os.path.isfile(final_path):
+                self.logger.info(f"Video already downloaded: {url}")
+                return {"path": final_path, "size_bytes": os.path.getsize(final_path), "resumed": False, "from_store": True}
+
+            part_path = final_path + ".part"
+            state_path = part_path + ".json"
+            state = self._load_state(state_path, url)
+            if state is None or not os.path.isfile(part_path):
+                state = {"url": url, "total": None, "etag": None, "last_modified": None}
+                offset = 0
+            else:
+                offset = os.path.getsize(part_path)
+            resumed = offset > 0
+            if resumed:
+                self.logger.info(f"Resuming download of {url} at byte {offset}.")
+
+            failures = 0
+            while state["total"] is None or offset < state["total"]:
+                check_deadline(deadline)
+                try:
+                    offset, finished = self._fetch_chunk(url, part_path, state_path, state, offset, deadline)
+                    failures = 0
+                    if finished:
+                        break
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                        requests.exceptions.ChunkedEncodingError, requests.exceptions.HTTPError) as e:
+                    # 4xx dobara try karne se theek nahi hoga; network errors aur 5xx hote hain
+                    if isinstance(e, requests.exceptions.HTTPError) and (e.response is None or e.response.status_code < 500):
+                        raise
+                    failures += 1
+                    if failures > self.retries:
+                        raise
+                    offset = os.path.getsize(part_path) if os.path.isfile(part_path) else 0
+                    self.logger.warning(f"Download of {url} interrupted at byte {offset} ({e}); retrying ({failures}/{self.retries}).")
+                    backoff = min(2 ** failures * 0.25, 5)
+                    if deadline is not None:
+                        deadline.sleep(backoff)
+                    else:
+                        time.sleep(backoff)
+
+            if state["total"] is not None and offset != state["total"]:
+                raise DownloadError(f"Expected {state['total']} bytes, received {offset}.")
+            with open(part_path, "rb+") as part_file:
+                os.fsync(part_file.fileno())
+            os.replace(part_path, final_path)
+            self._remove(state_path)
+            self.logger.info(f"Downloaded {url} ({offset} bytes{', resumed' if resumed else ''}) to {final_path}")
+            return {"path": final_path, "size_bytes": offset, "resumed": resumed, "from_store": False}
+
+    def _fetch_chunk(self, url, part_path, state_path, state, offset, deadline=None):
+        """
+        Agla chunk (Range request) mangata hai aur .part file mein jodta hai.
+        Returns:
+            tuple: (naya offset, kya file poori ho gayi)
+        """
+        end = offset + self.chunk_bytes - 1
+        if state["total"] is not None:
+            end = min(end, state["total"] - 1)
+        headers = {"Range": f"bytes={offset}-{end}"}
+        validator = state.get("etag") if state.get("etag") and not state["etag"].startswith("W/") else state.get("last_modified")
+        if offset and validator:
+            # File server par badal gayi ho to server poori nayi file (200) bhejta hai
+            headers["If-Range"] = validator
+
+        with self._host_slot(url), self.session.get(url, headers=headers, timeout=limit_timeout(deadline, self.timeout), stream=True) as response:
+            if response.status_code == 416 and offset:
+                match = _UNSATISFIED_RANGE.match(response.headers.get("Content-Range", ""))
+                if match and int(match.group(1)) == offset:
+                    state["total"] = offset
+                    return offset, True
+                # Server par file chhoti ho gayi; shuru se download karein
+                self._remove(part_path)
+                state.update({"total": None, "etag": None, "last_modified": None})
+                return 0, False
+            response.raise_for_status()
+
+            if response.status_code == 206:
+                match = _CONTENT_RANGE.match(response.headers.get("Content-Range", ""))
+                if not match or int(match.group(1)) != offset:
+                    raise DownloadError(f"Unexpected Content-Range '{response.headers.get('Content-Range')}' for offset {offset}.")
+                total = None if match.group(3) == "*" else int(match.group(3))
+                full_body = False
+            else:
+                # Range support nahi hai (ya file badal gayi): poori body shuru se
+                offset = 0
+                content_length = response.headers.get("Content-Length")
+                total = int(content_length) if content_length and content_length.isdigit() else None
+                full_body = True
+
+            if total is not None and total > self.max_bytes:
+                raise DownloadError(f"Video size {total} bytes exceeds limit of {self.max_bytes} bytes.")
+            if offset == 0 or state["total"] is None:
+                state.update({"total": total, "etag": response.headers.get("ETag"), "last_modified": response.headers.get("Last-Modified")})
+                self._save_state(state_path, state)
+
+            with open(part_path, "ab" if offset else "wb") as part_file:
+                for block in response.iter_content(self.block_size):
+                    check_deadline(deadline)
+                    if not block:
+                        continue
+                    self.limiter.consume(len(block))
+                    part_file.write(block)
+                    offset += len(block)
+                    if offset > self.max_bytes:
+                        raise DownloadError(f"Video exceeds limit of {self.max_bytes} bytes.")
+
+        finished = full_body or (total is not None and offset >= total)
+        if not finished and total is None and offset <= end:
+            # Server ne total size nahi batayi aur chunk adhoora aaya: file khatam
+            finished = True
+        if full_body and total is None:
+            state["total"] = offset
+        return offset, finished
+
+    @staticmethod
+    def _load_state(state_path: str, url: str):
+        try:
+            with open(state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return state if state.get("url") == url else None
+
+    @staticmethod
+    def _save_state(state_path: str, state: dict):
+        temp_path = state_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(temp_path, state_path)
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,80 @@
+import json
+import logging
+
+import requests
+
+from backend.ai_agent_manager.deadline import check_deadline, limit_timeout
+
+
+class VideoCatalog:
+    """
+    Yeh class research keywords ke liye candidate videos dhoondhti hai.
+    Videos ek JSON catalog se aate hain (URL ya local file), jiski har entry mein
+    title, description, tags, url aur virality_score hota hai.
+    """
+    def __init__(self, config):
+        """
+        VideoCatalog ko initialize karta hai.
+        Args:
+            config (dict): Application ki configuration settings.
+        """
+        self.config = config
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        researcher_config = config.get("researcher", {})
+        self.catalog_url = researcher_config.get("catalog_url") or None
+        self.catalog_file = researcher_config.get("catalog_file") or None
+        self.timeout = researcher_config.get("catalog_timeout_sec", 10)
+        self.session = requests.Session()
+        self.logger.info(f"VideoCatalog initialized (source: {self.catalog_url or self.catalog_file or 'not configured'}).")
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.catalog_url or self.catalog_file)
+
+    def _load_entries(self, deadline=None) -> list:
+        if self.catalog_url:
+            # Timeout campaign ke bache hue budget se zyada nahi hota
+            response = self.session.get(self.catalog_url, timeout=limit_timeout(deadline, self.timeout))
+            response.raise_for_status()
+            data = response.json()
+        else:
+            with open(self.catalog_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        entries = data.get("videos", []) if isinstance(data, dict) else data
+        return [entry for entry in entries if isinstance(entry, dict) and entry.get("url")]
+
+    def search(self, keywords: list, limit: int, deadline=None) -> dict:
+        """
+        Keywords se milte-julte videos, zyada matching keywords aur phir zyada virality_score wale pehle.
+
+        Args:
+            keywords (list): Research keywords (Strategist ke action plan se).
+            limit (int): Maximum videos.
+            deadline (Deadline): Campaign ka budget/cancellation; catalog fetch aur scan dono isse bounded hain.
+        Returns:
+            dict: {"status": "success", "videos": [entry, ...]} ya {"status": "error", "message": "..."}
+        Raises:
+            CampaignAbortedError: Agar campaign cancel ya expire ho jaaye.
+        """
+        if not self.configured:
+            return {"status": "success", "videos": [], "message": "No video catalog configured."}
+        try:
+            entries = self._load_entries(deadline)
+        except (requests.exceptions.RequestException, OSError, ValueError) as e:
+            self.logger.error(f"Failed to load video catalog: {e}")
+            return {"status": "error", "message": f"Failed to load video catalog: {e}"}
+
+        terms = [keyword.lower() for keyword in keywords if keyword and keyword.strip()]
+        ranked = []
+        for position, entry in enumerate(entries):
+            if position % 1000 == 0:
+                check_deadline(deadline)
+            haystack = " ".join([str(entry.get("title", "")), str(entry.get("description", "")),
+                                 " ".join(str(tag) for tag in entry.get("tags", []))]).lower()
+            matches = sum(1 for term in terms if term in haystack)
+            if terms and not matches:
+                continue
+            ranked.append((matches, float(entry.get("virality_score", 0) or 0), entry))
+        ranked.sort(key=lambda item: (item[0], item[1]), reverse=True)
+        return {"status": "success", "videos": [entry for _, _, entry in ranked[:max(0, int(limit))]]}
@@ -0,0 +1,243 @@
+import logging
+import re
+import shutil
+import subprocess
+import wave
+
+import numpy as np
+
+_CLIP_LENGTH = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*(?:-\s*(\d+(?:\.\d+)?))?\s*s?\s*$", re.IGNORECASE)
+
+
+def parse_clip_length(value, default=(15.0, 60.0)) -> tuple:
+    """
+    "30s", "15-60s" ya number ko (min_sec, max_sec) mein badalta hai.
+    """
+    if isinstance(value, (int, float)):
+        return float(value), float(value)
+    match = _CLIP_LENGTH.match(str(value or ""))
+    if not match:
+        return default
+    low = float(match.group(1))
+    high = float(match.group(2)) if match.group(2) else low
+    return min(low, high), max(low, high)
+
+
+def audio_energy(samples: np.ndarray, sample_rate: int, resolution_sec: float) -> np.ndarray:
+    """
+    PCM samples (mono ya (n, channels)) ka har resolution_sec ka RMS energy. Poora kaam reshape + mean se hota hai.
+    """
+    samples = np.asarray(samples)
+    if np.issubdtype(samples.dtype, np.integer):
+        samples = samples.astype(np.float32) / float(np.iinfo(samples.dtype).max)
+    if samples.ndim == 2:
+        samples = samples.mean(axis=1, dtype=np.float32)
+    hop = max(1, int(round(sample_rate * resolution_sec)))
+    count = len(samples) // hop
+    if count == 0:
+        return np.zeros(0, dtype=np.float32)
+    hops = samples[:count * hop].astype(np.float32, copy=False).reshape(count, hop)
+    return np.sqrt(np.einsum("ij,ij->i", hops, hops) / hop)
+
+
+def frame_difference(frames: np.ndarray, block_frames: int = 1024) -> np.ndarray:
+    """
+    Downsampled frames (n, height, width[, channels]) mein har frame ka pichle frame se mean absolute difference.
+    Frames blocks mein process hote hain taaki ghante bhar ke video par bhi int16 copy chhoti rahe.
+    """
+    frames = np.asarray(frames)
+    count = len(frames)
+    motion = np.zeros(count, dtype=np.float32)
+    axes = tuple(range(1, frames.ndim))
+    for start in range(1, count, block_frames):
+        stop = min(count, start + block_frames)
+        block = frames[start - 1:stop].astype(np.int16)
+        motion[start:stop] = np.abs(np.diff(block, axis=0)).mean(axis=axes)
+    return motion
+
+
+def _to_timeline(signal: np.ndarray, rate: float, resolution_sec: float, length: int) -> np.ndarray:
+    # Signal (rate values/sec) ko common timeline (har resolution_sec ek value) par laata hai
+    if len(signal) == 0:
+        return np.zeros(length, dtype=np.float32)
+    source_times = (np.arange(len(signal)) + 0.5) / rate
+    target_times = (np.arange(length) + 0.5) * resolution_sec
+    return np.interp(target_times, source_times, signal).astype(np.float32)
+
+
+def _robust_normalize(signal: np.ndarray) -> np.ndarray:
+    # Median/IQR se scale, taaki ek loud spike ya lamba shaant hissa baaki score ko na bigaade
+    if len(signal) == 0:
+        return signal
+    low, median, high = np.percentile(signal, [25, 50, 75])
+    spread = high - low
+    if spread <= 1e-9:
+        spread = float(signal.std()) or 1.0
+    return np.clip((signal - median) / spread, -3.0, 6.0)
+
+
+def top_k_windows(scores: np.ndarray, window: int, k: int) -> list:
+    """
+    Score timeline par length "window" ki top-k non-overlapping windows.
+    Saari window sums ek cumsum se O(n) mein banti hain; phir har pick ek vectorized argmax hai jiske baad
+    us window se overlap karne wale saare starts mask ho jaate hain (best-first, isliye sabse achha hissa hamesha chuna jaata hai).
+
+    Returns:
+        list: [(start_index, window_sum), ...] score ke ghatte order mein.
+    """
+    count = len(scores)
+    if count == 0 or k <= 0:
+        return []
+    window = max(1, min(int(window), count))
+    cumulative = np.concatenate(([0.0], np.cumsum(scores, dtype=np.float64)))
+    sums = cumulative[window:] - cumulative[:-window]
+    picks = []
+    for _ in range(k):
+        start = int(np.argmax(sums))
+        if not np.isfinite(sums[start]):
+            break
+        picks.append((start, float(sums[start])))
+        sums[max(0, start - window + 1):start + window] = -np.inf
+    return picks
+
+
+class HighlightDetector:
+    """
+    Yeh class lambi raw videos mein se sabse dilchasp (highlight) hisse dhoondhti hai.
+    Audio energy (decoded PCM) aur frame difference (downsampled frames) NumPy se nikalte hain, ek common timeline par
+    normalize hokar jud jaate hain, aur sliding-window sums se required_length_sec ki top-k non-overlapping clips chuni jaati hain.
+    """
+    def __init__(self, config):
+        """
+        HighlightDetector ko initialize karta hai.
+        Args:
+            config (dict): Application ki configuration settings.
+        """
+        self.config = config
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        highlight_config = config.get("storyteller", {}).get("highlights", {})
+        self.resolution_sec = float(highlight_config.get("resolution_sec", 0.5))
+        self.audio_weight = float(highlight_config.get("audio_weight", 0.5))
+        self.motion_weight = float(highlight_config.get("motion_weight", 0.5))
+        self.top_k = int(highlight_config.get("top_k", 3))
+        self.preferred_clip_sec = float(highlight_config.get("preferred_clip_sec", 30))
+        self.sample_rate = int(highlight_config.get("sample_rate", 8000))
+        self.frame_fps = float(highlight_config.get("frame_fps", 2))
+        self.frame_size = tuple(highlight_config.get("frame_size", [64, 36]))
+        self.ffmpeg_cmd = highlight_config.get("ffmpeg_cmd", "ffmpeg")
+        self.decode_timeout = highlight_config.get("decode_timeout_sec", 600)
+        self.logger.info(f"HighlightDetector initialized (resolution: {self.resolution_sec}s, top k: {self.top_k}).")
+
+    def score_timeline(self, samples=None, sample_rate=None, frames=None, fps=None) -> np.ndarray:
+        """
+        Audio aur/ya frames se har resolution_sec ka combined highlight score.
+        """
+        duration = 0.0
+        if samples is not None and sample_rate:
+            duration = max(duration, len(samples) / float(sample_rate))
+        if frames is not None and fps:
+            duration = max(duration, len(frames) / float(fps))
+        length = int(duration / self.resolution_sec)
+        score = np.zeros(length, dtype=np.float32)
+        if length == 0:
+            return score
+
+        if samples is not None and sample_rate:
+            energy = audio_energy(samples, sample_rate, self.resolution_sec)
+            score += self.audio_weight * _robust_normalize(_to_timeline(energy, 1.0 / self.resolution_sec, self.resolution_sec, length))
+        if frames is not None and fps:
+            motion = frame_difference(frames)
+            score += self.motion_weight * _robust_normalize(_to_timeline(motion, fps, self.resolution_sec, length))
+        return score
+
+    def detect(self, samples=None, sample_rate=None, frames=None, fps=None, clip_length="15-60s", top_k=None) -> dict:
+        """
+        Top-k highlight clip ranges dhoondhta hai.
+
+        Args:
+            samples (np.ndarray): Decoded PCM audio (mono ya (n, channels)).
+            sample_rate (int): Audio sample rate.
+            frames (np.ndarray): Downsampled grayscale/RGB frames (n, height, width[, 3]).
+            fps (float): Frames ka rate.
+            clip_length: required_length_sec (jaise "30s" ya "15-60s").
+            top_k (int): Kitni clips chahiye (default config se).
+        Returns:
+            dict: {"status": "success", "highlights": [{"start_sec", "end_sec", "score"}, ...], "duration_sec": float}
+                  ya {"status": "error", "message": "..."}
+        """
+        if samples is None and frames is None:
+            return {"status": "error", "message": "No audio or frames provided for highlight detection."}
+        scores = self.score_timeline(samples, sample_rate, frames, fps)
+        duration = len(scores) * self.resolution_sec
+        if len(scores) == 0:
+            return {"status": "error", "message": "Media is too short for highlight detection."}
+
+        min_sec, max_sec = parse_clip_length(clip_length)
+        clip_sec = min(max(self.preferred_clip_sec, min_sec), max_sec, duration)
+        window = max(1, int(round(clip_sec / self.resolution_sec)))
+        highlights = [
+            {
+                "start_sec": round(start * self.resolution_sec, 3),
+                "end_sec": round(min(duration, (start + window) * self.resolution_sec), 3),
+                "score": round(total / window, 4)
+            }
+            for start, total in top_k_windows(scores, window, top_k or self.top_k)
+        ]
+        return {"status": "success", "highlights": highlights, "duration_sec": round(duration, 3)}
+
+    def detect_from_wav(self, file_path: str, frames=None, fps=None, clip_length="15-60s", top_k=None) -> dict:
+        """
+        PCM WAV file (aur optional frames) se highlights.
+        """
+        try:
+            samples, sample_rate = read_wav(file_path)
+        except (OSError, wave.Error, ValueError) as e:
+            return {"status": "error", "message": f"Failed to read WAV file: {e}"}
+        return self.detect(samples, sample_rate, frames, fps, clip_length, top_k)
+
+    def detect_from_video(self, file_path: str, clip_length="15-60s", top_k=None) -> dict:
+        """
+        Video file ko ffmpeg se decode (mono PCM + chhote grayscale frames) karke highlights dhoondhta hai.
+        """
+        if shutil.which(self.ffmpeg_cmd) is None:
+            return {"status": "error", "message": f"ffmpeg not found ('{self.ffmpeg_cmd}'); cannot decode video."}
+        width, height = (int(value) for value in self.frame_size)
+        try:
+            audio = self._run_ffmpeg(["-i", file_path, "-vn", "-ac", "1", "-ar", str(self.sample_rate), "-f", "s16le", "-"])
+            video = self._run_ffmpeg(["-i", file_path, "-an", "-vf", f"fps={self.frame_fps},scale={width}:{height}",
+                                      "-pix_fmt", "gray", "-f", "rawvideo", "-"])
+        except (subprocess.SubprocessError, OSError) as e:
+            return {"status": "error", "message": f"Failed to decode video: {e}"}
+        samples = np.frombuffer(audio, dtype="<i2")
+        frame_bytes = width * height
+        frames = np.frombuffer(video[:len(video) - len(video) % frame_bytes], dtype=np.uint8).reshape(-1, height, width)
+        return self.detect(samples if len(samples) else None, self.sample_rate, frames if len(frames) else None,
+                           self.frame_fps, clip_length, top_k)
+
+    def _run_ffmpeg(self, args: list) -> bytes:
+        completed = subprocess.run([self.ffmpeg_cmd, "-v", "error", "-nostdin", *args], capture_output=True,
+                                   timeout=self.decode_timeout, check=True)
+        return completed.stdout
+
+
+def read_wav(file_path: str) -> tuple:
+    """
+    PCM WAV (8/16/32-bit) ko (samples ndarray, sample_rate) mein padhta hai; multi-channel (n, channels) shape mein.
+    """
+    with wave.open(file_path, "rb") as wav_file:
+        channels = wav_file.getnchannels()
+        width = wav_file.getsampwidth()
+        sample_rate = wav_file.getframerate()
+        raw = wav_file.readframes(wav_file.getnframes())
+    dtypes = {1: np.uint8, 2: np.dtype("<i2"), 4: np.dtype("<i4")}
+    if width not in dtypes:
+        raise ValueError(f"Unsupported WAV sample width: {width} bytes.")
+    samples = np.frombuffer(raw, dtype=dtypes[width])
+    if width == 1:
+        # 8-bit WAV unsigned hota hai
+        samples = samples.astype(np.int16) - 128
+        samples = samples.astype(np.int8)
+    if channels > 1:
+        samples = samples.reshape(-1, channels)
+    return samples, sample_rate
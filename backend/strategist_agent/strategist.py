@@ -1,7 +1,30 @@
+import importlib
 import logging
-from backend.strategist_agent.tools.ocr_model import OCRModel
-from backend.strategist_agent.tools.document_parser import DocumentParser
-from backend.strategist_agent.tools.requirement_extractor import RequirementExtractor # Nayi import
+import threading
+from backend.ai_agent_manager import metrics
+from backend.ai_agent_manager.deadline import check_deadline
+from backend.ai_agent_manager.uploads import resolve_upload_path
+
+# Heavy tools (PyMuPDF, pytesseract, PIL, requests) pehli zaroorat par hi import hote hain,
+# taaki server process jaldi start ho. Tool ka naam -> (module, class)
+TOOL_MODULES = {
+    "ocr_model": ("backend.strategist_agent.tools.ocr_model", "OCRModel"),
+    "document_parser": ("backend.strategist_agent.tools.document_parser", "DocumentParser"),
+    "requirement_extractor": ("backend.strategist_agent.tools.requirement_extractor", "RequirementExtractor"),
+    "extraction_cache": ("backend.strategist_agent.tools.extraction_cache", "ExtractionCache"),
+    "brief_index": ("backend.strategist_agent.tools.brief_index", "BriefIndex"),
+}
+
+# Metrics mein input type ke hisaab se extraction tool ka naam
+EXTRACTION_TOOLS = {
+    "screenshot": "ocr",
+    "screenshot_file": "ocr",
+    "pdf_file": "pdf",
+    "docx_file": "docx",
+    "text_file": "text_file",
+    "url": "url_fetch",
+    "discord_link": "url_fetch",
+}
 
 class Strategist:
     """
@@ -13,29 +36,176 @@ class Strategist:
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.info("Strategist Agent initialized with provided configuration.")
 
-        # Tools ko initialize karein
-        self.ocr_model = OCRModel(config)
-        self.document_parser = DocumentParser(config)
-        self.requirement_extractor = RequirementExtractor(config) # Naya tool initialize hua
+        # Tools lazily load honge (pehle use par ya warm_up() se)
+        self._tools = {}
+        self._tool_states = {name: "cold" for name in TOOL_MODULES}
+        self._tools_lock = threading.RLock()
+        self.warmed_up = False
+        self._warming = False
+        # Preload mode mein readiness warm_up() poora hone par milti hai; lazy mode mein tools pehli request par load hote hain
+        self.preload_tools = config.get("startup", {}).get("preload_tools", False)
+
+    @property
+    def ocr_model(self):
+        return self._get_tool("ocr_model")
+
+    @property
+    def document_parser(self):
+        return self._get_tool("document_parser")
+
+    @property
+    def requirement_extractor(self):
+        return self._get_tool("requirement_extractor")
+
+    @property
+    def extraction_cache(self):
+        return self._get_tool("extraction_cache")
+
+    @property
+    def brief_index(self):
+        return self._get_tool("brief_index")
+
+    def _get_tool(self, name):
+        tool = self._tools.get(name)
+        if tool is not None:
+            return tool
+        with self._tools_lock:
+            if name not in self._tools:
+                self._tool_states[name] = "loading"
+                try:
+                    self._tools[name] = self._create_tool(name)
+                except Exception:
+                    self._tool_states[name] = "cold"
+                    raise
+                self._tool_states[name] = "warm"
+        return self._tools[name]
+
+    def _create_tool(self, name):
+        module_name, class_name = TOOL_MODULES[name]
+        tool_class = getattr(importlib.import_module(module_name), class_name)
+        self.logger.info(f"Loading Strategist tool: {class_name}")
+
+        # Dependent tools ko bhi lazily diya jaata hai taaki ek tool doosre ko turant load na kare
+        if name == "document_parser":
+            return tool_class(self.config, ocr_model=lambda: self.ocr_model)
+        return tool_class(self.config)
 
-    def run(self, campaign_details: dict) -> dict:
+    def warm_up(self):
+        """
+        Saare tools load karta hai aur heavy engines (OCR workers, PDF process pool) ko pehle se garam karta hai.
+        Preload mode mein Manager ise background thread mein chalata hai.
+        """
+        self.logger.info("Strategist Agent: Warming up tools.")
+        self._warming = True
+        try:
+            for name in TOOL_MODULES:
+                try:
+                    self._get_tool(name)
+                except Exception as e:
+                    self.logger.error(f"Failed to load Strategist tool '{name}': {e}", exc_info=True)
+            for name in ("ocr_model", "document_parser"):
+                if name not in self._tools:
+                    continue
+                try:
+                    self._tools[name].warm_up()
+                except Exception as e:
+                    # Engine/pool start na ho to tool "failed" rehta hai aur preload mode mein readiness nahi milti
+                    self.logger.error(f"Failed to warm up Strategist tool '{name}': {e}", exc_info=True)
+                    with self._tools_lock:
+                        self._tool_states[name] = "failed"
+            self.warmed_up = True
+        finally:
+            self._warming = False
+        self.logger.info(f"Strategist Agent: Warm-up finished (tools: {self._tool_states}).")
+
+    def get_readiness(self) -> dict:
+        """
+        Har tool ki loading state aur Strategist kaam lene ke liye tayyar hai ya nahi, yeh batata hai.
+        Lazy mode mein tools pehli request par load hote hain, isliye Strategist shuru se hi ready hai (cold tools sirf
+        pehli request ko dheema karte hain). Preload mode mein ready tab hai jab warm_up() saare tools warm kar chuka ho.
+        Returns:
+            dict: {"ready": bool, "mode": "preload" | "lazy", "warmed_up": bool,
+                   "tools": {naam: "cold" | "loading" | "warm" | "failed"}}
+        """
+        with self._tools_lock:
+            states = dict(self._tool_states)
+        if self.preload_tools:
+            ready = self.warmed_up and not self._warming and all(state == "warm" for state in states.values())
+        else:
+            ready = True
+        return {"ready": ready, "mode": "preload" if self.preload_tools else "lazy", "warmed_up": self.warmed_up, "tools": states}
+
+    def fetch_url_text(self, campaign_details: dict, deadline=None) -> dict:
+        """
+        URL input ka text laata hai (conditional GET; content na badla ho to HTTP store se). Manager ise stage checkpoint
+        se pehle chalata hai taaki URL ke content ka hash fingerprint mein jaaye, aur phir text run() ko de deta hai.
+        Returns:
+            dict: {"status": "success", "extracted_text": "..."} ya {"status": "error", "message": "..."}
+        """
+        input_type = campaign_details.get("input_type")
+        input_data = campaign_details.get("input_data")
+        with metrics.track(metrics.strategist_tool_seconds, metrics.strategist_tool_total, tool=EXTRACTION_TOOLS[input_type],
+                           input_type=input_type, size_bucket=metrics.input_size_bucket(input_type, input_data)) as labels:
+            result = self.document_parser.extract_text(input_data, input_type, deadline=deadline)
+            labels["outcome"] = result["status"]
+        return result
+
+    def run(self, campaign_details: dict, extracted_text: str = None, deadline=None) -> dict:
         """
         Strategist agent ka mukhya execution method.
+
+        Args:
+            campaign_details (dict): Campaign ki saari jaankari.
+            extracted_text (str): Pehle se nikala gaya input text (jaise fetch kiya gaya URL).
+                Diya ho to cache lookup aur content extraction skip ho jaate hain.
+            deadline (Deadline): Campaign ka time budget aur cancellation; har tool (OCR, fetch, PDF) tak jaata hai.
+        Raises:
+            CampaignAbortedError: Agar campaign cancel ho jaaye ya uska budget khatam ho jaaye.
         """
         campaign_id = campaign_details.get("campaign_id", "unknown_campaign")
         self.logger.info(f"[{campaign_id}] Strategist Agent: Starting analysis for campaign.")
         
         input_type = campaign_details.get("input_type")
         input_data = campaign_details.get("input_data")
-        extracted_text = ""
+        prefetched_text = extracted_text
+
+        if input_type == "screenshot_file":
+            # Upload id ko data_dir/media/uploads ke file path mein badlein; OCR seedha file se padhta hai
+            input_data = resolve_upload_path(self.config, input_data)
+            if input_data is None:
+                return {"status": "error", "message": f"Uploaded screenshot '{campaign_details.get('input_data')}' not found."}
 
         # Step 1: Input type ke aadhar par sahi tool ka upyog karke content extract karein
-        if input_type == "screenshot":
-            self.logger.info(f"[{campaign_id}] Strategist Agent: Processing screenshot input for OCR.")
-            result = self.ocr_model.extract_text_from_image(input_data, "base64")
-        elif input_type in ["text_file", "pdf_file", "docx_file", "url", "discord_link"]:
-            self.logger.info(f"[{campaign_id}] Strategist Agent: Processing document/URL input.")
-            result = self.document_parser.extract_text(input_data, input_type)
+        # Agar yahi input pehle process ho chuka hai to cache se text lein aur OCR/parsing skip karein
+        size_label = metrics.input_size_bucket(input_type, input_data)
+        cached_text = None
+        cache_key = None
+        if prefetched_text is None:
+            with metrics.track(metrics.strategist_tool_seconds, metrics.strategist_tool_total,
+                               tool="extraction_cache", input_type=input_type, size_bucket=size_label) as labels:
+                cache_key = self.extraction_cache.make_key(input_type, input_data)
+                cached_text = self.extraction_cache.get(cache_key)
+                labels["outcome"] = "hit" if cached_text is not None else "miss"
+
+        if prefetched_text is not None:
+            self.logger.info(f"[{campaign_id}] Strategist Agent: Using prefetched input text, skipping content extraction.")
+            result = {"status": "success", "extracted_text": prefetched_text.strip(), "message": "Prefetched text used."}
+        elif cached_text is not None:
+            self.logger.info(f"[{campaign_id}] Strategist Agent: Extraction cache hit, skipping content extraction.")
+            result = {"status": "success", "extracted_text": cached_text, "message": "Text loaded from extraction cache."}
+        elif input_type in EXTRACTION_TOOLS:
+            with metrics.track(metrics.strategist_tool_seconds, metrics.strategist_tool_total,
+                               tool=EXTRACTION_TOOLS[input_type], input_type=input_type, size_bucket=size_label) as labels:
+                if input_type == "screenshot":
+                    self.logger.info(f"[{campaign_id}] Strategist Agent: Processing screenshot input for OCR.")
+                    result = self.ocr_model.extract_text_from_image(input_data, "base64", deadline)
+                elif input_type == "screenshot_file":
+                    self.logger.info(f"[{campaign_id}] Strategist Agent: Processing uploaded screenshot for OCR.")
+                    result = self.ocr_model.extract_text_from_image(input_data, "filepath", deadline)
+                else:
+                    self.logger.info(f"[{campaign_id}] Strategist Agent: Processing document/URL input.")
+                    result = self.document_parser.extract_text(input_data, input_type, deadline=deadline)
+                labels["outcome"] = result["status"]
         else:
             self.logger.warning(f"[{campaign_id}] Strategist Agent: Input type '{input_type}' not supported. Returning placeholder.")
             return {"status": "error", "message": f"Unsupported input type: {input_type}"}
@@ -45,25 +215,77 @@ class Strategist:
             return {"status": "error", "message": f"Strategist failed to process input: {result['message']}"}
 
         extracted_text = result["extracted_text"]
+        if cached_text is None and cache_key is not None:
+            self.extraction_cache.put(cache_key, extracted_text)
         self.logger.info(f"[{campaign_id}] Strategist Agent: Content extraction successful. Extracted text length: {len(extracted_text)} characters.")
         
-        # Step 2: Extracted text se requirements nikalne ke liye naye tool ko call karein
+        # Step 2: Agar lagbhag yahi brief pehle aa chuka hai (thode edits ke saath) aur uske product, audience aur keywords
+        # naye text mein bhi maujood hain, to uska plan seedha use hota hai aur requirement extraction skip hota hai
+        check_deadline(deadline)
+        with metrics.track(metrics.strategist_tool_seconds, metrics.strategist_tool_total, tool="brief_index",
+                           input_type=input_type, size_bucket=metrics.size_bucket(len(extracted_text))) as labels:
+            fingerprint = self.brief_index.fingerprint(extracted_text)
+            similar_brief = self.brief_index.find(fingerprint)
+            reusable = similar_brief is not None and self._plan_fits_text(similar_brief["action_plan"], extracted_text)
+            labels["outcome"] = "hit" if reusable else ("candidate" if similar_brief else "miss")
+
+        if reusable:
+            self.logger.info(f"[{campaign_id}] Strategist Agent: Near-duplicate brief found (similarity {similar_brief['similarity']}), reusing its action plan.")
+            action_plan = self._build_action_plan(campaign_details, extracted_text, similar_brief["action_plan"])
+            return {"status": "success", "action_plan": action_plan, "message": "Strategist reused the action plan of a near-duplicate brief."}
+        if similar_brief:
+            # SimHash mein sirf Product line badalna bhi kuch hi bits badalta hai, isliye aise brief ka plan nahi liya jaata
+            self.logger.info(f"[{campaign_id}] Strategist Agent: Near-duplicate brief (similarity {similar_brief['similarity']}) has different requirements, not reusing its plan.")
+
+        # Step 3: Extracted text se requirements nikalne ke liye naye tool ko call karein.
+        check_deadline(deadline)
         self.logger.info(f"[{campaign_id}] Strategist Agent: Calling Requirement Extractor.")
-        extraction_result = self.requirement_extractor.extract(extracted_text)
+        with metrics.track(metrics.strategist_tool_seconds, metrics.strategist_tool_total, tool="requirement_extractor",
+                           input_type=input_type, size_bucket=metrics.size_bucket(len(extracted_text))) as labels:
+            extraction_result = self.requirement_extractor.extract(extracted_text)
+            labels["outcome"] = extraction_result["status"]
         
         if extraction_result["status"] == "error":
             self.logger.error(f"[{campaign_id}] Strategist Agent: Requirement extraction failed: {extraction_result['message']}")
             return {"status": "error", "message": f"Strategist failed to extract requirements: {extraction_result['message']}"}
         
         extracted_requirements = extraction_result["requirements"]
-        self.logger.info(f"[{campaign_id}] Strategist Agent: Requirements extracted successfully: {extracted_requirements}")
+        # Dict ka string sirf tab banta hai jab record rate limit se bachkar sach mein likha jaaye
+        self.logger.info("[%s] Strategist Agent: Requirements extracted successfully: %s", campaign_id, extracted_requirements)
 
-        # Final action plan banayein aur return karein
-        action_plan = {
-            "extracted_text": extracted_text,
+        plan_requirements = {
             "product": extracted_requirements.get("product"),
             "audience": extracted_requirements.get("audience"),
             "research_keywords": extracted_requirements.get("research_keywords", [])
         }
+
+        # Final action plan banayein, near-duplicate lookups ke liye index mein rakhein aur return karein
+        self.brief_index.add(fingerprint, plan_requirements)
+        action_plan = self._build_action_plan(campaign_details, extracted_text, plan_requirements)
         
-        return {"status": "success", "action_plan": action_plan, "message": "Strategist successfully analyzed the campaign."}
\ No newline at end of file
+        return {"status": "success", "action_plan": action_plan, "message": "Strategist successfully analyzed the campaign."}
+
+    @staticmethod
+    def _plan_fits_text(plan_requirements: dict, extracted_text: str) -> bool:
+        """
+        Near-duplicate brief ke plan ka sasta spot-check: uska product, audience aur har keyword naye text mein
+        (case-insensitive) maujood hona chahiye. Product ya audience na ho to plan reuse nahi hota.
+        """
+        product, audience = plan_requirements.get("product"), plan_requirements.get("audience")
+        if not product or not audience:
+            return False
+        text = extracted_text.lower()
+        return all(str(value).lower() in text for value in [product, audience, *plan_requirements.get("research_keywords", [])])
+
+    def _build_action_plan(self, campaign_details: dict, extracted_text: str, plan_requirements: dict) -> dict:
+        """
+        Requirements (naye ya near-duplicate brief se liye gaye) aur is campaign ki settings se action plan banata hai.
+        """
+        return {
+            "extracted_text": extracted_text,
+            "product": plan_requirements.get("product"),
+            "audience": plan_requirements.get("audience"),
+            "research_keywords": plan_requirements.get("research_keywords", []),
+            "download_count": int(self.config.get("strategist", {}).get("download_count", 10)),
+            "clip_length": campaign_details.get("required_length_sec", "15-60s")
+        }
@@ -0,0 +1,201 @@
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+from array import array
+from collections import Counter
+
+FINGERPRINT_BITS = 64
+_TOKEN = re.compile(r"\w+")
+_LANE_BITS = 32 # Har bit ka weighted counter ek integer ki 32-bit "lane" mein rehta hai
+_LANE_MASK = (1 << _LANE_BITS) - 1
+
+# Byte value -> us byte ke 8 bits apni-apni lane mein. Fingerprint ke har byte position ka ek accumulator hota hai,
+# isliye har feature par 64 bit-checks ki jagah sirf 8 lookups aur additions hote hain.
+_SPREAD = [sum(1 << (bit * _LANE_BITS) for bit in range(8) if value >> bit & 1) for value in range(256)]
+
+
+def _to_signed(value: int) -> int:
+    # SQLite INTEGER signed 64-bit hota hai
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def _to_unsigned(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+
+def simhash(text: str, shingle_size: int = 3):
+    """
+    Text ka 64-bit SimHash fingerprint banata hai (lowercase word shingles, count se weighted).
+    Chhote edits (nayi date, badla hua intro) fingerprint ke sirf kuch bits badalte hain.
+
+    Returns:
+        tuple: (fingerprint int, token count)
+    """
+    tokens = _TOKEN.findall(text.lower())
+    if len(tokens) < shingle_size:
+        shingles = Counter([" ".join(tokens)]) if tokens else Counter()
+    else:
+        shingles = Counter(" ".join(tokens[i:i + shingle_size]) for i in range(len(tokens) - shingle_size + 1))
+
+    accumulators = [0] * (FINGERPRINT_BITS // 8)
+    total_weight = 0
+    for shingle, weight in shingles.items():
+        digest = hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest()
+        for position, byte in enumerate(digest):
+            accumulators[position] += _SPREAD[byte] * weight
+        total_weight += weight
+
+    fingerprint = 0
+    for position, lanes in enumerate(accumulators):
+        for bit in range(8):
+            # Bit set hai agar set-weight baaki weight se zyada hai
+            if 2 * ((lanes >> (bit * _LANE_BITS)) & _LANE_MASK) > total_weight:
+                fingerprint |= 1 << (position * 8 + bit)
+    return fingerprint, len(tokens)
+
+
+class BriefIndex:
+    """
+    Yeh class pehle dekhe gaye briefs ke SimHash fingerprints ka index hai.
+    Thode badle hue (near-duplicate) brief ke liye pichla action plan dobara use kiya ja sakta hai.
+    64 bits ko (max distance + 1) bands mein baanta jaata hai; pigeonhole se har match kam se kam ek band mein
+    exactly same hota hai, isliye lookup sirf kuch chhoti buckets check karta hai. Fingerprints compact arrays mein
+    memory mein rehte hain aur action plans SQLite (data_dir) mein. Har lookup se pehle SQLite ke naye rows (row id se)
+    index mein jud jaate hain, isliye doosre gunicorn workers ke store kiye briefs bhi milte hain.
+    Match sirf candidate hai: Strategist plan tabhi reuse karta hai (requirement extraction skip karke) jab uska product,
+    audience aur keywords naye text mein bhi maujood hon.
+    """
+    def __init__(self, config):
+        """
+        BriefIndex ko initialize karta hai aur stored fingerprints load karta hai.
+        Args:
+            config (dict): Application ki configuration settings.
+        """
+        self.config = config
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        index_config = config.get("brief_index", {})
+        self.enabled = index_config.get("enabled", True)
+        self.min_similarity = float(index_config.get("min_similarity", 0.95))
+        self.min_tokens = int(index_config.get("min_tokens", 30))
+        self.shingle_size = int(index_config.get("shingle_size", 3))
+        # Similarity = 1 - hamming_distance / 64
+        self.max_distance = max(0, int(math.floor((1.0 - self.min_similarity) * FINGERPRINT_BITS + 1e-9)))
+        band_count = min(FINGERPRINT_BITS, self.max_distance + 1)
+        band_width = -(-FINGERPRINT_BITS // band_count)
+        self._bands = [(start, (1 << min(band_width, FINGERPRINT_BITS - start)) - 1) for start in range(0, FINGERPRINT_BITS, band_width)]
+
+        self._fingerprints = array("Q") # Row position -> fingerprint
+        self._row_ids = array("q") # Row position -> SQLite id
+        self._last_row_id = 0 # Sabse bada SQLite id jo index mein aa chuka hai
+        self._tables = [{} for _ in self._bands] # Band value -> array of row positions
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "stores": 0}
+
+        data_dir = config.get("paths", {}).get("data_dir", "backend/data")
+        self.db_path = index_config.get("path") or os.path.join(data_dir, "state", "brief_index.db")
+        self._local = threading.local()
+        if self.enabled:
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+            with self._connect() as conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS briefs (id INTEGER PRIMARY KEY, fingerprint INTEGER NOT NULL, "
+                             "action_plan TEXT NOT NULL, created_at REAL NOT NULL)")
+            with self._lock:
+                self._refresh()
+        self.logger.info(f"BriefIndex initialized (enabled: {self.enabled}, entries: {len(self._fingerprints)}, "
+                         f"max distance: {self.max_distance}, bands: {len(self._bands)}).")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _refresh(self):
+        # self._lock ke andar: is ya doosre processes ke naye rows index mein jodta hai
+        for row_id, fingerprint in self._connect().execute("SELECT id, fingerprint FROM briefs WHERE id > ? ORDER BY id", (self._last_row_id,)):
+            self._insert(row_id, _to_unsigned(fingerprint))
+            self._last_row_id = row_id
+
+    def _insert(self, row_id: int, fingerprint: int):
+        position = len(self._fingerprints)
+        self._fingerprints.append(fingerprint)
+        self._row_ids.append(row_id)
+        for table, (start, mask) in zip(self._tables, self._bands):
+            key = (fingerprint >> start) & mask
+            bucket = table.get(key)
+            if bucket is None:
+                table[key] = array("I", (position,))
+            else:
+                bucket.append(position)
+
+    def fingerprint(self, text: str):
+        """
+        Text ka fingerprint, ya None agar index band hai ya text bahut chhota hai (chhote text par SimHash bharosemand nahi).
+        """
+        if not self.enabled or not text:
+            return None
+        fingerprint, token_count = simhash(text, self.shingle_size)
+        return fingerprint if token_count >= self.min_tokens else None
+
+    def find(self, fingerprint):
+        """
+        Sabse milta-julta stored brief dhoondhta hai.
+        Returns:
+            dict | None: {"action_plan": {...}, "similarity": float}, ya None agar threshold se upar koi match nahi.
+        """
+        if fingerprint is None:
+            return None
+
+        best_position, best_distance = None, self.max_distance + 1
+        with self._lock:
+            self._refresh()
+            for table, (start, mask) in zip(self._tables, self._bands):
+                bucket = table.get((fingerprint >> start) & mask)
+                if not bucket:
+                    continue
+                for position in bucket:
+                    distance = bin(fingerprint ^ self._fingerprints[position]).count("1")
+                    if distance < best_distance:
+                        best_position, best_distance = position, distance
+                        if distance == 0:
+                            break
+                if best_distance == 0:
+                    break
+            row_id = self._row_ids[best_position] if best_position is not None else None
+
+        if row_id is None:
+            self.stats["misses"] += 1
+            return None
+        row = self._connect().execute("SELECT action_plan FROM briefs WHERE id = ?", (row_id,)).fetchone()
+        if row is None:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return {"action_plan": json.loads(row[0]), "similarity": round(1.0 - best_distance / FINGERPRINT_BITS, 4)}
+
+    def add(self, fingerprint, action_plan: dict):
+        """
+        Naye brief ka fingerprint aur action plan store karta hai.
+        """
+        if fingerprint is None:
+            return
+        with self._connect() as conn:
+            conn.execute("INSERT INTO briefs (fingerprint, action_plan, created_at) VALUES (?, ?, ?)",
+                         (_to_signed(fingerprint), json.dumps(action_plan), time.time()))
+        with self._lock:
+            # Naya row (aur beech mein doosre workers ke rows) id order mein hi index mein aate hain
+            self._refresh()
+            self.stats["stores"] += 1
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {**self.stats, "entries": len(self._fingerprints)}
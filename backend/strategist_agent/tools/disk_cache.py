@@ -0,0 +1,182 @@
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+
+class DiskCache:
+    """
+    Yeh class ek directory ke neeche size-capped disk cache hai. Har entry <directory>/<key[:2]>/<key><suffix> file hai;
+    kul size max_bytes se upar jaane par sabse purani use hui entries (LRU, file mtime ke order mein) hata di jaati hain.
+    ExtractionCache ka disk tier aur URLFetcher ka HTTP store dono isi ko use karte hain.
+    Maujood entries ka index background thread mein banta hai, isliye badi cache directory se startup nahi rukta; tab tak
+    read() seedha file dekhta hai aur write() turant index mein jaata hai.
+    """
+    def __init__(self, directory: str, max_bytes: int, suffix: str = ".json"):
+        """
+        DiskCache ko initialize karta hai aur maujood entries ka index background mein banana shuru karta hai.
+        Args:
+            directory (str): Cache directory (na ho to ban jaati hai).
+            max_bytes (int): Saari entries ka maximum kul size.
+            suffix (str): Entry files ka extension; doosre files index nahi hote.
+        """
+        self.directory = directory
+        self.max_bytes = int(max_bytes)
+        self.suffix = suffix
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self._lock = threading.Lock()
+        self._index = OrderedDict() # key -> file size (purane se naye ki order mein)
+        self._bytes = 0
+        self.evictions = 0
+        self._loaded = threading.Event()
+        self._removed_while_loading = set() # Load ke dauraan delete hui keys, jo walk mein purani dikh sakti hain
+
+        os.makedirs(self.directory, exist_ok=True)
+        threading.Thread(target=self._load_index, name=f"{self.__class__.__name__}-load", daemon=True).start()
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            if key in self._index:
+                return True
+        return not self._loaded.is_set() and os.path.isfile(self.entry_path(key))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._index)
+
+    def wait_loaded(self, timeout: float = None) -> bool:
+        """
+        Index load hone tak rukta hai (len() aur total_bytes tab tak sirf ab tak mili entries ginte hain).
+        Returns:
+            bool: True agar index load ho chuka hai.
+        """
+        return self._loaded.wait(timeout)
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._bytes
+
+    def read(self, key: str):
+        """
+        Entry ke bytes return karta hai aur use sabse naya (LRU) bana deta hai.
+        Returns:
+            bytes | None: Entry, ya None agar nahi hai ya padhi nahi ja saki (tab index se hat jaati hai).
+        """
+        with self._lock:
+            # Index load hone tak jo key index mein nahi hai woh disk par ho sakti hai
+            if key not in self._index and self._loaded.is_set():
+                return None
+        path = self.entry_path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path) # LRU order ke liye mtime update karein
+        except FileNotFoundError:
+            self._forget(key)
+            return None
+        except OSError as e:
+            self.logger.warning(f"Dropping unreadable cache entry {key}: {e}")
+            self._forget(key)
+            return None
+        with self._lock:
+            if key in self._index:
+                self._index.move_to_end(key)
+        return data
+
+    def write(self, key: str, data: bytes) -> int:
+        """
+        Entry ko atomically likhta hai (temp file + rename) aur cap se upar hone par purani entries hatata hai.
+        Returns:
+            int: Kitni entries evict hui.
+        """
+        path = self.entry_path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Could not write cache entry {key}: {e}")
+            return 0
+
+        evicted = []
+        with self._lock:
+            self._bytes -= self._index.pop(key, 0)
+            self._index[key] = len(data)
+            self._bytes += len(data)
+            self._removed_while_loading.discard(key)
+            evicted = self._evict()
+
+        self._remove_files(evicted)
+        return len(evicted)
+
+    def delete(self, key: str):
+        self._forget(key)
+        try:
+            os.remove(self.entry_path(key))
+        except OSError:
+            pass
+
+    def entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}{self.suffix}")
+
+    def _forget(self, key):
+        with self._lock:
+            size = self._index.pop(key, None)
+            if size is not None:
+                self._bytes -= size
+            if not self._loaded.is_set():
+                self._removed_while_loading.add(key)
+
+    def _evict(self) -> list:
+        # Lock pehle se liya hua hona chahiye; hatayi gayi keys return hoti hain (files lock ke bahar delete hoti hain)
+        evicted = []
+        while self._bytes > self.max_bytes and len(self._index) > 1:
+            old_key, old_size = self._index.popitem(last=False)
+            self._bytes -= old_size
+            evicted.append(old_key)
+        self.evictions += len(evicted)
+        return evicted
+
+    def _remove_files(self, keys):
+        for key in keys:
+            try:
+                os.remove(self.entry_path(key))
+            except OSError:
+                pass
+
+    def _load_index(self):
+        # Walk aur stat lock ke bahar hote hain; sirf aakhri merge lock mein
+        entries = []
+        try:
+            for root, _, files in os.walk(self.directory):
+                for name in files:
+                    if not name.endswith(self.suffix):
+                        continue
+                    try:
+                        stat = os.stat(os.path.join(root, name))
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, name[:-len(self.suffix)], stat.st_size))
+        except Exception as e:
+            self.logger.warning(f"Could not index cache directory {self.directory}: {e}")
+
+        with self._lock:
+            # Load ke dauraan likhi gayi entries sabse nayi hain aur apni jagah rehti hain
+            index = OrderedDict()
+            for _, key, size in sorted(entries):
+                if key not in self._index and key not in self._removed_while_loading:
+                    index[key] = size
+            loaded_bytes = sum(index.values())
+            index.update(self._index)
+            self._index = index
+            self._bytes += loaded_bytes
+            self._removed_while_loading.clear()
+            self._loaded.set()
+            evicted = self._evict()
+
+        self._remove_files(evicted)
+        self.logger.info(f"Indexed {len(entries)} entries in {self.directory}.")
@@ -1,38 +1,101 @@
 import logging
 import requests
 import fitz # PyMuPDF library
-import docx
 import os
 import io
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from backend.strategist_agent.tools.url_fetcher import URLFetcher
+from backend.strategist_agent.tools.docx_reader import extract_docx_text
+from backend.ai_agent_manager.deadline import CampaignAbortedError, DeadlineExceededError, check_deadline
 
 logger = logging.getLogger(__name__)
 
+# Parallel PDF chunks ka intezaar karte waqt campaign cancel/deadline itne seconds mein check hoti hai
+CANCEL_POLL_SEC = 0.25
+
+
+def _extract_pdf_pages(file_path: str, page_numbers: list, render_scanned: bool, ocr_dpi: int, min_text_chars: int,
+                       stop_at: float = None, deadline=None) -> list:
+    """
+    PDF ke diye gaye pages ka text nikalta hai. Yeh function process pool ke worker mein chalta hai.
+    Jin pages par text layer nahi hai (scanned pages), unhe OCR ke liye PNG mein render karta hai.
+    Har page se pehle budget check hota hai: same process mein deadline se, worker process mein stop_at
+    (wall-clock time, kyunki Deadline object process ke bahar cancel nahi hota) se.
+
+    Returns:
+        list: (page_number, text, png_bytes ya None) tuples.
+    Raises:
+        CampaignAbortedError: Agar pages padhte waqt budget khatam ho jaaye (ya campaign cancel ho).
+    """
+    results = []
+    with fitz.open(file_path) as doc:
+        for page_number in page_numbers:
+            if deadline is not None:
+                deadline.check()
+            elif stop_at is not None and time.time() >= stop_at:
+                raise DeadlineExceededError(f"Campaign time budget ran out before PDF page {page_number + 1}.")
+            page = doc.load_page(page_number)
+            text = page.get_text()
+            image_bytes = None
+            if render_scanned and len(text.strip()) < min_text_chars:
+                image_bytes = page.get_pixmap(dpi=ocr_dpi).tobytes("png")
+            results.append((page_number, text, image_bytes))
+    return results
+
+
+def _warm_up_worker() -> int:
+    """
+    Khaali kaam jo warm_up() har pool worker par chalata hai taaki worker process spawn hokar tayyar ho jaaye.
+    Module level par hai kyunki spawn context mein submit hone wala function pickle hona chahiye.
+    """
+    return os.getpid()
+
 class DocumentParser:
     """
     Yeh class text files, PDF, DOCX, aur URLs se content extract karne ke liye hai.
     """
-    def __init__(self, config):
+    def __init__(self, config, ocr_model=None):
         """
         DocumentParser ko initialize karta hai.
         Args:
             config (dict): Application ki configuration settings.
+            ocr_model (OCRModel | callable): Scanned PDF pages ke OCR ke liye model, ya use lazily laane
+                wala callable (optional).
         """
         self.config = config
+        self._ocr_model = ocr_model
         self.logger = logging.getLogger(self.__class__.__name__)
+
+        pdf_config = config.get("pdf", {})
+        self.pdf_workers = pdf_config.get("workers", 0) or (os.cpu_count() or 1)
+        self.pdf_parallel_min_pages = int(pdf_config.get("parallel_min_pages", 16))
+        self.pdf_max_pages = pdf_config.get("max_pages", 300)
+        self.pdf_ocr_scanned_pages = pdf_config.get("ocr_scanned_pages", True)
+        self.pdf_ocr_dpi = int(pdf_config.get("ocr_dpi", 200))
+        self.pdf_min_text_chars = int(pdf_config.get("min_text_chars", 20))
+        self._pdf_pool = None # Pehle bade PDF par hi process pool banega
+        self.url_fetcher = URLFetcher(config) # Pooled session aur conditional GET ke saath URL fetching
         self.logger.info("DocumentParser initialized.")
 
-    def extract_text(self, input_data: str, input_type: str) -> dict:
+    def extract_text(self, input_data: str, input_type: str, max_pages: int = None, page_range: tuple = None, deadline=None) -> dict:
         """
         File path ya URL se text extract karta hai.
 
         Args:
             input_data (str): Local file path ya URL.
             input_type (str): 'text_file', 'pdf_file', 'docx_file', 'url'
+            max_pages (int): PDF ke maximum kitne pages padhne hain (default config se).
+            page_range (tuple): PDF pages ki (start, end) range, 1 se shuru aur end inclusive.
+            deadline (Deadline): Campaign ka budget/cancellation; fetch timeout aur PDF page loop isse seemit hote hain.
 
         Returns:
             dict: Extracted text aur status.
             {"status": "success", "extracted_text": "...", "message": "Text extracted successfully."}
             {"status": "error", "message": "Error message"}
+        Raises:
+            CampaignAbortedError: Agar campaign cancel ya expire ho jaaye.
         """
         try:
             extracted_text = ""
@@ -47,31 +110,30 @@ class DocumentParser:
             elif input_type == "pdf_file":
                 if not os.path.exists(input_data):
                     raise FileNotFoundError(f"File not found at: {input_data}")
-                with fitz.open(input_data) as doc:
-                    for page in doc:
-                        extracted_text += page.get_text()
+                extracted_text = self._extract_pdf_text(input_data, max_pages, page_range, deadline)
                 self.logger.info("Text extracted from PDF file successfully.")
 
             elif input_type == "docx_file":
                 if not os.path.exists(input_data):
                     raise FileNotFoundError(f"File not found at: {input_data}")
-                doc = docx.Document(input_data)
-                for para in doc.paragraphs:
-                    extracted_text += para.text + '\n'
+                # word/document.xml ko stream-parse karte hain (tables bhi), python-docx object model nahi banta
+                extracted_text = extract_docx_text(input_data, deadline)
                 self.logger.info("Text extracted from DOCX file successfully.")
 
             elif input_type == "url" or input_type == "discord_link":
                 self.logger.info(f"Fetching content from URL: {input_data}")
-                response = requests.get(input_data, timeout=10)
-                response.raise_for_status() # HTTP errors ke liye exception raise karein
-                extracted_text = response.text
-                self.logger.info("Content from URL fetched successfully.")
+                # HTTP errors aur size limit par fetcher exception raise karta hai
+                fetch_result = self.url_fetcher.fetch(input_data, deadline)
+                extracted_text = fetch_result["text"]
+                self.logger.info(f"Content from URL fetched successfully (from local store: {fetch_result['from_store']}).")
 
             else:
                 raise ValueError(f"Unsupported input type: {input_type}")
 
             return {"status": "success", "extracted_text": extracted_text.strip(), "message": "Text extracted successfully."}
 
+        except CampaignAbortedError:
+            raise
         except FileNotFoundError as e:
             self.logger.error(f"File not found error: {e}", exc_info=True)
             return {"status": "error", "message": f"File not found: {e}"}
@@ -80,4 +142,113 @@ class DocumentParser:
             return {"status": "error", "message": f"Could not fetch content from URL: {e}"}
         except Exception as e:
             self.logger.error(f"An unexpected error occurred: {e}", exc_info=True)
-            return {"status": "error", "message": f"Failed to extract text: {e}"}
\ No newline at end of file
+            return {"status": "error", "message": f"Failed to extract text: {e}"}
+
+    def _extract_pdf_text(self, file_path: str, max_pages: int = None, page_range: tuple = None, deadline=None) -> str:
+        """
+        PDF pages ko process pool mein parallel padhta hai aur text ko end mein ek baar join karta hai.
+        Scanned pages (bina text layer) OCRModel se padhe jaate hain.
+        Deadline di ho to workers budget khatam hone par page loop rok dete hain; cancel hone par shuru na hue
+        chunks chhod diye jaate hain (chal raha chunk apne aakhri page tak chalta hai, uska result ignore hota hai).
+        """
+        with fitz.open(file_path) as doc:
+            page_count = doc.page_count
+
+        page_numbers = self._select_pdf_pages(page_count, max_pages, page_range)
+        if not page_numbers:
+            return ""
+
+        render_scanned = bool(self.pdf_ocr_scanned_pages and self._ocr_model is not None)
+        args = (render_scanned, self.pdf_ocr_dpi, self.pdf_min_text_chars)
+
+        if self.pdf_workers > 1 and len(page_numbers) >= self.pdf_parallel_min_pages:
+            # Har worker ko lagataar pages ka chunk milta hai taaki document kam baar open ho
+            chunk_count = min(len(page_numbers), self.pdf_workers * 2)
+            chunk_size = -(-len(page_numbers) // chunk_count)
+            chunks = [page_numbers[i:i + chunk_size] for i in range(0, len(page_numbers), chunk_size)]
+            pool = self._get_pdf_pool()
+            stop_at = deadline.stop_at() if deadline is not None else None
+            futures = [pool.submit(_extract_pdf_pages, file_path, chunk, *args, stop_at) for chunk in chunks]
+            self.logger.info(f"Extracting {len(page_numbers)} PDF pages across {len(chunks)} chunks in parallel.")
+            chunk_results = (self._wait_for_chunk(future, deadline) for future in futures)
+        else:
+            futures = []
+            chunk_results = [_extract_pdf_pages(file_path, page_numbers, *args, deadline=deadline)]
+
+        try:
+            return self._join_pdf_chunks(chunk_results, deadline)
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _wait_for_chunk(self, future, deadline):
+        while True:
+            check_deadline(deadline)
+            try:
+                return future.result(timeout=CANCEL_POLL_SEC if deadline is not None else None)
+            except FutureTimeoutError:
+                continue
+
+    def _join_pdf_chunks(self, chunk_results, deadline=None) -> str:
+        page_texts = []
+        scanned_count = 0
+        for chunk_result in chunk_results:
+            texts = [text for _, text, _ in chunk_result]
+            scanned = [(index, image_bytes) for index, (_, _, image_bytes) in enumerate(chunk_result) if image_bytes]
+            if scanned:
+                # Chunk ke scanned pages ka OCR turant karein taaki rendered images memory mein jama na hon
+                ocr_results = self._get_ocr_model().extract_text_from_images([image_bytes for _, image_bytes in scanned], "bytes", deadline)
+                for (index, _), ocr_result in zip(scanned, ocr_results):
+                    if ocr_result["status"] == "success":
+                        texts[index] = ocr_result["extracted_text"] + "\n"
+                    else:
+                        self.logger.warning(f"OCR failed for scanned PDF page {chunk_result[index][0] + 1}: {ocr_result['message']}")
+                scanned_count += len(scanned)
+            page_texts.extend(texts)
+
+        if scanned_count:
+            self.logger.info(f"OCR applied to {scanned_count} scanned PDF pages.")
+        return "".join(page_texts)
+
+    def _select_pdf_pages(self, page_count: int, max_pages: int = None, page_range: tuple = None) -> list:
+        """
+        page_range aur max_pages ke hisaab se padhe jaane wale pages (0-based) return karta hai.
+        """
+        start, end = 0, page_count
+        if page_range:
+            start = max(0, int(page_range[0]) - 1)
+            end = min(page_count, int(page_range[1]))
+
+        limit = max_pages if max_pages is not None else self.pdf_max_pages
+        if limit and end - start > limit:
+            self.logger.warning(f"PDF has {end - start} pages in range; only the first {limit} will be processed.")
+            end = start + int(limit)
+        return list(range(start, end))
+
+    def warm_up(self):
+        """
+        PDF process pool ke workers pehle se start karta hai taaki pehle bade PDF par spawn ka kharcha na lage.
+        Returns:
+            int: Kitne alag worker processes ne warm-up task chalaya (pool na ho to 0).
+        Raises:
+            Exception: Agar pool ya uske workers start na ho sakein (Strategist tab tool ko failed mark karta hai).
+        """
+        if self.pdf_workers <= 1:
+            return 0
+        try:
+            pool = self._get_pdf_pool()
+            pids = {future.result() for future in [pool.submit(_warm_up_worker) for _ in range(self.pdf_workers)]}
+        except Exception as e:
+            self.logger.error(f"PDF process pool warm-up failed: {e}")
+            raise
+        self.logger.info(f"PDF process pool warmed up ({len(pids)} of {self.pdf_workers} workers started).")
+        return len(pids)
+
+    def _get_ocr_model(self):
+        return self._ocr_model() if callable(self._ocr_model) else self._ocr_model
+
+    def _get_pdf_pool(self):
+        if self._pdf_pool is None:
+            # Threads wale process mein fork safe nahi hai, isliye spawn context use karte hain
+            self._pdf_pool = ProcessPoolExecutor(max_workers=self.pdf_workers, mp_context=multiprocessing.get_context("spawn"))
+        return self._pdf_pool
\ No newline at end of file
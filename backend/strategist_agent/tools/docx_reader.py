@@ -0,0 +1,102 @@
+import zipfile
+import xml.etree.ElementTree as ET
+
+# WordprocessingML namespace aur woh tags jinki zaroorat hai
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_BODY = _W + "body"
+_PARAGRAPH = _W + "p"
+_TEXT = _W + "t"
+_TAB = _W + "tab"
+_BREAKS = (_W + "br", _W + "cr")
+_TABLE_ROW = _W + "tr"
+_TABLE_CELL = _W + "tc"
+
+DOCUMENT_PART = "word/document.xml"
+# Itni lines ke baad campaign ki deadline/cancellation check hoti hai
+DEADLINE_CHECK_LINES = 1024
+
+
+def iter_docx_lines(file_path: str):
+    """
+    DOCX ke main document part (word/document.xml) ko zip se stream-parse karta hai aur text lines
+    document order mein yield karta hai. Har paragraph ek line hai; table ki har row ek line hai jisme
+    cells tab se jude hote hain (cell ke andar ke paragraphs space se). Parse hue elements turant clear ho jaate
+    hain, isliye memory document ke size se nahi badhti.
+
+    Args:
+        file_path (str): DOCX file ka path.
+    Yields:
+        str: Ek paragraph ya table row ka text.
+    Raises:
+        zipfile.BadZipFile, KeyError, xml.etree.ElementTree.ParseError: Agar file valid DOCX nahi hai.
+    """
+    with zipfile.ZipFile(file_path) as archive, archive.open(DOCUMENT_PART) as document:
+        body = None
+        depth = 0
+        paragraph_buffers = [] # Har khule paragraph ke text parts (text boxes mein paragraphs nest ho sakte hain)
+        rows = [] # Har khuli table row ke cells
+        cells = [] # Har khule cell ke paragraphs
+
+        for event, element in ET.iterparse(document, events=("start", "end")):
+            tag = element.tag
+            if event == "start":
+                depth += 1
+                if tag == _PARAGRAPH:
+                    paragraph_buffers.append([])
+                elif tag == _TABLE_ROW:
+                    rows.append([])
+                elif tag == _TABLE_CELL:
+                    cells.append([])
+                elif tag == _BODY:
+                    body = element
+                continue
+
+            depth -= 1
+            if tag == _TEXT:
+                if paragraph_buffers and element.text:
+                    paragraph_buffers[-1].append(element.text)
+            elif tag == _TAB:
+                if paragraph_buffers:
+                    paragraph_buffers[-1].append("\t")
+            elif tag in _BREAKS:
+                if paragraph_buffers:
+                    paragraph_buffers[-1].append("\n")
+            elif tag == _PARAGRAPH:
+                text = "".join(paragraph_buffers.pop())
+                if cells:
+                    if text:
+                        cells[-1].append(text)
+                else:
+                    yield text
+            elif tag == _TABLE_CELL:
+                cell_text = " ".join(cells.pop())
+                if rows:
+                    rows[-1].append(cell_text)
+            elif tag == _TABLE_ROW:
+                row_cells = rows.pop()
+                if any(row_cells):
+                    row_text = "\t".join(row_cells)
+                    # Nested table ki row bahar wale cell ka hissa ban jaati hai
+                    if cells:
+                        cells[-1].append(row_text)
+                    else:
+                        yield row_text
+
+            # Body ka har top-level block (paragraph/table) khatam hote hi uske saare parsed elements chhod dein
+            if body is not None and depth == 2:
+                body.clear()
+
+
+def extract_docx_text(file_path: str, deadline=None) -> str:
+    """
+    DOCX ka poora text (paragraphs aur tables, document order mein) ek string mein return karta hai.
+    deadline (Deadline) di ho to parse ke beech har DEADLINE_CHECK_LINES lines par check hoti hai.
+    """
+    if deadline is None:
+        return "\n".join(iter_docx_lines(file_path))
+    lines = []
+    for index, line in enumerate(iter_docx_lines(file_path)):
+        if index % DEADLINE_CHECK_LINES == 0:
+            deadline.check()
+        lines.append(line)
+    return "\n".join(lines)
@@ -0,0 +1,153 @@
+import base64
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+from backend.strategist_agent.tools.disk_cache import DiskCache
+
+# Cache key format badalne par is version ko badhayein taaki purani entries ignore ho jayein
+CACHE_KEY_VERSION = "v1"
+FILE_INPUT_TYPES = ("text_file", "pdf_file", "docx_file", "screenshot_file")
+URL_INPUT_TYPES = ("url", "discord_link")
+
+
+class ExtractionCache:
+    """
+    Yeh class Strategist inputs se extract kiye gaye text ko cache karti hai.
+    Key input ke decoded bytes ka SHA-256 hash hai. URLs yahan cache nahi hote: unka cache URLFetcher ka HTTP store hai,
+    jo har baar conditional GET se revalidate hota hai (alag HEAD request ki zaroorat nahi).
+    Do tiers hain: in-memory LRU aur data_dir ke neeche size-capped disk cache (DiskCache).
+    """
+    def __init__(self, config):
+        """
+        ExtractionCache ko initialize karta hai.
+        Args:
+            config (dict): Application ki configuration settings.
+        """
+        self.config = config
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        cache_config = config.get("extraction_cache", {})
+        self.enabled = cache_config.get("enabled", True)
+        self.memory_entries = max(0, int(cache_config.get("memory_entries", 256)))
+        self.disk_max_bytes = int(cache_config.get("disk_max_mb", 512)) * 1024 * 1024
+
+        data_dir = config.get("paths", {}).get("data_dir", "backend/data")
+        self.cache_dir = os.path.join(data_dir, "cache", "extraction")
+
+        self._lock = threading.Lock()
+        self._memory = OrderedDict() # key -> extracted_text (LRU order)
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "memory_evictions": 0, "stores": 0}
+
+        self._disk = DiskCache(self.cache_dir, self.disk_max_bytes, suffix=".json") if self.enabled else None
+        self.logger.info(f"ExtractionCache initialized (enabled: {self.enabled}, disk cap: {self.disk_max_bytes} bytes).")
+
+    def make_key(self, input_type: str, input_data: str):
+        """
+        Input ke content se cache key banata hai.
+
+        Args:
+            input_type (str): 'screenshot', 'screenshot_file', 'text_file', 'pdf_file' ya 'docx_file'.
+            input_data (str): Base64 image ya file path.
+        Returns:
+            str | None: Hex key, ya None agar input cache karne layak nahi hai (jaise URLs).
+        """
+        if not self.enabled or not input_data:
+            return None
+        try:
+            digest = hashlib.sha256()
+            digest.update(f"{CACHE_KEY_VERSION}\0{input_type}\0".encode("utf-8"))
+
+            if input_type == "screenshot":
+                digest.update(base64.b64decode(input_data))
+            elif input_type in FILE_INPUT_TYPES:
+                if not os.path.isfile(input_data):
+                    return None
+                with open(input_data, "rb") as f:
+                    for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                        digest.update(chunk)
+            else:
+                return None
+            return digest.hexdigest()
+        except Exception as e:
+            self.logger.warning(f"Could not build extraction cache key: {e}")
+            return None
+
+    def get(self, key):
+        """
+        Cache se extracted text return karta hai. Pehle memory, fir disk check hoti hai.
+        Returns:
+            str | None: Cached text, ya None agar miss hua.
+        """
+        if key is None:
+            return None
+
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return self._memory[key]
+
+        text = self._read_disk_entry(key)
+        if text is not None:
+            with self._lock:
+                self.stats["disk_hits"] += 1
+                self._remember(key, text)
+            return text
+
+        with self._lock:
+            self.stats["misses"] += 1
+        return None
+
+    def put(self, key, extracted_text: str):
+        """
+        Extracted text ko dono tiers mein store karta hai.
+        """
+        if key is None:
+            return
+        with self._lock:
+            self._remember(key, extracted_text)
+            self.stats["stores"] += 1
+        self._write_disk_entry(key, extracted_text)
+
+    def get_stats(self) -> dict:
+        """
+        Hit/miss aur eviction counters ki copy return karta hai.
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            stats["memory_entries"] = len(self._memory)
+        stats["disk_entries"] = len(self._disk) if self._disk is not None else 0
+        stats["disk_bytes"] = self._disk.total_bytes if self._disk is not None else 0
+        stats["disk_evictions"] = self._disk.evictions if self._disk is not None else 0
+        return stats
+
+    def _remember(self, key, text):
+        # Lock pehle se liya hua hona chahiye
+        if self.memory_entries == 0:
+            return
+        self._memory[key] = text
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+            self.stats["memory_evictions"] += 1
+
+    def _read_disk_entry(self, key):
+        if self._disk is None:
+            return None
+        data = self._disk.read(key)
+        if data is None:
+            return None
+        try:
+            return json.loads(data)["extracted_text"]
+        except (ValueError, KeyError) as e:
+            self.logger.warning(f"Dropping unreadable extraction cache entry {key}: {e}")
+            self._disk.delete(key)
+            return None
+
+    def _write_disk_entry(self, key, text):
+        if self._disk is not None:
+            self._disk.write(key, json.dumps({"extracted_text": text}).encode("utf-8"))
@@ -4,6 +4,10 @@ from PIL import Image
 import os
 import logging
 import base64
+import math
+import re
+from backend.strategist_agent.tools.ocr_pool import OCRWorkerPool
+from backend.ai_agent_manager.deadline import CampaignAbortedError
 
 logger = logging.getLogger(__name__)
 
@@ -32,8 +36,27 @@ class OCRModel:
         else:
             self.logger.warning("Tesseract CMD path not explicitly set or not found. Assuming Tesseract is in system PATH.")
 
+        # Long-lived OCR workers ka pool jo batch mein tesseract chalata hai
+        ocr_config = self.config.get("ocr", {})
+        self.worker_pool = OCRWorkerPool(
+            tesseract_cmd=pytesseract.pytesseract.tesseract_cmd,
+            workers=ocr_config.get("workers", 0),
+            batch_size=ocr_config.get("batch_size", 8),
+            lang=ocr_config.get("lang"),
+            engine=ocr_config.get("engine", "auto"),
+            tessdata_dir=ocr_config.get("tessdata_dir")
+        )
+        # Ek tesseract process ka maximum samay; campaign deadline isse bhi kam kar sakti hai
+        self.timeout = ocr_config.get("timeout_sec", 120) or None
 
-    def extract_text_from_image(self, image_input: str, input_type: str) -> dict:
+        # Lambi scrolling screenshots ke liye tiling aur bahut badi images ke liye downscale guard
+        self.tiling_enabled = ocr_config.get("tiling_enabled", True)
+        self.tile_min_height = int(ocr_config.get("tile_min_height", 4000))
+        self.tile_height = int(ocr_config.get("tile_height", 2000))
+        self.tile_overlap = int(ocr_config.get("tile_overlap", 200))
+        self.max_pixels = int(ocr_config.get("max_pixels", 50_000_000))
+
+    def extract_text_from_image(self, image_input: str, input_type: str, deadline=None) -> dict:
         """
         Image se text extract karta hai.
         Image input base64 string ya local file path ho sakta hai.
@@ -41,6 +64,7 @@ class OCRModel:
         Args:
             image_input (str): Base64 encoded image string ya local image file ka path.
             input_type (str): 'base64' ya 'filepath'.
+            deadline (Deadline): Campaign ka budget/cancellation (optional).
 
         Returns:
             dict: Extracted text aur status.
@@ -48,30 +72,16 @@ class OCRModel:
             {"status": "error", "message": "Error message"}
         """
         try:
-            image = None
-            if input_type == "base64":
-                # Base64 string ko decode karke image load karein
-                image_bytes = base64.b64decode(image_input)
-                image = Image.open(io.BytesIO(image_bytes))
-                self.logger.info("Image loaded from base64 string.")
-            elif input_type == "filepath":
-                # File path se image load karein
-                if not os.path.exists(image_input):
-                    raise FileNotFoundError(f"Image file not found at: {image_input}")
-                image = Image.open(image_input)
-                self.logger.info(f"Image loaded from filepath: {image_input}")
-            else:
-                raise ValueError("Invalid input_type. Must be 'base64' or 'filepath'.")
-
-            if image is None:
-                raise ValueError("Failed to load image.")
+            image = self._load_image(image_input, input_type)
 
             # OCR process
-            extracted_text = pytesseract.image_to_string(image)
+            extracted_text = self._ocr_images([image], deadline)[0]
             self.logger.info("Text extraction successful.")
 
             return {"status": "success", "extracted_text": extracted_text.strip(), "message": "Text extracted successfully."}
 
+        except CampaignAbortedError:
+            raise
         except FileNotFoundError as e:
             self.logger.error(f"OCR Error: File not found - {e}", exc_info=True)
             return {"status": "error", "message": f"Image file not found: {e}"}
@@ -80,4 +90,206 @@ class OCRModel:
             return {"status": "error", "message": "Tesseract OCR engine not found. Please install it."}
         except Exception as e:
             self.logger.error(f"OCR Error: An unexpected error occurred - {e}", exc_info=True)
-            return {"status": "error", "message": f"Failed to extract text: {e}"}
\ No newline at end of file
+            return {"status": "error", "message": f"Failed to extract text: {e}"}
+
+    def warm_up(self):
+        """
+        Har OCR worker ka Tesseract engine (language model samet) pehle se load karta hai.
+        """
+        try:
+            engines = self.worker_pool.warm_up()
+            self.logger.info(f"OCR engine warmed up ({engines} in-process engines ready).")
+        except Exception as e:
+            self.logger.warning(f"OCR warm-up failed: {e}")
+
+    def extract_text_from_images(self, image_inputs: list, input_type: str = "base64", deadline=None) -> list:
+        """
+        Kai images (screenshots) ka text ek saath extract karta hai.
+        Images OCR worker pool mein baant di jaati hain aur results input ke order mein milte hain.
+
+        Args:
+            image_inputs (list): Base64 encoded image strings, local image file paths ya raw image bytes.
+            input_type (str): 'base64', 'filepath' ya 'bytes' (sabhi inputs ke liye same).
+            deadline (Deadline): Campaign ka budget/cancellation (optional).
+
+        Returns:
+            list: Har image ke liye extract_text_from_image jaisa result dict.
+        Raises:
+            CampaignAbortedError: Agar campaign cancel ya expire ho jaaye.
+        """
+        results = [None] * len(image_inputs)
+        images = []
+        positions = []
+
+        # Pehle saari images load karein; jo load na ho unka error wahi record ho jaata hai
+        for index, image_input in enumerate(image_inputs):
+            try:
+                images.append(self._load_image(image_input, input_type))
+                positions.append(index)
+            except FileNotFoundError as e:
+                self.logger.error(f"OCR Error: File not found - {e}")
+                results[index] = {"status": "error", "message": f"Image file not found: {e}"}
+            except Exception as e:
+                self.logger.error(f"OCR Error: Could not load image #{index} - {e}")
+                results[index] = {"status": "error", "message": f"Failed to extract text: {e}"}
+
+        try:
+            texts = self._ocr_images(images, deadline)
+        except CampaignAbortedError:
+            raise
+        except pytesseract.TesseractNotFoundError:
+            self.logger.critical("Tesseract is not installed or not in your PATH. Please install Tesseract OCR engine.")
+            texts = None
+            error = {"status": "error", "message": "Tesseract OCR engine not found. Please install it."}
+        except Exception as e:
+            self.logger.error(f"OCR Error: Batch extraction failed - {e}", exc_info=True)
+            texts = None
+            error = {"status": "error", "message": f"Failed to extract text: {e}"}
+
+        for offset, index in enumerate(positions):
+            if texts is None:
+                results[index] = dict(error)
+            else:
+                results[index] = {"status": "success", "extracted_text": texts[offset].strip(), "message": "Text extracted successfully."}
+
+        self.logger.info(f"Batch OCR finished for {len(image_inputs)} images.")
+        return results
+
+    def _load_image(self, image_input: str, input_type: str):
+        """
+        Base64 string ya file path se PIL image load karta hai.
+        """
+        image = None
+        if input_type == "base64":
+            # Base64 string ko decode karke image load karein
+            image_bytes = base64.b64decode(image_input)
+            image = Image.open(io.BytesIO(image_bytes))
+            self.logger.info("Image loaded from base64 string.")
+        elif input_type == "filepath":
+            # File path se image load karein
+            if not os.path.exists(image_input):
+                raise FileNotFoundError(f"Image file not found at: {image_input}")
+            image = Image.open(image_input)
+            self.logger.info(f"Image loaded from filepath: {image_input}")
+        elif input_type == "bytes":
+            # Raw image bytes (jaise PDF page ka rendered PNG)
+            image = Image.open(io.BytesIO(image_input))
+        else:
+            raise ValueError("Invalid input_type. Must be 'base64', 'filepath' or 'bytes'.")
+
+        if image is None:
+            raise ValueError("Failed to load image.")
+        return image
+
+    def _ocr_images(self, images: list, deadline=None) -> list:
+        """
+        Images ko prepare karta hai (downscale + tiling), saare bands ek saath worker pool mein bhejta hai
+        aur har image ke bands ka text merge karke return karta hai.
+        """
+        bands = []
+        band_counts = []
+        for image in images:
+            image_bands = self._split_into_bands(self._limit_pixels(image))
+            bands.extend(image_bands)
+            band_counts.append(len(image_bands))
+
+        band_texts = self.worker_pool.ocr_images(bands, timeout=self.timeout, deadline=deadline)
+
+        texts = []
+        position = 0
+        for count in band_counts:
+            texts.append(self._merge_band_texts(band_texts[position:position + count]))
+            position += count
+        return texts
+
+    def _limit_pixels(self, image):
+        """
+        Agar image max_pixels se badi hai to aspect ratio rakhte hue usse chhota karta hai.
+        """
+        width, height = image.size
+        if self.max_pixels <= 0 or width * height <= self.max_pixels:
+            return image
+        scale = math.sqrt(self.max_pixels / float(width * height))
+        new_size = (max(1, int(width * scale)), max(1, int(height * scale)))
+        self.logger.info(f"Downscaling oversized image from {width}x{height} to {new_size[0]}x{new_size[1]} before OCR.")
+        return image.resize(new_size, Image.LANCZOS)
+
+    def _split_into_bands(self, image) -> list:
+        """
+        Lambi image ko overlapping horizontal bands mein todta hai.
+        Cut ko khali (blank) row par rakhne ki koshish hoti hai taaki text ki line beech se na kate.
+        """
+        width, height = image.size
+        if not self.tiling_enabled or height < self.tile_min_height or self.tile_height <= self.tile_overlap:
+            return [image]
+
+        gray = image.convert("L")
+        bands = []
+        top = 0
+        while top < height:
+            bottom = min(height, top + self.tile_height)
+            if bottom < height:
+                bottom = self._find_blank_row(gray, bottom - self.tile_overlap // 2, bottom)
+            bands.append(image.crop((0, top, width, bottom)))
+            if bottom >= height:
+                break
+            top = bottom - self.tile_overlap
+
+        self.logger.info(f"Split {width}x{height} image into {len(bands)} overlapping bands for OCR.")
+        return bands
+
+    def _find_blank_row(self, gray, start, end):
+        # Neeche se upar ki taraf pehli lagbhag ek-rang wali row dhoondhein; na mile to end hi cut hai
+        width = gray.size[0]
+        for y in range(end - 1, max(start, 1) - 1, -1):
+            low, high = gray.crop((0, y, width, y + 1)).getextrema()
+            if high - low < 16:
+                return y + 1
+        return end
+
+    def _merge_band_texts(self, band_texts: list) -> str:
+        """
+        Bands ka text jodta hai aur overlap wale hisse mein repeat hui lines hata deta hai.
+        """
+        if len(band_texts) == 1:
+            return band_texts[0]
+
+        merged = []
+        for text in band_texts:
+            lines = [line for line in text.splitlines() if line.strip()]
+            if merged:
+                drop_tail, skip_head = self._find_overlap(merged, lines)
+                if drop_tail:
+                    del merged[-drop_tail:]
+                lines = lines[skip_head:]
+            merged.extend(lines)
+        return "\n".join(merged)
+
+    def _find_overlap(self, previous: list, current: list):
+        """
+        Pichle band ke end aur agle band ki shuruaat mein common lines dhoondhta hai.
+        Band ke kinare par aadhi kati hui ek line ko ignore kiya ja sakta hai.
+        Returns:
+            tuple: (pichle band se hatani wali trailing lines, agle band se skip karni wali leading lines)
+        """
+        def normalize(line):
+            return re.sub(r"\s+", " ", line).strip().lower()
+
+        max_lines = min(len(previous), len(current), 50)
+        tail = [normalize(line) for line in previous[-(max_lines + 1):]]
+        head = [normalize(line) for line in current[:max_lines + 1]]
+
+        best = (0, 0, 0) # (matched lines, drop_tail, skip_head)
+        for drop_tail in (0, 1):
+            for skip_head in (0, 1):
+                usable_tail = tail[:len(tail) - drop_tail] if drop_tail else tail
+                usable_head = head[skip_head:]
+                for size in range(min(len(usable_tail), len(usable_head)), best[0], -1):
+                    if usable_tail[-size:] == usable_head[:size]:
+                        best = (size, drop_tail, skip_head)
+                        break
+
+        matched, drop_tail, skip_head = best
+        if matched == 0:
+            return 0, 0
+        return drop_tail, skip_head + matched
\ No newline at end of file
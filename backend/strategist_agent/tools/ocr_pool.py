@@ -0,0 +1,284 @@
+import logging
+import os
+import re
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytesseract
+
+from backend.ai_agent_manager.deadline import check_deadline, limit_timeout
+
+try:
+    import tesserocr # Optional: har worker thread mein ek in-process Tesseract engine (model ek hi baar load hota hai)
+except ImportError:
+    tesserocr = None
+
+# Tesseract har page ke text ke baad yeh separator likhta hai; batch output ko isi se todte hain
+PAGE_SEPARATOR = "\f"
+
+# Single-frame formats jinhe tesseract seedha file se padh sakta hai (dobara PNG encode karne ki zaroorat nahi)
+NATIVE_FORMATS = ("PNG", "JPEG", "BMP")
+
+# Chalte tesseract process ke beech campaign cancel/deadline itne seconds mein check hoti hai
+CANCEL_POLL_SEC = 0.25
+
+# `tesseract --list-langs` ki pehli line: List of available languages in "/usr/share/tesseract-ocr/5/tessdata/" (3):
+_TESSDATA_LINE = re.compile(r'"([^"]+)"')
+
+
+class _EngineInitError(Exception):
+    """
+    Jab in-process engine (tesserocr) shuru nahi ho pata; pool tab CLI mode par chala jaata hai.
+    """
+    pass
+
+
+class OCRWorkerPool:
+    """
+    Yeh class long-lived OCR workers ka pool hai.
+    pytesseract har image ke liye naya tesseract process chalata hai aur har baar language model load hota hai.
+    tesserocr installed ho to har worker thread ka apna in-process Tesseract engine (PyTessBaseAPI) hota hai jo ek hi
+    baar model load karta hai aur phir har request ki images seedha memory se padhta hai; warm_up() saare engines pehle
+    se bana deta hai. tesserocr na ho (ya tessdata na mile) to pool images ko chunks mein baant kar har chunk ek tesseract
+    process mein (list-file batch mode) chalata hai, jisse startup ka kharcha kam se kam poore chunk par bant jaata hai.
+    """
+    def __init__(self, tesseract_cmd: str, workers: int = 0, batch_size: int = 8, lang: str = None,
+                 engine: str = "auto", tessdata_dir: str = None):
+        """
+        OCRWorkerPool ko initialize karta hai.
+        Args:
+            tesseract_cmd (str): Tesseract executable ka path ya naam.
+            workers (int): Worker threads ki sankhya. 0 ka matlab CPU count.
+            batch_size (int): Ek tesseract process mein maximum kitni images jayengi (CLI mode).
+            lang (str): Tesseract language (jaise 'eng'). None par tesseract default use hota hai.
+            engine (str): "auto" (tesserocr ho to in-process engines, warna CLI), "tesserocr" ya "cli".
+            tessdata_dir (str): Language data directory (in-process engines ke liye). None par TESSDATA_PREFIX
+                ya `tesseract --list-langs` se pata kiya jaata hai.
+        """
+        self.tesseract_cmd = tesseract_cmd
+        self.workers = workers if workers and workers > 0 else (os.cpu_count() or 1)
+        self.batch_size = max(1, int(batch_size))
+        self.lang = lang
+        self.tessdata_dir = tessdata_dir
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self.engine = "cli"
+        if engine in ("auto", "tesserocr"):
+            if tesserocr is not None:
+                self.engine = "tesserocr"
+            elif engine == "tesserocr":
+                self.logger.warning("OCR engine 'tesserocr' requested but tesserocr is not installed. Using the tesseract CLI.")
+
+        # Parallel workers ke saath tesseract ki OpenMP threading CPU ko oversubscribe karti hai.
+        # In-process engines process ka environment padhte hain, isliye wahan bhi (library load se pehle) set hota hai.
+        self._env = dict(os.environ)
+        if self.workers > 1:
+            self._env.setdefault("OMP_THREAD_LIMIT", "1")
+            if self.engine == "tesserocr":
+                os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+        self._local = threading.local() # Worker thread -> uska PyTessBaseAPI
+        self._engines = []
+        self._engines_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ocr-worker")
+        self.logger.info(f"OCRWorkerPool started with {self.workers} workers (engine: {self.engine}, batch size: {self.batch_size}).")
+
+    def ocr_images(self, images: list, timeout: float = None, deadline=None) -> list:
+        """
+        PIL images ki list ka OCR karta hai aur text usi order mein return karta hai.
+
+        Args:
+            images (list): PIL.Image objects.
+            timeout (float): Har tesseract process ka maximum samay (seconds).
+            deadline (Deadline): Campaign ka budget; cancel ya expire hone par chalte processes kill ho jaate hain.
+        Returns:
+            list: Har image ka extracted text (str).
+        Raises:
+            pytesseract.TesseractNotFoundError: Agar tesseract installed nahi hai.
+            pytesseract.TesseractError: Agar tesseract fail ho jaaye.
+            subprocess.TimeoutExpired: Agar koi tesseract process timeout se zyada chale.
+            CampaignAbortedError: Agar campaign cancel ya expire ho jaaye.
+        """
+        if not images:
+            return []
+
+        # Chunks ko workers mein barabar baantein taaki chhote batch bhi saare cores use karein
+        chunk_count = max(min(self.workers, len(images)), -(-len(images) // self.batch_size))
+        chunk_size = -(-len(images) // chunk_count)
+        chunks = [images[i:i + chunk_size] for i in range(0, len(images), chunk_size)]
+
+        futures = [self._executor.submit(self._run_batch, chunk, timeout, deadline) for chunk in chunks]
+        results = []
+        try:
+            for future in futures:
+                results.extend(future.result())
+        finally:
+            # Ek chunk fail (ya campaign abort) hone par baaki shuru na hue chunks na chalein
+            for future in futures:
+                future.cancel()
+        return results
+
+    def warm_up(self):
+        """
+        Har worker thread mein uska Tesseract engine bana deta hai (language model load), taaki pehli request ko
+        yeh kharcha na dena pade. CLI mode mein ek chhoti blank image ka OCR binary aur language data ko OS cache mein laata hai.
+        Returns:
+            int: Kitne in-process engines tayyar hain (CLI mode mein 0).
+        """
+        if self.engine == "tesserocr":
+            # Barrier har task ko alag worker thread par rokta hai, isliye har thread apna engine banata hai
+            barrier = threading.Barrier(self.workers)
+            def init_engine():
+                try:
+                    self._get_engine()
+                except _EngineInitError:
+                    barrier.abort()
+                    raise
+                try:
+                    barrier.wait(timeout=60)
+                except threading.BrokenBarrierError:
+                    pass
+            futures = [self._executor.submit(init_engine) for _ in range(self.workers)]
+            try:
+                for future in futures:
+                    future.result()
+            except _EngineInitError as e:
+                self._fall_back_to_cli(e)
+            else:
+                with self._engines_lock:
+                    return len(self._engines)
+        from PIL import Image
+        self.ocr_images([Image.new("L", (64, 32), 255)])
+        return 0
+
+    def shutdown(self, wait: bool = True):
+        """
+        Pool ke worker threads band karta hai aur unke engines ki memory chhodta hai.
+        """
+        self._executor.shutdown(wait=wait)
+        with self._engines_lock:
+            engines, self._engines = self._engines, []
+        for api in engines:
+            api.End()
+
+    def _run_batch(self, images, timeout, deadline=None):
+        check_deadline(deadline)
+        if self.engine == "tesserocr":
+            try:
+                return self._run_engine(images, timeout, deadline)
+            except _EngineInitError as e:
+                self._fall_back_to_cli(e)
+        with tempfile.TemporaryDirectory(prefix="ocr_batch_") as tmp_dir:
+            image_paths = []
+            for index, image in enumerate(images):
+                # Disk se khuli, bina badli image (jaise uploaded screenshot) ki original file hi tesseract ko dein
+                source_path = getattr(image, "filename", "")
+                if source_path and image.format in NATIVE_FORMATS and os.path.isfile(source_path):
+                    image_paths.append(os.path.abspath(source_path))
+                    continue
+                path = os.path.join(tmp_dir, f"{index}.png")
+                if image.mode not in ("1", "L", "RGB", "RGBA"):
+                    image = image.convert("RGB")
+                image.save(path, format="PNG", compress_level=1)
+                image_paths.append(path)
+
+            if len(image_paths) == 1:
+                return [self._run_tesseract(image_paths[0], timeout, deadline)]
+
+            list_path = os.path.join(tmp_dir, "images.txt")
+            with open(list_path, "w", encoding="utf-8") as f:
+                f.write("\n".join(image_paths) + "\n")
+
+            output = self._run_tesseract(list_path, timeout, deadline)
+            if output.endswith(PAGE_SEPARATOR):
+                output = output[:-len(PAGE_SEPARATOR)]
+            pages = output.split(PAGE_SEPARATOR)
+
+            if len(pages) != len(image_paths):
+                # Output ko images se match nahi kar paaye, to har image alag se chalayein
+                self.logger.warning(f"Batch OCR returned {len(pages)} pages for {len(image_paths)} images. Falling back to per-image OCR.")
+                return [self._run_tesseract(path, timeout, deadline).rstrip(PAGE_SEPARATOR) for path in image_paths]
+            return pages
+
+    def _fall_back_to_cli(self, error):
+        if self.engine != "cli":
+            self.engine = "cli"
+            self.logger.warning(f"In-process OCR engine unavailable ({error}). Falling back to the tesseract CLI.")
+
+    def _get_engine(self):
+        # Worker thread ka apna engine; PyTessBaseAPI threads ke beech share nahi hota
+        api = getattr(self._local, "api", None)
+        if api is None:
+            try:
+                api = tesserocr.PyTessBaseAPI(path=self._resolve_tessdata_dir(), lang=self.lang or "eng")
+            except RuntimeError as e:
+                raise _EngineInitError(e)
+            self._local.api = api
+            with self._engines_lock:
+                self._engines.append(api)
+        return api
+
+    def _resolve_tessdata_dir(self):
+        # tesserocr wheel ka compiled default path system tessdata nahi hota; CLI se poochte hain ki data kahan hai
+        if self.tessdata_dir is None:
+            path = os.environ.get("TESSDATA_PREFIX") or ""
+            if not path:
+                try:
+                    output = subprocess.run([self.tesseract_cmd, "--list-langs"], capture_output=True, text=True, timeout=30, env=self._env)
+                    match = _TESSDATA_LINE.search(output.stdout + output.stderr)
+                    path = match.group(1) if match else ""
+                except (OSError, subprocess.SubprocessError):
+                    path = ""
+            self.tessdata_dir = path
+        if not self.tessdata_dir:
+            return None
+        return os.path.join(self.tessdata_dir, "")
+
+    def _run_engine(self, images, timeout, deadline):
+        api = self._get_engine()
+        texts = []
+        for image in images:
+            # Engine chalte waqt beech mein roka nahi ja sakta; har image ka timeout hi baaki budget tak seemit hai
+            limit = limit_timeout(deadline, timeout)
+            if image.mode not in ("1", "L", "RGB", "RGBA"):
+                image = image.convert("RGB")
+            api.SetImage(image)
+            if not api.Recognize(timeout=max(1, int(limit * 1000)) if limit is not None else 0):
+                check_deadline(deadline)
+                raise subprocess.TimeoutExpired("tesseract", limit)
+            texts.append(api.GetUTF8Text())
+        api.Clear()
+        return texts
+
+    def _run_tesseract(self, input_path, timeout, deadline=None):
+        command = [self.tesseract_cmd, input_path, "stdout", "-c", f"page_separator={PAGE_SEPARATOR}"]
+        if self.lang:
+            command += ["-l", self.lang]
+        check_deadline(deadline)
+        try:
+            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=self._env)
+        except FileNotFoundError:
+            raise pytesseract.TesseractNotFoundError()
+
+        # Process ka intezaar chhote hisson mein, taaki timeout, cancel ya deadline par use turant kill kiya ja sake
+        started = time.monotonic()
+        try:
+            while True:
+                try:
+                    stdout, stderr = process.communicate(timeout=CANCEL_POLL_SEC)
+                    break
+                except subprocess.TimeoutExpired:
+                    check_deadline(deadline)
+                    if timeout is not None and time.monotonic() - started >= timeout:
+                        raise subprocess.TimeoutExpired(command, timeout)
+        finally:
+            if process.returncode is None:
+                process.kill()
+                process.communicate()
+
+        if process.returncode != 0:
+            raise pytesseract.TesseractError(process.returncode, stderr.decode("utf-8", errors="replace").strip())
+        return stdout.decode("utf-8", errors="replace")
@@ -1,9 +1,36 @@
 import logging
 import re
 
+# Default field definitions; config.toml ke [requirement_extractor.fields] inhe override kar sakte hain.
+# anchor: "line_start" (prefix line ki shuruaat mein) ya "anywhere" (line mein kahin bhi)
+# occurrence: "first" ya "last" match ki value rakhni hai
+# split: value ko is separator par tod kar list banayein (optional)
+DEFAULT_FIELDS = {
+    "product": {
+        "prefixes": ["product:", "product name:", "software:", "tool:", "ai solution:", "ai software:", "product\t", "product name\t"],
+        "anchor": "line_start",
+        "occurrence": "last",
+        "title_case": True
+    },
+    "audience": {
+        "prefixes": ["audience:", "target audience:", "demographic:", "audience\t", "target audience\t"],
+        "anchor": "line_start",
+        "occurrence": "last",
+        "title_case": True
+    },
+    "research_keywords": {
+        "prefixes": ["keywords:", "tags:", "keywords\t"],
+        "anchor": "anywhere",
+        "occurrence": "first",
+        "split": ","
+    }
+}
+
+
 class RequirementExtractor:
     """
     Yeh class raw text se campaign requirements ko extract karne ke liye hai.
+    Saare fields ke prefixes se init par ek compiled trie regex banta hai jo text par ek hi pass mein chalta hai.
     """
     def __init__(self, config):
         """
@@ -13,7 +40,44 @@ class RequirementExtractor:
         """
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.logger.info("RequirementExtractor initialized.")
+
+        configured_fields = config.get("requirement_extractor", {}).get("fields", {})
+        self.fields = {name: dict(definition) for name, definition in DEFAULT_FIELDS.items()}
+        for name, definition in configured_fields.items():
+            self.fields[name] = {**self.fields.get(name, {}), **definition}
+
+        self._prefix_fields = {} # lowercase prefix -> field ka naam
+        self.matcher = self._compile_matcher()
+        self.logger.info(f"RequirementExtractor initialized with fields: {list(self.fields)}")
+
+    def _compile_matcher(self):
+        """
+        Saare fields ke prefixes ka ek trie banata hai aur usse ek compiled regex mein badalta hai.
+        Trie ki wajah se regex engine har position par har prefix try nahi karta.
+        """
+        trie = {}
+        for name, definition in self.fields.items():
+            for prefix in definition.get("prefixes", []):
+                prefix = prefix.lower()
+                if not prefix or prefix in self._prefix_fields:
+                    continue
+                self._prefix_fields[prefix] = name
+                node = trie
+                for char in prefix:
+                    node = node.setdefault(char, {})
+                node[""] = True # Prefix yahan khatam hota hai
+
+        if not trie:
+            return None
+        return re.compile(self._trie_to_pattern(trie))
+
+    def _trie_to_pattern(self, node):
+        branches = [re.escape(char) + self._trie_to_pattern(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # Agar yahan bhi ek prefix khatam hota hai to aage ka hissa optional hai (greedy, lamba prefix pehle)
+        return f"(?:{pattern})?" if "" in node else pattern
 
     def extract(self, raw_text: str) -> dict:
         """
@@ -29,46 +93,53 @@ class RequirementExtractor:
         """
         try:
             self.logger.info("Starting requirement extraction from raw text.")
-            
-            # Text ko lowercase mein badal dein aur extra spaces hata dein
-            processed_text = raw_text.lower().strip()
-            
-            # Rule-based extraction ke liye keywords define karein
-            # Yeh keywords "config.toml" se bhi a sakte hain
-            product_keywords = ["product:", "product name:", "software:", "tool:", "ai solution:", "ai software:"]
-            audience_keywords = ["audience:", "target audience:", "demographic:"]
-            
-            # Keywords extraction ke liye placeholders
-            product = None
-            audience = None
-            research_keywords = []
-
-            # 1. Product aur Audience extract karein
-            for line in processed_text.split('\n'):
-                line = line.strip()
-                if not line:
-                    continue
 
-                for kw in product_keywords:
-                    if line.startswith(kw):
-                        product = line.replace(kw, '').strip().title()
-                        self.logger.info(f"Product extracted: {product}")
-                        break
-                
-                for kw in audience_keywords:
-                    if line.startswith(kw):
-                        audience = line.replace(kw, '').strip().title()
-                        self.logger.info(f"Audience extracted: {audience}")
-                        break
-
-            # 2. Keywords extract karein (ek simple heuristic ka upyog karke)
-            # Hum ek regex ka upyog karke kisi bhi line ke baad aane wale comma-separated words ko nikalenge
-            
-            # Ek simple regex pattern jo "keywords:" ya "tags:" ke baad words ko nikalta hai
-            keywords_match = re.search(r'(keywords:|tags:)(.*)', processed_text)
-            if keywords_match:
-                keywords_str = keywords_match.group(2).strip()
-                research_keywords = [kw.strip() for kw in keywords_str.split(',') if kw.strip()]
+            # Text ko lowercase mein badal dein; saare prefixes bhi lowercase mein hain
+            processed_text = raw_text.lower()
+
+            positions = {} # field -> value shuru hone ki position
+            if self.matcher is not None:
+                # Ek hi pass mein saare prefixes ke matches nikalein
+                line_start = 0
+                scanned_until = 0
+                last_match_line = -1
+                for match in self.matcher.finditer(processed_text):
+                    name = self._prefix_fields[match.group()]
+                    definition = self.fields[name]
+                    if name in positions and definition.get("occurrence", "first") == "first":
+                        continue
+
+                    start = match.start()
+                    newline = processed_text.rfind("\n", scanned_until, start)
+                    if newline != -1:
+                        line_start = newline + 1
+                    scanned_until = start
+                    first_on_line = last_match_line != line_start
+                    last_match_line = line_start
+
+                    if definition.get("anchor", "line_start") == "line_start":
+                        # Prefix se pehle line mein sirf whitespace hona chahiye
+                        if not first_on_line or processed_text[line_start:start].strip():
+                            continue
+                    positions[name] = match.end()
+
+            values = {}
+            for name, position in positions.items():
+                line_end = processed_text.find("\n", position)
+                values[name] = processed_text[position:line_end if line_end != -1 else len(processed_text)]
+
+            extracted_requirements = {}
+            for name, definition in self.fields.items():
+                extracted_requirements[name] = self._finalize_value(values.get(name), definition)
+
+            product = extracted_requirements.get("product")
+            audience = extracted_requirements.get("audience")
+            research_keywords = extracted_requirements.get("research_keywords") or []
+            if product:
+                self.logger.info(f"Product extracted: {product}")
+            if audience:
+                self.logger.info(f"Audience extracted: {audience}")
+            if research_keywords:
                 self.logger.info(f"Keywords extracted: {research_keywords}")
 
             # Agar koi keywords nahi mile, to product aur audience ko keywords ke roop mein add karein
@@ -76,21 +147,28 @@ class RequirementExtractor:
                 research_keywords.append(product)
             if not research_keywords and audience:
                 research_keywords.append(audience)
+            extracted_requirements["research_keywords"] = research_keywords
 
             # Ek final check karein ki zaroori jaankari mili hai ya nahi
             if not product and not audience:
                 self.logger.warning("Could not extract main product or audience from the text.")
-            
-            extracted_requirements = {
-                "product": product,
-                "audience": audience,
-                "research_keywords": research_keywords
-            }
-            
-            self.logger.info(f"Requirement extraction finished. Final requirements: {extracted_requirements}")
+
+            self.logger.info("Requirement extraction finished. Final requirements: %s", extracted_requirements)
 
             return {"status": "success", "requirements": extracted_requirements, "message": "Requirements extracted successfully."}
 
         except Exception as e:
             self.logger.error(f"An unexpected error occurred during requirement extraction: {e}", exc_info=True)
-            return {"status": "error", "message": f"Failed to extract requirements: {e}"}
\ No newline at end of file
+            return {"status": "error", "message": f"Failed to extract requirements: {e}"}
+
+    def _finalize_value(self, value, definition):
+        separator = definition.get("split")
+        if value is None:
+            return [] if separator else None
+
+        value = value.strip()
+        if separator:
+            return [item.strip() for item in value.split(separator) if item.strip()]
+        if not value:
+            return None
+        return value.title() if definition.get("title_case") else value
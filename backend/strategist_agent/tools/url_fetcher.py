@@ -0,0 +1,227 @@
+import asyncio
+import hashlib
+import html
+import json
+import logging
+import os
+import re
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from backend.ai_agent_manager.deadline import check_deadline, limit_timeout
+from backend.strategist_agent.tools.disk_cache import DiskCache
+
+# HTML ko text mein badalne ke liye pehle se compiled patterns
+_INVISIBLE_BLOCKS = re.compile(r"<(script|style|noscript|template|svg|iframe)\b[^>]*>.*?</\1\s*>|<!--.*?-->", re.IGNORECASE | re.DOTALL)
+_BLOCK_TAGS = re.compile(r"<\s*/?\s*(?:p|div|br|li|ul|ol|tr|td|th|table|h[1-6]|section|article|header|footer|blockquote|pre|title|hr)\b[^>]*>", re.IGNORECASE)
+_ANY_TAG = re.compile(r"<[^>]+>")
+_HORIZONTAL_SPACE = re.compile(r"[ \t\r\f\v\xa0]+")
+_CHARSET = re.compile(r"charset=[\"']?([\w-]+)", re.IGNORECASE)
+
+
+def html_to_text(markup: str) -> str:
+    """
+    HTML markup se padhne layak text nikalta hai.
+    Script/style jaise hisse hata diye jaate hain aur block tags ko newlines mein badla jaata hai.
+    """
+    markup = _INVISIBLE_BLOCKS.sub(" ", markup)
+    markup = _BLOCK_TAGS.sub("\n", markup)
+    markup = _ANY_TAG.sub(" ", markup)
+    text = html.unescape(markup)
+    lines = (_HORIZONTAL_SPACE.sub(" ", line).strip() for line in text.split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+class ResponseTooLargeError(requests.exceptions.RequestException):
+    """
+    Jab response body configured byte limit se badi ho tab raise hota hai.
+    """
+    pass
+
+
+class URLFetcher:
+    """
+    Yeh class URLs se content fetch karti hai.
+    Ek shared pooled requests.Session use hota hai, body streaming mein byte limit ke saath padhi jaati hai,
+    aur ETag/Last-Modified ke basis par local store se conditional GET revalidation hoti hai. Local store
+    (data_dir/cache/http) ExtractionCache jaisa size-capped DiskCache hai: har URL ki ek file (metadata ki JSON line + body),
+    aur store_max_mb se upar sabse purane use hue URLs hat jaate hain.
+    """
+    def __init__(self, config):
+        """
+        URLFetcher ko initialize karta hai.
+        Args:
+            config (dict): Application ki configuration settings.
+        """
+        self.config = config
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        fetcher_config = config.get("url_fetcher", {})
+        self.timeout = fetcher_config.get("timeout_sec", 10)
+        self.max_bytes = int(fetcher_config.get("max_bytes", 5 * 1024 * 1024))
+        self.chunk_size = int(fetcher_config.get("chunk_size", 64 * 1024))
+        pool_size = int(fetcher_config.get("pool_size", 20))
+
+        data_dir = config.get("paths", {}).get("data_dir", "backend/data")
+        self.store_dir = os.path.join(data_dir, "cache", "http")
+        self.store = DiskCache(self.store_dir, int(float(fetcher_config.get("store_max_mb", 256)) * 1024 * 1024), suffix=".http")
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"User-Agent": fetcher_config.get("user_agent", "AIContentCreatorAgent/0.1")})
+        self.logger.info(f"URLFetcher initialized (max bytes: {self.max_bytes}, pool size: {pool_size}).")
+
+    def fetch(self, url: str, deadline=None) -> dict:
+        """
+        URL ka content fetch karta hai aur HTML ho to text mein badal deta hai.
+        Agar pehle ka stored version hai to conditional GET bhejta hai; 304 par stored body use hoti hai.
+
+        Args:
+            url (str): Fetch karne wala URL.
+            deadline (Deadline): Campaign ka budget; request timeout baaki budget tak seemit hota hai aur body
+                padhte waqt har chunk par cancel/deadline check hoti hai.
+        Returns:
+            dict: {"text": "...", "content_type": "...", "from_store": bool}
+        Raises:
+            requests.exceptions.RequestException: Network/HTTP errors aur ResponseTooLargeError.
+            CampaignAbortedError: Agar campaign cancel ya expire ho jaaye.
+        """
+        stored, stored_body = self._load_entry(url)
+        headers = {}
+        if stored:
+            if stored.get("etag"):
+                headers["If-None-Match"] = stored["etag"]
+            if stored.get("last_modified"):
+                headers["If-Modified-Since"] = stored["last_modified"]
+
+        with self.session.get(url, headers=headers, timeout=limit_timeout(deadline, self.timeout), stream=True) as response:
+            if response.status_code == 304 and stored:
+                self.logger.info(f"Content not modified, using stored copy for: {url}")
+                return self._to_result(stored_body, stored.get("content_type", ""), stored.get("encoding"), True)
+
+            response.raise_for_status()
+            body = self._read_limited(response, deadline)
+            content_type = response.headers.get("Content-Type", "")
+            encoding = self._detect_encoding(content_type, body)
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+        if etag or last_modified:
+            self._save_entry(url, body, {"etag": etag, "last_modified": last_modified, "content_type": content_type, "encoding": encoding})
+        return self._to_result(body, content_type, encoding, False)
+
+    async def fetch_async(self, url: str, client=None) -> dict:
+        """
+        fetch() ka non-blocking version, ASGI serving mode ke liye.
+        httpx.AsyncClient diya ho to request event loop par hi hoti hai; warna blocking fetch()
+        default executor mein chalta hai. Local store aur byte limit dono raaston mein same hain; store ki file I/O
+        thread mein hoti hai taaki event loop na ruke.
+
+        Args:
+            url (str): Fetch karne wala URL.
+            client (httpx.AsyncClient): Shared async HTTP client (optional).
+        Returns:
+            dict: {"text": "...", "content_type": "...", "from_store": bool}
+        """
+        if client is None:
+            return await asyncio.get_running_loop().run_in_executor(None, self.fetch, url)
+
+        stored, stored_body = await asyncio.to_thread(self._load_entry, url)
+        headers = {}
+        if stored:
+            if stored.get("etag"):
+                headers["If-None-Match"] = stored["etag"]
+            if stored.get("last_modified"):
+                headers["If-Modified-Since"] = stored["last_modified"]
+
+        async with client.stream("GET", url, headers=headers, timeout=self.timeout, follow_redirects=True) as response:
+            if response.status_code == 304 and stored:
+                self.logger.info(f"Content not modified, using stored copy for: {url}")
+                return self._to_result(stored_body, stored.get("content_type", ""), stored.get("encoding"), True)
+
+            response.raise_for_status()
+            declared = response.headers.get("Content-Length")
+            if declared and declared.isdigit() and int(declared) > self.max_bytes:
+                raise ResponseTooLargeError(f"Response size {declared} bytes exceeds limit of {self.max_bytes} bytes.")
+            chunks = []
+            received = 0
+            async for chunk in response.aiter_bytes(self.chunk_size):
+                received += len(chunk)
+                if received > self.max_bytes:
+                    raise ResponseTooLargeError(f"Response exceeded limit of {self.max_bytes} bytes.")
+                chunks.append(chunk)
+            body = b"".join(chunks)
+            content_type = response.headers.get("Content-Type", "")
+            encoding = self._detect_encoding(content_type, body)
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+        if etag or last_modified:
+            await asyncio.to_thread(self._save_entry, url, body, {"etag": etag, "last_modified": last_modified, "content_type": content_type, "encoding": encoding})
+        return self._to_result(body, content_type, encoding, False)
+
+    def _read_limited(self, response, deadline=None) -> bytes:
+        declared = response.headers.get("Content-Length")
+        if declared and declared.isdigit() and int(declared) > self.max_bytes:
+            raise ResponseTooLargeError(f"Response size {declared} bytes exceeds limit of {self.max_bytes} bytes.")
+
+        chunks = []
+        received = 0
+        for chunk in self._iter_body(response, deadline):
+            # Request timeout har read par lagta hai; dheemi trickling body ko deadline hi rokti hai
+            check_deadline(deadline)
+            received += len(chunk)
+            if received > self.max_bytes:
+                raise ResponseTooLargeError(f"Response exceeded limit of {self.max_bytes} bytes.")
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    def _iter_body(self, response, deadline):
+        # iter_content poora chunk_size milne tak rukta hai; deadline ho to read1 (urllib3 2.x) jo aaya wahi deta hai,
+        # taaki dheemi body par bhi cancel check hota rahe
+        read1 = getattr(response.raw, "read1", None)
+        if deadline is None or read1 is None:
+            yield from response.iter_content(chunk_size=self.chunk_size)
+            return
+        while True:
+            chunk = read1(self.chunk_size, decode_content=True)
+            if not chunk:
+                return
+            yield chunk
+
+    def _detect_encoding(self, content_type, body):
+        match = _CHARSET.search(content_type)
+        if not match:
+            # HTML ke <meta charset> ko shuru ke hisse mein dhoondhein
+            match = _CHARSET.search(body[:2048].decode("ascii", errors="ignore"))
+        return match.group(1) if match else "utf-8"
+
+    def _to_result(self, body, content_type, encoding, from_store):
+        try:
+            text = body.decode(encoding or "utf-8", errors="replace")
+        except LookupError:
+            text = body.decode("utf-8", errors="replace")
+        if "html" in content_type.lower() or text.lstrip()[:15].lower().startswith(("<!doctype html", "<html")):
+            text = html_to_text(text)
+        return {"text": text, "content_type": content_type, "from_store": from_store}
+
+    def _store_key(self, url):
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _load_entry(self, url):
+        # Entry ek hi file mein (pehli line metadata JSON, baaki body), isliye metadata aur body hamesha saath milte hain
+        data = self.store.read(self._store_key(url))
+        if data is None:
+            return None, None
+        meta_line, _, body = data.partition(b"\n")
+        try:
+            return json.loads(meta_line), body
+        except ValueError:
+            self.store.delete(self._store_key(url))
+            return None, None
+
+    def _save_entry(self, url, body, meta):
+        self.store.write(self._store_key(url), json.dumps(meta).encode("utf-8") + b"\n" + body)
@@ -0,0 +1,83 @@
+"""
+Near-duplicate brief index benchmark: bade index (lakhon stored briefs) par fingerprint, lookup (miss aur
+near-duplicate hit) latency, startup par load time aur peak RSS.
+Stored briefs seedha SQLite mein bulk insert hote hain (random fingerprints) taaki bada index jaldi bane.
+
+Chalane ke liye (project root se):
+    python -m benchmarks.brief_index --entries 100000 1000000
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import corpora
+from benchmarks.harness import measure, peak_rss_mb
+
+
+def populate(db_path: str, entries: int, seed: int = 0):
+    from backend.strategist_agent.tools.brief_index import BriefIndex, _to_signed
+    BriefIndex({"brief_index": {"path": db_path}}) # Table banata hai
+    rng = random.Random(seed)
+    plan = json.dumps({"product": "Clipster", "audience": "creators", "research_keywords": ["ai", "editing"]})
+    now = time.time()
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany("INSERT INTO briefs (fingerprint, action_plan, created_at) VALUES (?, ?, ?)",
+                         ((_to_signed(rng.getrandbits(64)), plan, now) for _ in range(entries)))
+
+
+def run_case(entries: int, iterations: int) -> dict:
+    from backend.strategist_agent.tools.brief_index import BriefIndex
+    with tempfile.TemporaryDirectory(prefix="bench_brief_index_") as workdir:
+        db_path = os.path.join(workdir, "brief_index.db")
+        populate(db_path, entries)
+
+        start = time.perf_counter()
+        index = BriefIndex({"brief_index": {"path": db_path}})
+        load_seconds = time.perf_counter() - start
+
+        brief = corpora.brief_text(3000, seed=1)
+        edited = brief.replace("Campaign Brief", "Campaign Brief (updated 2026-10-18)", 1)
+        fingerprint = index.fingerprint(brief)
+        index.add(fingerprint, {"product": "Clipster", "audience": "creators", "research_keywords": []})
+        edited_fingerprint = index.fingerprint(edited)
+        unrelated_fingerprint = index.fingerprint(corpora.brief_text(3000, seed=99))
+
+        hit = index.find(edited_fingerprint)
+        return {
+            "entries": entries,
+            "load_seconds": round(load_seconds, 2),
+            "fingerprint_3kb": measure(lambda: index.fingerprint(edited), iterations=iterations),
+            "find_near_duplicate": measure(lambda: index.find(edited_fingerprint), iterations=iterations * 10),
+            "find_miss": measure(lambda: index.find(unrelated_fingerprint), iterations=iterations * 10),
+            "near_duplicate_similarity": hit["similarity"] if hit else None,
+            "peak_rss_mb": round(peak_rss_mb(), 1),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure SimHash brief index lookups at scale.")
+    parser.add_argument("--entries", nargs="+", type=int, default=[10000, 100000, 1000000])
+    parser.add_argument("--iterations", type=int, default=100)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    results = []
+    for entries in args.entries:
+        result = run_case(entries, args.iterations)
+        results.append(result)
+        print(f"{entries} entries: find p50 {result['find_near_duplicate']['p50_ms']} ms (hit), "
+              f"{result['find_miss']['p50_ms']} ms (miss), load {result['load_seconds']} s", file=sys.stderr)
+
+    print(json.dumps({"benchmark": "brief_index", "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
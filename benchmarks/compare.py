@@ -0,0 +1,66 @@
+"""
+Do benchmark result files (run_suite ka JSON output) ko compare karta hai.
+p50/p99 latency aur throughput ka relative badlav dikhata hai. Agar kisi case ka p50 threshold se
+zyada badh gaya ho to exit code 1 hota hai, taaki CI mein regression pakda ja sake.
+
+    python -m benchmarks.compare base.json head.json --threshold 0.10
+"""
+import argparse
+import json
+import sys
+
+
+def _change(old, new):
+    if not old or new is None:
+        return None
+    return (new - old) / old
+
+
+def compare(base: dict, head: dict, threshold: float) -> tuple:
+    """
+    Returns:
+        tuple: (rows, regressions) jahan har row ek case ka comparison hai.
+    """
+    rows = []
+    regressions = []
+    for name in sorted(set(base["results"]) & set(head["results"])):
+        old, new = base["results"][name], head["results"][name]
+        if old.get("status") != "ok" or new.get("status") != "ok":
+            rows.append((name, None, None, None, f"{old.get('status')} -> {new.get('status')}"))
+            continue
+        p50 = _change(old["p50_ms"], new["p50_ms"])
+        p99 = _change(old["p99_ms"], new["p99_ms"])
+        throughput = _change(old.get("throughput_per_sec"), new.get("throughput_per_sec"))
+        note = ""
+        if p50 is not None and p50 > threshold:
+            note = "REGRESSION"
+            regressions.append(name)
+        rows.append((name, p50, p99, throughput, note))
+    return rows, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files.")
+    parser.add_argument("base")
+    parser.add_argument("head")
+    parser.add_argument("--threshold", type=float, default=0.10, help="p50 mein allowed relative badhot (0.10 = 10%%)")
+    args = parser.parse_args()
+
+    with open(args.base, encoding="utf-8") as f:
+        base = json.load(f)
+    with open(args.head, encoding="utf-8") as f:
+        head = json.load(f)
+
+    rows, regressions = compare(base, head, args.threshold)
+
+    def fmt(value):
+        return "     n/a" if value is None else f"{value * 100:+7.1f}%"
+
+    print(f"{'case':40} {'p50':>8} {'p99':>8} {'thrpt':>8}")
+    for name, p50, p99, throughput, note in rows:
+        print(f"{name:40} {fmt(p50)} {fmt(p99)} {fmt(throughput)} {note}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Benchmarks ke liye synthetic inputs banata hai. Koi network ya bahari file nahi chahiye.
+Sabhi generators deterministic hain (fixed seed) taaki commits ke beech results compare ho sakein.
+"""
+import base64
+import io
+import os
+import random
+import zipfile
+from xml.sax.saxutils import escape
+
+import docx
+import fitz # PyMuPDF library
+from PIL import Image, ImageDraw
+
+BRIEF_LINES = [
+    "Campaign Brief",
+    "Product: Clipster AI Editor",
+    "Target Audience: gamers",
+    "Keywords: gaming, shorts, ai editing, highlights",
+    "Required length: 15-60s",
+    "Platforms: youtube, instagram",
+]
+FILLER_WORDS = ["clip", "viral", "creator", "gaming", "stream", "shorts", "edit", "music", "brand", "launch", "trend", "hook"]
+
+
+def brief_text(size_bytes: int, seed: int = 0) -> str:
+    """
+    Brief fields ke saath filler paragraphs wala lagbhag size_bytes lamba text.
+    """
+    rng = random.Random(seed)
+    lines = list(BRIEF_LINES)
+    total = sum(len(line) + 1 for line in lines)
+    while total < size_bytes:
+        line = " ".join(rng.choice(FILLER_WORDS) for _ in range(rng.randint(6, 18)))
+        lines.append(line)
+        total += len(line) + 1
+    return "\n".join(lines)
+
+
+def screenshot(width: int, height: int, seed: int = 0) -> Image.Image:
+    """
+    Campaign brief jaisa text render kiya hua screenshot.
+    """
+    image = Image.new("RGB", (width, height), "white")
+    draw = ImageDraw.Draw(image)
+    lines = brief_text(max(256, width * height // 400), seed).split("\n")
+    y = 20
+    for line in lines:
+        if y > height - 30:
+            break
+        draw.text((20, y), line[: max(10, width // 7)], fill="black")
+        y += 24
+    return image
+
+
+def screenshot_base64(width: int, height: int, seed: int = 0) -> str:
+    buffer = io.BytesIO()
+    screenshot(width, height, seed).save(buffer, format="PNG")
+    return base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def write_text_file(directory: str, size_bytes: int, seed: int = 0) -> str:
+    path = os.path.join(directory, f"brief_{size_bytes}.txt")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(brief_text(size_bytes, seed))
+    return path
+
+
+def write_pdf(directory: str, pages: int, seed: int = 0) -> str:
+    """
+    Har page par brief text wala PDF banata hai.
+    """
+    path = os.path.join(directory, f"brief_{pages}p.pdf")
+    text = brief_text(1800, seed)
+    with fitz.open() as doc:
+        for _ in range(pages):
+            page = doc.new_page()
+            page.insert_textbox(fitz.Rect(50, 50, 550, 800), text, fontsize=9)
+        doc.save(path)
+    return path
+
+
+def write_docx(directory: str, paragraphs: int, table_rows: int = 0, seed: int = 0) -> str:
+    """
+    Paragraphs aur (optional) ek table wala DOCX banata hai.
+    """
+    path = os.path.join(directory, f"brief_{paragraphs}para_{table_rows}rows.docx")
+    rng = random.Random(seed)
+    document = docx.Document()
+    for line in BRIEF_LINES:
+        document.add_paragraph(line)
+    for _ in range(paragraphs):
+        document.add_paragraph(" ".join(rng.choice(FILLER_WORDS) for _ in range(rng.randint(8, 30))))
+    if table_rows:
+        table = document.add_table(rows=table_rows, cols=2)
+        for row in table.rows:
+            row.cells[0].text = rng.choice(FILLER_WORDS)
+            row.cells[1].text = " ".join(rng.choice(FILLER_WORDS) for _ in range(5))
+    document.save(path)
+    return path
+
+
+_DOCX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+_DOCX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+
+def write_large_docx(directory: str, paragraphs: int, table_rows: int = 0, seed: int = 0) -> str:
+    """
+    write_docx jaisa hi content, lekin document.xml seedha likha jaata hai. python-docx se hazaron
+    paragraphs add karna quadratic time leta hai, isliye bade benchmark documents isse bante hain.
+    """
+    path = os.path.join(directory, f"brief_large_{paragraphs}para_{table_rows}rows.docx")
+    rng = random.Random(seed)
+
+    def paragraph(text):
+        return f'<w:p><w:r><w:t xml:space="preserve">{escape(text)}</w:t></w:r></w:p>'
+
+    parts = ['<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+             '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>']
+    parts.extend(paragraph(line) for line in BRIEF_LINES)
+    for _ in range(paragraphs):
+        parts.append(paragraph(" ".join(rng.choice(FILLER_WORDS) for _ in range(rng.randint(8, 30)))))
+    if table_rows:
+        parts.append("<w:tbl>")
+        for _ in range(table_rows):
+            cells = (rng.choice(FILLER_WORDS), " ".join(rng.choice(FILLER_WORDS) for _ in range(5)))
+            parts.append("<w:tr>" + "".join(f"<w:tc>{paragraph(cell)}</w:tc>" for cell in cells) + "</w:tr>")
+        parts.append("</w:tbl>")
+    parts.append("<w:sectPr/></w:body></w:document>")
+
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", _DOCX_CONTENT_TYPES)
+        archive.writestr("_rels/.rels", _DOCX_RELS)
+        archive.writestr("word/document.xml", "".join(parts))
+    return path
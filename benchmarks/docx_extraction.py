@@ -0,0 +1,82 @@
+"""
+DOCX extraction benchmark: purana python-docx path (poora object model, sirf paragraphs) aur
+naya streaming reader (word/document.xml ka incremental parse, paragraphs + tables) bade documents par.
+Har variant alag (spawned) process mein chalta hai taaki peak RSS usi variant ka ho.
+
+Chalane ke liye (project root se):
+    python -m benchmarks.docx_extraction --sizes 2000:200 100000:10000
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import corpora
+from benchmarks.harness import measure
+
+
+def python_docx_text(path):
+    # DocumentParser ka pehle wala docx_file branch
+    import docx
+    extracted_text = ""
+    for para in docx.Document(path).paragraphs:
+        extracted_text += para.text + '\n'
+    return extracted_text
+
+
+def streaming_text(path):
+    from backend.strategist_agent.tools.docx_reader import extract_docx_text
+    return extract_docx_text(path)
+
+
+VARIANTS = {"python_docx": python_docx_text, "streaming": streaming_text}
+
+
+def _run_variant(name, path, iterations, result_queue):
+    logging.disable(logging.WARNING)
+    func = VARIANTS[name]
+    text = func(path)
+    stats = measure(lambda: func(path), iterations=iterations)
+    stats["chars"] = len(text)
+    result_queue.put(stats)
+
+
+def run_variant(name, path, iterations):
+    context = multiprocessing.get_context("spawn")
+    result_queue = context.Queue()
+    process = context.Process(target=_run_variant, args=(name, path, iterations, result_queue))
+    process.start()
+    try:
+        return result_queue.get()
+    finally:
+        process.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare python-docx and streaming DOCX extraction.")
+    parser.add_argument("--sizes", nargs="+", default=["2000:200", "20000:2000", "100000:10000"], help="paragraphs:table_rows jodiyan")
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench_docx_") as workdir:
+        for size in args.sizes:
+            paragraphs, table_rows = (int(part) for part in size.split(":"))
+            path = corpora.write_large_docx(workdir, paragraphs, table_rows)
+            entry = {"paragraphs": paragraphs, "table_rows": table_rows, "file_kb": round(os.path.getsize(path) / 1024, 1)}
+            for name in VARIANTS:
+                entry[name] = run_variant(name, path, args.iterations)
+            entry["speedup_p50"] = round(entry["python_docx"]["p50_ms"] / entry["streaming"]["p50_ms"], 2)
+            results.append(entry)
+            print(f"{size}: python-docx {entry['python_docx']['p50_ms']} ms, streaming {entry['streaming']['p50_ms']} ms", file=sys.stderr)
+
+    print(json.dumps({"benchmark": "docx_extraction", "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
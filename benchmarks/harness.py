@@ -0,0 +1,58 @@
+"""
+Benchmark timing helpers: latency percentiles, throughput aur peak RSS.
+"""
+import resource
+import sys
+import time
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """
+    Pehle se sorted values ka nearest-rank percentile.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1)))))
+    return sorted_values[rank]
+
+
+def peak_rss_mb() -> float:
+    """
+    Is process ki ab tak ki peak resident memory (MB).
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux par KB, macOS par bytes mein milta hai
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def measure(func, iterations: int, warmup: int = 1, units_per_call: float = 1.0) -> dict:
+    """
+    func() ko warmup ke baad iterations baar chalata hai aur stats return karta hai.
+
+    Args:
+        func (callable): Bina argument wala function jiska time naapna hai.
+        iterations (int): Naapi jaane wali calls.
+        warmup (int): Shuruaati calls jo stats mein shamil nahi hoti.
+        units_per_call (float): Throughput ke liye ek call mein kitni units (pages, images, bytes) process hoti hain.
+    Returns:
+        dict: iterations, p50/p99/mean latency (ms), throughput (units/sec) aur peak RSS.
+    """
+    for _ in range(warmup):
+        func()
+
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+    total = sum(latencies)
+    return {
+        "iterations": iterations,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "mean_ms": round(total / iterations * 1000, 3),
+        "throughput_per_sec": round(units_per_call * iterations / total, 3) if total else None,
+        "peak_rss_mb": round(peak_rss_mb(), 1)
+    }
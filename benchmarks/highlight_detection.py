@@ -0,0 +1,135 @@
+"""
+Storyteller highlight detection benchmark, synthetic media par: shaant background audio/frames mein kuch known
+"events" (tez awaaz aur zyada motion) daale jaate hain. Vectorized HighlightDetector aur ek seedha per-frame Python loop
+(same scoring) ka time, aur kya detector ki top clips injected events ko pakadti hain.
+
+Chalane ke liye (project root se):
+    python -m benchmarks.highlight_detection --minutes 60 --naive-minutes 5
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+import wave
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.harness import peak_rss_mb
+
+SAMPLE_RATE = 8000
+FPS = 2
+FRAME_SHAPE = (36, 64)
+
+
+def synthetic_media(minutes: float, events: list, seed: int = 0):
+    """
+    Returns:
+        tuple: (int16 mono samples, uint8 frames (n, 36, 64))
+    """
+    rng = np.random.default_rng(seed)
+    duration = int(minutes * 60)
+    samples = (rng.standard_normal(duration * SAMPLE_RATE) * 800).astype(np.int16)
+    base_frame = rng.integers(0, 255, FRAME_SHAPE, dtype=np.uint8)
+    frames = np.repeat(base_frame[None], duration * FPS, axis=0)
+    frames = np.clip(frames.astype(np.int16) + rng.integers(-3, 4, frames.shape), 0, 255).astype(np.uint8)
+    for start, length in events:
+        audio = slice(start * SAMPLE_RATE, (start + length) * SAMPLE_RATE)
+        samples[audio] = (rng.standard_normal(length * SAMPLE_RATE) * 9000).clip(-32000, 32000).astype(np.int16)
+        frames[start * FPS:(start + length) * FPS] = rng.integers(0, 255, (length * FPS,) + FRAME_SHAPE, dtype=np.uint8)
+    return samples, frames
+
+
+def write_wav(path: str, samples: np.ndarray):
+    with wave.open(path, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(SAMPLE_RATE)
+        wav_file.writeframes(samples.tobytes())
+
+
+def naive_detect(samples, frames, resolution_sec, window_sec, top_k):
+    # Pehle jaisa seedha tareeka: har hop/frame/window par Python loop
+    hop = int(SAMPLE_RATE * resolution_sec)
+    energy = []
+    for index in range(len(samples) // hop):
+        total = 0.0
+        for value in samples[index * hop:(index + 1) * hop].tolist():
+            total += (value / 32767.0) ** 2
+        energy.append((total / hop) ** 0.5)
+    frame_list = [frame.astype(int).tolist() for frame in frames]
+    motion = [0.0]
+    for previous, current in zip(frame_list, frame_list[1:]):
+        diff = sum(abs(a - b) for row_a, row_b in zip(previous, current) for a, b in zip(row_a, row_b))
+        motion.append(diff / (FRAME_SHAPE[0] * FRAME_SHAPE[1]))
+    steps_per_frame = int(round(1.0 / (FPS * resolution_sec)))
+    scores = [energy[index] + motion[min(len(motion) - 1, index // steps_per_frame)] for index in range(len(energy))]
+    window = int(window_sec / resolution_sec)
+    sums = [sum(scores[start:start + window]) for start in range(len(scores) - window + 1)]
+    picks = []
+    for start in sorted(range(len(sums)), key=lambda index: sums[index], reverse=True):
+        if all(abs(start - chosen) >= window for chosen in picks):
+            picks.append(start)
+            if len(picks) == top_k:
+                break
+    return picks
+
+
+def run_detector(detector, samples, frames, workdir, clip_length, top_k):
+    wav_path = os.path.join(workdir, "audio.wav")
+    write_wav(wav_path, samples)
+    start = time.perf_counter()
+    result = detector.detect_from_wav(wav_path, frames=frames, fps=FPS, clip_length=clip_length, top_k=top_k)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark vectorized highlight detection on synthetic media.")
+    parser.add_argument("--minutes", type=float, default=60)
+    parser.add_argument("--naive-minutes", type=float, default=5)
+    parser.add_argument("--clip-sec", type=int, default=30)
+    parser.add_argument("--top-k", type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    from backend.storyteller_agent.tools.highlight_detector import HighlightDetector
+    detector = HighlightDetector({})
+    clip_length = f"{args.clip_sec}s"
+    duration = int(args.minutes * 60)
+    events = [(int(duration * fraction), args.clip_sec) for fraction in (0.2, 0.55, 0.85)][:args.top_k]
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="bench_highlights_") as workdir:
+        samples, frames = synthetic_media(args.minutes, events)
+        result, seconds = run_detector(detector, samples, frames, workdir, clip_length, args.top_k)
+        found = [highlight["start_sec"] for highlight in result["highlights"]]
+        hits = sum(any(abs(start - event_start) <= args.clip_sec / 2 for start in found) for event_start, _ in events)
+        results["vectorized"] = {"minutes": args.minutes, "seconds": round(seconds, 3), "events": len(events),
+                                 "events_found": hits, "highlights": result["highlights"], "peak_rss_mb": round(peak_rss_mb(), 1)}
+        print(f"vectorized ({args.minutes} min): {seconds:.3f} s, {hits}/{len(events)} events found", file=sys.stderr)
+
+        if args.naive_minutes:
+            short_duration = int(args.naive_minutes * 60)
+            short_events = [(int(short_duration * 0.4), args.clip_sec)]
+            samples, frames = synthetic_media(args.naive_minutes, short_events, seed=1)
+            start = time.perf_counter()
+            naive_detect(samples, frames, detector.resolution_sec, args.clip_sec, 1)
+            naive_seconds = time.perf_counter() - start
+            _, vectorized_seconds = run_detector(detector, samples, frames, workdir, clip_length, 1)
+            results["naive_comparison"] = {
+                "minutes": args.naive_minutes,
+                "naive_seconds": round(naive_seconds, 3),
+                "vectorized_seconds": round(vectorized_seconds, 3),
+                "speedup": round(naive_seconds / vectorized_seconds, 1),
+            }
+            print(f"naive ({args.naive_minutes} min): {naive_seconds:.3f} s vs vectorized {vectorized_seconds:.3f} s", file=sys.stderr)
+
+    print(json.dumps({"benchmark": "highlight_detection", "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
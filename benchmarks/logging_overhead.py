@@ -0,0 +1,135 @@
+"""
+Logging overhead benchmark: Strategist.run (text brief, poora extraction + requirement path) ki latency
+in setups mein — logging band, purana synchronous FileHandler + StreamHandler, naya queue-based JSON logging
+(background writer), aur wahi config.toml ke per-logger rate limits ke saath. Har setup alag (spawned) process mein
+chalta hai; console output /dev/null par jaata hai. Request threads parallel mein chalte hain taaki handler lock par
+contention bhi dikhe. --disk-delay-ms har log file flush mein deri jodta hai (dheemi ya busy disk).
+
+Chalane ke liye (project root se):
+    python -m benchmarks.logging_overhead --iterations 300 --threads 4 --disk-delay-ms 0 1
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import toml
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import corpora
+from benchmarks.harness import measure
+
+MODES = ("disabled", "sync", "queued", "queued_rate_limited")
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config.toml")
+
+
+class SlowStream:
+    """
+    File stream jiska har flush disk_delay_ms leta hai.
+    """
+    def __init__(self, stream, delay_seconds):
+        self.stream = stream
+        self.delay_seconds = delay_seconds
+
+    def write(self, data):
+        return self.stream.write(data)
+
+    def flush(self):
+        self.stream.flush()
+        time.sleep(self.delay_seconds)
+
+    def __getattr__(self, name):
+        # seek/tell (RotatingFileHandler), close waghera asli stream se
+        return getattr(self.stream, name)
+
+
+def _configure(mode, workdir, disk_delay_ms):
+    log_file = os.path.join(workdir, f"{mode}.log")
+    listener = None
+    devnull = open(os.devnull, "w")
+    if mode == "disabled":
+        logging.disable(logging.CRITICAL)
+        return log_file, listener
+    if mode == "sync":
+        # main.py ka purana setup
+        file_handler = logging.FileHandler(log_file)
+        logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+                            handlers=[file_handler, logging.StreamHandler(devnull)])
+    else:
+        from backend.ai_agent_manager.structured_logging import setup_logging
+        logging_config = {"file": log_file, "rate_limits": {}}
+        if mode == "queued_rate_limited":
+            logging_config["rate_limits"] = toml.load(CONFIG_PATH).get("logging", {}).get("rate_limits", {})
+        sys.stderr = devnull # Console handler ka output
+        listener = setup_logging({"logging": logging_config})
+        file_handler = listener.handlers[0]
+    if disk_delay_ms:
+        file_handler.stream = SlowStream(file_handler.stream, disk_delay_ms / 1000.0)
+    return log_file, listener
+
+
+def _run_mode(mode, iterations, threads, disk_delay_ms, result_queue):
+    real_stderr = sys.stderr
+    with tempfile.TemporaryDirectory(prefix="bench_logging_") as workdir:
+        log_file, listener = _configure(mode, workdir, disk_delay_ms)
+        from backend.strategist_agent.strategist import Strategist
+        config = {"paths": {"data_dir": workdir}, "extraction_cache": {"enabled": False}, "brief_index": {"enabled": False}}
+        strategist = Strategist(config)
+        brief_path = corpora.write_text_file(workdir, 4000)
+        campaign = {"campaign_id": "bench", "input_type": "text_file", "input_data": brief_path}
+
+        executor = ThreadPoolExecutor(max_workers=threads)
+
+        def one_batch():
+            # "threads" requests ek saath
+            for future in [executor.submit(strategist.run, campaign) for _ in range(threads)]:
+                future.result()
+
+        stats = measure(one_batch, iterations=iterations, warmup=5, units_per_call=threads)
+        executor.shutdown()
+        if listener is not None:
+            # Bache hue records likhe jaane tak rukta hai
+            listener.stop()
+            from backend.ai_agent_manager.structured_logging import log_records_dropped_total
+            stats["dropped_records"] = sum(log_records_dropped_total._values.values())
+        logging.shutdown()
+        stats["log_bytes"] = os.path.getsize(log_file) if os.path.exists(log_file) else 0
+    sys.stderr = real_stderr
+    result_queue.put(stats)
+
+
+def run_mode(mode, iterations, threads, disk_delay_ms):
+    context = multiprocessing.get_context("spawn")
+    result_queue = context.Queue()
+    process = context.Process(target=_run_mode, args=(mode, iterations, threads, disk_delay_ms, result_queue))
+    process.start()
+    try:
+        return result_queue.get()
+    finally:
+        process.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure Strategist.run latency with different logging setups.")
+    parser.add_argument("--iterations", type=int, default=300)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--disk-delay-ms", nargs="+", type=float, default=[0.0, 1.0])
+    args = parser.parse_args()
+
+    results = []
+    for disk_delay_ms in args.disk_delay_ms:
+        entry = {"disk_delay_ms": disk_delay_ms}
+        for mode in MODES:
+            entry[mode] = run_mode(mode, args.iterations, args.threads, disk_delay_ms)
+            print(f"disk delay {disk_delay_ms} ms, {mode}: p50 {entry[mode]['p50_ms']} ms, p99 {entry[mode]['p99_ms']} ms", file=sys.stderr)
+        results.append(entry)
+    print(json.dumps({"benchmark": "logging_overhead", "threads": args.threads, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Media store benchmark: bahut saare stored objects ke saath add_file (hash + move + hardlink + index), source URL lookup,
+release aur quota eviction ka time. Lookups aur eviction sirf SQLite index se hote hain, directory walk se nahi.
+
+Chalane ke liye (project root se):
+    python -m benchmarks.media_store --objects 20000
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.harness import measure
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the content-addressed media store index.")
+    parser.add_argument("--objects", type=int, default=20000)
+    parser.add_argument("--file-kb", type=int, default=4)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    from backend.ai_agent_manager.media_store import MediaStore
+    with tempfile.TemporaryDirectory(prefix="bench_media_store_") as workdir:
+        file_bytes = args.file_kb * 1024
+        store = MediaStore({"paths": {"data_dir": workdir}, "media_store": {"quota_gb": 1000}})
+        incoming = os.path.join(workdir, "incoming")
+        os.makedirs(incoming)
+
+        start = time.perf_counter()
+        for index in range(args.objects):
+            path = os.path.join(incoming, f"{index}.mp4")
+            with open(path, "wb") as f:
+                f.write(index.to_bytes(8, "little") * (file_bytes // 8))
+            store.add_file(path, f"campaign_{index % 100}", os.path.join(workdir, "raw_videos", f"campaign_{index % 100}", f"{index}.mp4"),
+                           source_url=f"https://cdn.example.com/videos/{index}.mp4")
+        add_seconds = time.perf_counter() - start
+
+        lookup = measure(lambda: store.lookup_source(f"https://cdn.example.com/videos/{args.objects // 2}.mp4"), iterations=2000)
+        start = time.perf_counter()
+        for campaign in range(100):
+            store.release(f"campaign_{campaign}")
+        release_seconds = time.perf_counter() - start
+
+        # Quota aadha karke sabse purane aadhe objects evict karwayein
+        store.quota_bytes = args.objects * file_bytes // 2
+        start = time.perf_counter()
+        freed = store.enforce_quota()
+        evict_seconds = time.perf_counter() - start
+
+        result = {
+            "objects": args.objects,
+            "add_file_ms": round(add_seconds / args.objects * 1000, 3),
+            "lookup_source": lookup,
+            "release_100_campaigns_seconds": round(release_seconds, 3),
+            "evict_half_seconds": round(evict_seconds, 3),
+            "evicted_bytes": freed,
+            "stats_after": store.get_stats(),
+        }
+    print(f"{args.objects} objects: add {result['add_file_ms']} ms/file, lookup p50 {lookup['p50_ms']} ms, "
+          f"evict half {result['evict_half_seconds']} s", file=sys.stderr)
+    print(json.dumps({"benchmark": "media_store", "result": result}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+OCR throughput benchmark: purana one-process-per-image path (pytesseract.image_to_string)
+aur naya OCRWorkerPool batch path ko same screenshots par compare karta hai.
+
+Chalane ke liye (project root se):
+    python -m benchmarks.ocr_throughput --images 32 --workers 4
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import pytesseract
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.strategist_agent.tools.ocr_pool import OCRWorkerPool
+from benchmarks.corpora import screenshot
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-image OCR with the batched OCR worker pool.")
+    parser.add_argument("--images", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--tesseract-cmd", default=pytesseract.pytesseract.tesseract_cmd)
+    args = parser.parse_args()
+
+    pytesseract.pytesseract.tesseract_cmd = args.tesseract_cmd
+    images = [screenshot(1080, 1920, seed) for seed in range(args.images)]
+
+    start = time.perf_counter()
+    for image in images:
+        pytesseract.image_to_string(image)
+    serial_sec = time.perf_counter() - start
+
+    pool = OCRWorkerPool(args.tesseract_cmd, workers=args.workers, batch_size=args.batch_size)
+    start = time.perf_counter()
+    pool.ocr_images(images)
+    pool_sec = time.perf_counter() - start
+    pool.shutdown()
+
+    print(json.dumps({
+        "images": args.images,
+        "workers": pool.workers,
+        "batch_size": args.batch_size,
+        "per_image_process": {"seconds": round(serial_sec, 3), "images_per_sec": round(args.images / serial_sec, 2)},
+        "worker_pool": {"seconds": round(pool_sec, 3), "images_per_sec": round(args.images / pool_sec, 2)},
+        "speedup": round(serial_sec / pool_sec, 2)
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
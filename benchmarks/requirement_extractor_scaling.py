@@ -0,0 +1,68 @@
+"""
+RequirementExtractor scaling benchmark: multi-megabyte scraped pages jaisa text banakar
+extract() ka time har size par naapta hai. Linear scaling mein ns/byte lagbhag same rehna chahiye.
+
+Chalane ke liye (project root se):
+    python -m benchmarks.requirement_extractor_scaling --sizes-mb 1 2 4 8
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.strategist_agent.tools.requirement_extractor import RequirementExtractor
+
+FILLER_WORDS = ["clip", "viral", "creator", "gaming", "stream", "shorts", "edit", "music", "brand", "launch", "product", "audience"]
+
+
+def make_scraped_page(size_bytes, seed=0):
+    """
+    Navigation/filler lines ke beech campaign fields wala bada text banata hai.
+    """
+    rng = random.Random(seed)
+    lines = []
+    total = 0
+    while total < size_bytes:
+        roll = rng.random()
+        if roll < 0.001:
+            line = "Product: Clipster AI Editor"
+        elif roll < 0.002:
+            line = "Target Audience: gamers"
+        elif roll < 0.0025:
+            line = "Keywords: gaming, shorts, ai editing"
+        else:
+            line = " ".join(rng.choice(FILLER_WORDS) for _ in range(rng.randint(4, 16)))
+        lines.append(line)
+        total += len(line) + 1
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure RequirementExtractor time against input size.")
+    parser.add_argument("--sizes-mb", type=float, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    extractor = RequirementExtractor({})
+    results = []
+    for size_mb in args.sizes_mb:
+        text = make_scraped_page(int(size_mb * 1024 * 1024))
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            extractor.extract(text)
+            timings.append(time.perf_counter() - start)
+        best = min(timings)
+        results.append({"size_mb": size_mb, "seconds": round(best, 4), "ns_per_byte": round(best * 1e9 / len(text), 2)})
+
+    print(json.dumps({"benchmark": "requirement_extractor_scaling", "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
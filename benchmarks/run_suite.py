@@ -0,0 +1,199 @@
+"""
+Strategist tool chain ka microbenchmark suite.
+OCRModel, DocumentParser, RequirementExtractor aur Strategist.run ko synthetic corpora par time karta hai
+aur results machine-readable JSON mein likhta hai. Har case alag process mein chalta hai taaki peak RSS
+us case ka hi ho.
+
+Chalane ke liye (project root se):
+    python -m benchmarks.run_suite --out bench_results.json
+    python -m benchmarks.run_suite --quick --only pdf requirement_extractor
+    python -m benchmarks.compare old.json bench_results.json
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import corpora
+from benchmarks.harness import measure
+
+
+class SkipBenchmark(Exception):
+    """
+    Jab kisi case ki zaroori cheez (jaise tesseract) maujood na ho.
+    """
+    pass
+
+
+def _tool_config(workdir, tesseract_cmd=None):
+    # Extraction cache band rakhein warna repeat iterations asli kaam naap hi nahi payengi
+    config = {"paths": {"data_dir": workdir}, "extraction_cache": {"enabled": False}}
+    if tesseract_cmd:
+        config["paths"]["tesseract_cmd"] = tesseract_cmd
+    return config
+
+
+def _require_tesseract(tesseract_cmd):
+    import pytesseract
+    command = tesseract_cmd or pytesseract.pytesseract.tesseract_cmd
+    if not shutil.which(command) and not os.path.exists(command):
+        raise SkipBenchmark(f"Tesseract executable '{command}' not found.")
+
+
+def _ocr_single(width, height):
+    def case(workdir, quick, tesseract_cmd):
+        _require_tesseract(tesseract_cmd)
+        from backend.strategist_agent.tools.ocr_model import OCRModel
+        model = OCRModel(_tool_config(workdir, tesseract_cmd))
+        image = corpora.screenshot_base64(width, height)
+        return measure(lambda: model.extract_text_from_image(image, "base64"), iterations=3 if quick else 10)
+    return case
+
+
+def _ocr_batch(count, width, height):
+    def case(workdir, quick, tesseract_cmd):
+        _require_tesseract(tesseract_cmd)
+        from backend.strategist_agent.tools.ocr_model import OCRModel
+        model = OCRModel(_tool_config(workdir, tesseract_cmd))
+        images = [corpora.screenshot_base64(width, height, seed) for seed in range(count)]
+        return measure(lambda: model.extract_text_from_images(images, "base64"), iterations=2 if quick else 5, units_per_call=count)
+    return case
+
+
+def _document(input_type, make_input, units):
+    def case(workdir, quick, tesseract_cmd):
+        from backend.strategist_agent.tools.document_parser import DocumentParser
+        parser = DocumentParser(_tool_config(workdir, tesseract_cmd))
+        path = make_input(workdir)
+        return measure(lambda: parser.extract_text(path, input_type), iterations=3 if quick else 15, units_per_call=units)
+    return case
+
+
+def _requirement_extractor(size_bytes):
+    def case(workdir, quick, tesseract_cmd):
+        from backend.strategist_agent.tools.requirement_extractor import RequirementExtractor
+        extractor = RequirementExtractor({})
+        text = corpora.brief_text(size_bytes)
+        stats = measure(lambda: extractor.extract(text), iterations=3 if quick else 15, units_per_call=size_bytes / (1024 * 1024))
+        stats["throughput_unit"] = "MB"
+        return stats
+    return case
+
+
+def _strategist(input_type, make_input, needs_tesseract=False):
+    def case(workdir, quick, tesseract_cmd):
+        if needs_tesseract:
+            _require_tesseract(tesseract_cmd)
+        from backend.strategist_agent.strategist import Strategist
+        strategist = Strategist(_tool_config(workdir, tesseract_cmd))
+        campaign_details = {
+            "campaign_id": "bench",
+            "campaign_name": "Benchmark",
+            "input_type": input_type,
+            "input_data": make_input(workdir),
+            "required_length_sec": "15-60s",
+            "target_product": "Clipster",
+            "social_media_platforms": ["youtube"]
+        }
+        return measure(lambda: strategist.run(campaign_details), iterations=3 if quick else 10)
+    return case
+
+
+# Case ka naam -> case function(workdir, quick, tesseract_cmd)
+CASES = {
+    "ocr.screenshot_1080x1920": _ocr_single(1080, 1920),
+    "ocr.screenshot_1080x9000_tall": _ocr_single(1080, 9000),
+    "ocr.batch_16x1080x1920": _ocr_batch(16, 1080, 1920),
+    "pdf.text_1p": _document("pdf_file", lambda d: corpora.write_pdf(d, 1), units=1),
+    "pdf.text_50p": _document("pdf_file", lambda d: corpora.write_pdf(d, 50), units=50),
+    "pdf.text_500p": _document("pdf_file", lambda d: corpora.write_pdf(d, 500), units=500),
+    "docx.200para": _document("docx_file", lambda d: corpora.write_docx(d, 200), units=1),
+    "docx.5000para_500rows": _document("docx_file", lambda d: corpora.write_docx(d, 5000, 500), units=1),
+    "text_file.1mb": _document("text_file", lambda d: corpora.write_text_file(d, 1024 * 1024), units=1),
+    "requirement_extractor.64kb": _requirement_extractor(64 * 1024),
+    "requirement_extractor.8mb": _requirement_extractor(8 * 1024 * 1024),
+    "strategist.text_file": _strategist("text_file", lambda d: corpora.write_text_file(d, 16 * 1024)),
+    "strategist.pdf_50p": _strategist("pdf_file", lambda d: corpora.write_pdf(d, 50)),
+    "strategist.docx": _strategist("docx_file", lambda d: corpora.write_docx(d, 200)),
+    "strategist.screenshot": _strategist("screenshot", lambda d: corpora.screenshot_base64(1080, 1920), needs_tesseract=True),
+}
+
+
+def _run_case_in_child(name, quick, tesseract_cmd, result_queue):
+    logging.disable(logging.WARNING)
+    try:
+        with tempfile.TemporaryDirectory(prefix="bench_") as workdir:
+            result_queue.put({"status": "ok", **CASES[name](workdir, quick, tesseract_cmd)})
+    except SkipBenchmark as e:
+        result_queue.put({"status": "skipped", "reason": str(e)})
+    except Exception as e:
+        result_queue.put({"status": "error", "reason": f"{type(e).__name__}: {e}"})
+
+
+def run_case(name, quick=False, tesseract_cmd=None):
+    """
+    Ek case ko alag (spawned) process mein chalata hai aur uska result dict return karta hai.
+    """
+    context = multiprocessing.get_context("spawn")
+    result_queue = context.Queue()
+    process = context.Process(target=_run_case_in_child, args=(name, quick, tesseract_cmd, result_queue))
+    process.start()
+    try:
+        result = result_queue.get()
+    finally:
+        process.join()
+    return result
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Strategist tool chain on synthetic corpora.")
+    parser.add_argument("--out", help="Results JSON file ka path (default: stdout)")
+    parser.add_argument("--only", nargs="*", help="Sirf in prefixes se shuru hone wale cases chalayein")
+    parser.add_argument("--quick", action="store_true", help="Kam iterations (smoke run)")
+    parser.add_argument("--tesseract-cmd", help="Tesseract executable ka path")
+    args = parser.parse_args()
+
+    names = [name for name in CASES if not args.only or any(name.startswith(prefix) for prefix in args.only)]
+    results = {}
+    for name in names:
+        started = time.perf_counter()
+        results[name] = run_case(name, args.quick, args.tesseract_cmd)
+        print(f"{name}: {results[name]['status']} ({time.perf_counter() - started:.1f}s)", file=sys.stderr)
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": time.time(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "quick": args.quick
+        },
+        "results": results
+    }
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
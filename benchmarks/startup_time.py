@@ -0,0 +1,57 @@
+"""
+Startup benchmark: naye process mein `main` import karke pehli /api/v1/health request tak ka samay naapta hai.
+Lazy mode (default) ko eager mode se compare karta hai, jahan saare Strategist tool modules
+(PyMuPDF, python-docx, pytesseract, PIL, requests) pehle hi import kiye jaate hain jaise pehle hota tha.
+
+Chalane ke liye (project root se):
+    python -m benchmarks.startup_time --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD_CODE = """
+import json, sys, time
+start = time.perf_counter()
+if {eager}:
+    from backend.strategist_agent.tools import ocr_model, document_parser, requirement_extractor, extraction_cache
+import main
+response = main.app.test_client().get("/api/v1/health")
+assert response.status_code == 200
+print(json.dumps({{"first_request_ms": (time.perf_counter() - start) * 1000, "modules": len(sys.modules)}}))
+"""
+
+
+def run_once(eager):
+    started = time.perf_counter()
+    output = subprocess.check_output([sys.executable, "-c", CHILD_CODE.format(eager=eager)], cwd=PROJECT_ROOT, stderr=subprocess.DEVNULL, text=True)
+    result = json.loads(output.strip().splitlines()[-1])
+    result["process_ms"] = (time.perf_counter() - started) * 1000
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure time to first request with lazy vs eager tool loading.")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    report = {}
+    for mode, eager in (("eager", True), ("lazy", False)):
+        runs = [run_once(eager) for _ in range(args.runs)]
+        report[mode] = {
+            "first_request_ms_median": round(statistics.median(r["first_request_ms"] for r in runs), 1),
+            "process_ms_median": round(statistics.median(r["process_ms"] for r in runs), 1),
+            "modules_loaded": runs[-1]["modules"]
+        }
+    report["first_request_saving_ms"] = round(report["eager"]["first_request_ms_median"] - report["lazy"]["first_request_ms_median"], 1)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
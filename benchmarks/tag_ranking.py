@@ -0,0 +1,108 @@
+"""
+Marketer tag ranking benchmark: synthetic researcher metadata (Zipf jaise word/tag distribution) ko campaign batches mein
+TagIndex mein jodna, phir research keywords par hashtag/title phrase suggestions ki latency. Tulna ke liye har query
+par saare stored videos scan karne wala seedha tareeka bhi chalta hai.
+
+Chalane ke liye (project root se):
+    python -m benchmarks.tag_ranking --videos 200000
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.harness import measure, peak_rss_mb
+
+CAMPAIGN_SIZE = 10
+
+
+def synthetic_videos(count: int, vocabulary: int = 5000, tag_vocabulary: int = 2000, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    words = [f"word{index}" for index in range(vocabulary)]
+    word_weights = [1.0 / (rank + 1) for rank in range(vocabulary)]
+    tags = [f"tag{index}" for index in range(tag_vocabulary)]
+    tag_weights = [1.0 / (rank + 1) for rank in range(tag_vocabulary)]
+    videos = []
+    for index in range(count):
+        title = " ".join(rng.choices(words, word_weights, k=rng.randint(5, 10)))
+        videos.append({
+            "video_path": f"/videos/{index}.mp4",
+            "metadata": {
+                "title": title,
+                "description": " ".join(rng.choices(words, word_weights, k=30)),
+                "tags": rng.choices(tags, tag_weights, k=rng.randint(3, 8)),
+                "source_url": f"https://cdn.example.com/videos/{index}.mp4",
+                "virality_score": round(rng.random() * 100, 2)
+            }
+        })
+    return videos
+
+
+def naive_suggest(videos: list, keywords: list, top_k: int) -> list:
+    # Pehle jaisa seedha tareeka: har query par saare videos ka metadata scan
+    wanted = {keyword.lower() for keyword in keywords}
+    counts = Counter()
+    for video in videos:
+        metadata = video["metadata"]
+        text = f"{metadata['title']} {metadata['description']} {' '.join(metadata['tags'])}".lower().split()
+        if wanted.intersection(text):
+            counts.update(metadata["tags"])
+    return counts.most_common(top_k)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark indexed hashtag/title phrase ranking.")
+    parser.add_argument("--videos", type=int, default=200000)
+    parser.add_argument("--naive-videos", type=int, default=50000)
+    parser.add_argument("--queries", type=int, default=500)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    from backend.marketer_agent.tools.tag_index import TagIndex
+    videos = synthetic_videos(args.videos)
+    rng = random.Random(1)
+    queries = [[f"word{rng.randint(0, 300)}", f"word{rng.randint(0, 3000)} word{rng.randint(0, 3000)}"] for _ in range(args.queries)]
+
+    with tempfile.TemporaryDirectory(prefix="bench_tag_index_") as workdir:
+        index = TagIndex({"paths": {"data_dir": workdir}})
+        index.wait_until_loaded()
+        start = time.perf_counter()
+        for offset in range(0, len(videos), CAMPAIGN_SIZE):
+            index.add_videos(f"campaign_{offset // CAMPAIGN_SIZE}", videos[offset:offset + CAMPAIGN_SIZE])
+        ingest_seconds = time.perf_counter() - start
+
+        query_iter = iter(queries * 2)
+        suggest = measure(lambda: index.suggest(next(query_iter)), iterations=args.queries - 1)
+
+        start = time.perf_counter()
+        reloaded = TagIndex({"paths": {"data_dir": workdir}})
+        reloaded.wait_until_loaded()
+        reload_seconds = time.perf_counter() - start
+        stats = reloaded.get_stats()
+
+    naive_corpus = videos[:args.naive_videos]
+    naive = measure(lambda: naive_suggest(naive_corpus, queries[0], 10), iterations=5)
+
+    result = {
+        "videos": args.videos,
+        "ingest_ms_per_campaign": round(ingest_seconds / (len(videos) / CAMPAIGN_SIZE) * 1000, 3),
+        "suggest": suggest,
+        "reload_seconds": round(reload_seconds, 2),
+        "index_stats": stats,
+        "naive_scan": {"videos": len(naive_corpus), **naive},
+        "peak_rss_mb": round(peak_rss_mb(), 1)
+    }
+    print(f"{args.videos} videos: ingest {result['ingest_ms_per_campaign']} ms/campaign, suggest p50 {suggest['p50_ms']} ms "
+          f"(p99 {suggest['p99_ms']} ms); naive scan of {len(naive_corpus)} videos p50 {naive['p50_ms']} ms", file=sys.stderr)
+    print(json.dumps({"benchmark": "tag_ranking", "result": result}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+Researcher download manager benchmark, ek local HTTP server (Range + ETag support) ke khilaaf:
+- concurrency: har connection ki speed seemit hai (jaise asli CDN), isliye kai downloads ek saath chalne se kul samay ghatna chahiye
+- bandwidth cap: kul speed configured cap ke aas-paas rehni chahiye
+- resume: server har file ka pehla response beech mein kaat deta hai; downloads retry par (ya process restart ke baad
+  naye DownloadManager se) wahi se aage badhne chahiye aur files byte-for-byte sahi honi chahiye
+Har case mein per-host connection limit bhi check hota hai (server par ek saath khule connections ka maximum).
+
+Chalane ke liye (project root se):
+    python -m benchmarks.video_downloads --files 8 --size-mb 4
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_RANGE = re.compile(r"bytes=(\d+)-(\d*)")
+
+
+class VideoServer:
+    """
+    Memory mein rakhi fake videos serve karta hai. Range requests (206), If-Range, per-connection speed limit aur
+    "pehla response kaat do" (interruption) support karta hai.
+    """
+    def __init__(self, files: dict, per_connection_bytes_per_sec: float = 0, cut_first_response_at: int = 0):
+        self.files = files
+        self.etags = {name: '"' + hashlib.md5(body).hexdigest() + '"' for name, body in files.items()}
+        self.per_connection_bytes_per_sec = per_connection_bytes_per_sec
+        self.cut_first_response_at = cut_first_response_at
+        self.cut_done = set()
+        self.active = 0
+        self.max_active = 0
+        self.requests = 0
+        self.lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def url(self, name: str) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}/videos/{name}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                name = self.path.rsplit("/", 1)[-1]
+                body = server.files.get(name)
+                if body is None:
+                    self.send_error(404)
+                    return
+                with server.lock:
+                    server.active += 1
+                    server.requests += 1
+                    server.max_active = max(server.max_active, server.active)
+                try:
+                    self._send(name, body)
+                finally:
+                    with server.lock:
+                        server.active -= 1
+
+            def _send(self, name, body):
+                start, end, status = 0, len(body) - 1, 200
+                match = _RANGE.match(self.headers.get("Range", ""))
+                if_range = self.headers.get("If-Range")
+                if match and (if_range is None or if_range == server.etags[name]):
+                    start = int(match.group(1))
+                    if start >= len(body):
+                        self.send_response(416)
+                        self.send_header("Content-Range", f"bytes */{len(body)}")
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+                    end = min(int(match.group(2)), len(body) - 1) if match.group(2) else len(body) - 1
+                    status = 206
+                self.send_response(status)
+                self.send_header("ETag", server.etags[name])
+                self.send_header("Accept-Ranges", "bytes")
+                self.send_header("Content-Length", str(end - start + 1))
+                if status == 206:
+                    self.send_header("Content-Range", f"bytes {start}-{end}/{len(body)}")
+                self.end_headers()
+
+                cut_at = None
+                with server.lock:
+                    if server.cut_first_response_at and name not in server.cut_done:
+                        server.cut_done.add(name)
+                        cut_at = start + min(server.cut_first_response_at, (end - start) // 2)
+                position = start
+                block = 64 * 1024
+                while position <= end:
+                    stop = min(end + 1, position + block)
+                    if cut_at is not None and stop > cut_at:
+                        self.wfile.write(body[position:cut_at])
+                        self.wfile.flush()
+                        self.close_connection = True
+                        return
+                    self.wfile.write(body[position:stop])
+                    position = stop
+                    if server.per_connection_bytes_per_sec:
+                        time.sleep(block / server.per_connection_bytes_per_sec)
+
+        return Handler
+
+
+def run_case(name, files, download_config, server_options, restart=False) -> dict:
+    from backend.researcher_agent.tools.download_manager import DownloadManager
+    with tempfile.TemporaryDirectory(prefix="bench_downloads_") as workdir, VideoServer(files, **server_options) as server:
+        urls = [server.url(file_name) for file_name in files]
+        if restart:
+            # Pehla process bina retry ke fail hota hai aur .part files chhod deta hai
+            first = DownloadManager({"paths": {"data_dir": workdir}, "researcher": {"downloads": {**download_config, "retries": 0}}})
+            list(first.download_many(urls))
+            first.executor.shutdown()
+        manager = DownloadManager({"paths": {"data_dir": workdir}, "researcher": {"downloads": download_config}})
+        start = time.perf_counter()
+        results = dict(manager.download_many(urls))
+        elapsed = time.perf_counter() - start
+
+        correct = 0
+        resumed = 0
+        for file_name, body in files.items():
+            result = results[server.url(file_name)]
+            if result["status"] == "success":
+                resumed += result["resumed"]
+                with open(result["path"], "rb") as f:
+                    correct += f.read() == body
+        total_bytes = sum(len(body) for body in files.values())
+        leftovers = [entry for entry in os.listdir(manager.directory) if entry.endswith((".part", ".json"))]
+        manager.executor.shutdown()
+        return {
+            "case": name,
+            "files": len(files),
+            "correct_files": correct,
+            "resumed_files": resumed,
+            "seconds": round(elapsed, 3),
+            "throughput_mb_per_sec": round(total_bytes / elapsed / (1024 * 1024), 2),
+            "requests": server.requests,
+            "max_concurrent_connections": server.max_active,
+            "leftover_part_files": len(leftovers),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Researcher download manager against a local HTTP server.")
+    parser.add_argument("--files", type=int, default=8)
+    parser.add_argument("--size-mb", type=float, default=4)
+    parser.add_argument("--per-connection-mb-per-sec", type=float, default=8)
+    args = parser.parse_args()
+    # Interruption cases mein fail hone wale downloads ke expected error logs bhi chhupa dein
+    logging.disable(logging.CRITICAL)
+
+    size = int(args.size_mb * 1024 * 1024)
+    files = {f"video_{index}.mp4": os.urandom(size) for index in range(args.files)}
+    per_connection = args.per_connection_mb_per_sec * 1024 * 1024
+    base = {"chunk_mb": 1, "per_host_limit": 4}
+
+    cases = [
+        ("sequential", {**base, "max_concurrent": 1}, {"per_connection_bytes_per_sec": per_connection}),
+        ("concurrent", {**base, "max_concurrent": 4}, {"per_connection_bytes_per_sec": per_connection}),
+        ("per_host_limit_2", {**base, "max_concurrent": 4, "per_host_limit": 2}, {"per_connection_bytes_per_sec": per_connection}),
+        ("bandwidth_cap_10mb", {**base, "max_concurrent": 4, "max_bandwidth_mb_per_sec": 10}, {}),
+        ("interrupted_retry", {**base, "max_concurrent": 4}, {"cut_first_response_at": 300000}),
+        ("restart_resume", {**base, "max_concurrent": 4}, {"cut_first_response_at": 300000}, True),
+    ]
+    results = []
+    for name, download_config, server_options, *restart in cases:
+        result = run_case(name, files, download_config, server_options, restart=bool(restart))
+        results.append(result)
+        print(f"{name}: {result['seconds']} s, {result['throughput_mb_per_sec']} MB/s, "
+              f"{result['correct_files']}/{result['files']} correct, max connections {result['max_concurrent_connections']}", file=sys.stderr)
+
+    print(json.dumps({"benchmark": "video_downloads", "size_mb": args.size_mb, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
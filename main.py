@@ -6,33 +6,29 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
-# Configure logging
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
-LOG_FILE = os.getenv("LOG_FILE", "logs/app.log")
-
-# Create logs directory if it doesn't exist
-os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
-
-logging.basicConfig(
-    level=getattr(logging, LOG_LEVEL),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger(__name__)
+from backend.ai_agent_manager.structured_logging import setup_logging
 
 # Load configuration from config.toml
 try:
     config = toml.load("config.toml")
-    logger.info("Configuration loaded from config.toml")
-except FileNotFoundError:
+    config_error = None
+except Exception as e:
+    config = {}
+    config_error = e
+
+# Configure logging: request threads sirf queue mein daalte hain, background listener file/console par likhta hai
+LOG_LEVEL = os.getenv("LOG_LEVEL", config.get("logging", {}).get("level", "INFO")).upper()
+LOG_FILE = os.getenv("LOG_FILE", config.get("logging", {}).get("file", "logs/app.log"))
+log_listener = setup_logging(config, level=LOG_LEVEL, log_file=LOG_FILE)
+logger = logging.getLogger(__name__)
+
+if isinstance(config_error, FileNotFoundError):
     logger.error("config.toml not found. Please create one.")
     exit(1)
-except Exception as e:
-    logger.error(f"Error loading config.toml: {e}")
+elif config_error is not None:
+    logger.error(f"Error loading config.toml: {config_error}")
     exit(1)
+logger.info("Configuration loaded from config.toml")
 
 # Ensure data directories exist as per config
 data_base_path = config.get("paths", {}).get("data_dir", "backend/data")
@@ -56,6 +52,7 @@ except Exception as e:
 
 # Add manager instance to Flask app if needed for routes to access it
 app.config['AI_MANAGER'] = ai_manager
+app.config['BATCH_MAX_ITEMS'] = config.get("batch", {}).get("max_items", 100)
 
 if __name__ == "__main__":
     flask_host = config.get("server", {}).get("host", "0.0.0.0")
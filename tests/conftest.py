@@ -0,0 +1,22 @@
+import os
+import sys
+
+# Repo root import path par (backend/ ek namespace package hai, benchmarks bhi yahi karte hain)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+import toml
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def app_config(tmp_path):
+    """
+    Repo ka config.toml, lekin saara data (SQLite stores, media, cache) test ki temp directory mein.
+    """
+    config = toml.load(os.path.join(REPO_ROOT, "config.toml"))
+    config["paths"]["data_dir"] = str(tmp_path / "data")
+    # Background lease loop tests ke campaigns apne aap resume na kare
+    config.setdefault("checkpoints", {})["resume_interrupted"] = False
+    return config
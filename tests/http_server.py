@@ -0,0 +1,62 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class LocalServer:
+    """
+    Tests ke liye localhost HTTP server. routes: path -> (body bytes, headers dict); har request requests list mein
+    (method, path, headers) ke roop mein jaati hai. ETag wale routes par If-None-Match match hone par 304 milta hai aur
+    Range header par 206 (bytes=N- form).
+    """
+    def __init__(self, routes):
+        self.routes = routes
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_HEAD(self):
+                self._respond(send_body=False)
+
+            def do_GET(self):
+                self._respond(send_body=True)
+
+            def _respond(self, send_body):
+                server.requests.append((self.command, self.path, dict(self.headers)))
+                route = server.routes.get(self.path)
+                if route is None:
+                    self.send_error(404)
+                    return
+                body, headers = route
+                etag = headers.get("ETag")
+                if etag and self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                status = 200
+                range_header = self.headers.get("Range")
+                if range_header and range_header.startswith("bytes=") and headers.get("Accept-Ranges") == "bytes":
+                    start = int(range_header[len("bytes="):].split("-")[0])
+                    self.send_response(206)
+                    self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+                    body = body[start:]
+                    status = 206
+                if status == 200:
+                    self.send_response(200)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if send_body:
+                    self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,60 @@
+import pytest
+
+from backend.ai_agent_manager.api_routes import app
+from backend.ai_agent_manager.uploads import UploadStore
+from backend.ai_agent_manager.validators import ValidatorRegistry
+
+
+class FakeManager:
+    def __init__(self, config):
+        self.validators = ValidatorRegistry(config)
+        self.upload_store = UploadStore(config)
+        self.batches = []
+
+    def run_campaign_batch(self, campaign_details_list):
+        self.batches.append(campaign_details_list)
+        return [{"status": "success", "campaign_id": details["campaign_name"]} for details in campaign_details_list]
+
+
+@pytest.fixture
+def client(app_config):
+    manager = FakeManager(app_config)
+    app.config["AI_MANAGER"] = manager
+    try:
+        yield app.test_client(), manager
+    finally:
+        app.config.pop("AI_MANAGER", None)
+
+
+def campaign(name, **overrides):
+    details = {"campaign_name": name, "input_type": "url", "input_data": "https://example.com/brief",
+               "required_length_sec": "15-60s", "target_product": "Zenfit Band", "social_media_platforms": ["instagram"]}
+    details.update(overrides)
+    return details
+
+
+def test_batch_reports_invalid_items_in_place(client):
+    test_client, manager = client
+    response = test_client.post("/api/v1/campaigns/batch", json={"campaign_details": [
+        campaign("first"),
+        campaign("missing-upload", input_type="screenshot_file", input_data="no-such-upload"),
+        {"campaign_name": "incomplete"},
+        campaign("last"),
+    ]})
+
+    assert response.status_code == 200
+    results = response.get_json()["results"]
+    assert [result["status"] for result in results] == ["success", "error", "error", "success"]
+    assert "Upload 'no-such-upload' not found" in results[1]["message"]
+    assert results[2]["message"].startswith("Invalid campaign data:")
+    # Sirf valid campaigns chalaye gaye, order ke saath
+    assert [details["campaign_name"] for details in manager.batches[0]] == ["first", "last"]
+
+
+def test_malformed_batch_body_gets_a_json_error(client):
+    test_client, manager = client
+    response = test_client.post("/api/v1/campaigns/batch", data="{not json", content_type="application/json")
+
+    assert response.status_code == 400
+    assert response.get_json() == {"status": "error", "message": "Request must contain JSON data."}
+    assert manager.batches == []
@@ -0,0 +1,83 @@
+import asyncio
+import threading
+
+from backend.ai_agent_manager.asgi_app import AsyncCampaignRunner
+from backend.ai_agent_manager.deadline import Deadline
+
+
+class FakeManager:
+    def __init__(self, deadline):
+        self.deadline = deadline
+        self.workflow_calls = []
+
+    def get_deadline(self, campaign_id):
+        return self.deadline
+
+    def start_campaign_workflow(self, campaign_details, prefetched_text=None, prefetch_error=None):
+        self.workflow_calls.append({"prefetched_text": prefetched_text, "prefetch_error": prefetch_error})
+
+
+class FakeFetcher:
+    def __init__(self, error=None, delay=0):
+        self.error = error
+        self.delay = delay
+        self.calls = 0
+        self.cancelled = False
+
+    async def fetch_async(self, url, client=None):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise self.error
+        return {"text": "Product: Zenfit Band", "from_store": False}
+
+
+def run_campaign(deadline, fetcher, during=None):
+    manager = FakeManager(deadline)
+    runner = AsyncCampaignRunner(manager, {"asgi": {"cpu_workers": 1}})
+
+    async def get_url_fetcher():
+        return fetcher
+
+    runner._get_url_fetcher = get_url_fetcher
+
+    async def main():
+        task = asyncio.ensure_future(runner._run({"campaign_id": "asgi-1", "input_type": "url", "input_data": "https://example.com"}))
+        if during is not None:
+            await asyncio.sleep(0.05)
+            during()
+        await asyncio.wait_for(task, timeout=5)
+
+    asyncio.run(main())
+    runner.cpu_executor.shutdown()
+    return manager
+
+
+def test_fetch_error_is_final():
+    fetcher = FakeFetcher(error=ConnectionError("connection refused"))
+    manager = run_campaign(Deadline(60, "asgi-1"), fetcher)
+
+    assert fetcher.calls == 1
+    assert manager.workflow_calls == [{"prefetched_text": None, "prefetch_error": "Could not fetch content from URL: connection refused"}]
+
+
+def test_cancel_stops_the_pending_fetch():
+    deadline = Deadline(60, "asgi-1")
+    fetcher = FakeFetcher(delay=30)
+    # Cancel API request thread se aata hai
+    manager = run_campaign(deadline, fetcher, during=lambda: threading.Thread(target=deadline.cancel).start())
+
+    assert fetcher.cancelled
+    assert manager.workflow_calls == [{"prefetched_text": None, "prefetch_error": None}]
+
+
+def test_budget_expiry_stops_the_pending_fetch():
+    fetcher = FakeFetcher(delay=30)
+    manager = run_campaign(Deadline(0.1, "asgi-1"), fetcher)
+
+    assert fetcher.cancelled
+    assert manager.workflow_calls == [{"prefetched_text": None, "prefetch_error": None}]
@@ -0,0 +1,69 @@
+import random
+
+from backend.strategist_agent.strategist import Strategist
+from backend.strategist_agent.tools.brief_index import BriefIndex
+
+
+def make_brief(product: str) -> str:
+    rng = random.Random(7)
+    words = ["campaign", "launch", "video", "creators", "energy", "story", "morning", "routine", "daily", "short",
+             "clips", "highlight", "benefits", "review", "honest", "features", "community", "social", "trend", "fresh"]
+    body = " ".join(rng.choice(words) for _ in range(240))
+    return f"Product: {product}\nAudience: Young Professionals\nKeywords: wellness, sleep, fitness\n{body}\n"
+
+
+def strategist_config(tmp_path):
+    return {"paths": {"data_dir": str(tmp_path)}, "extraction_cache": {"enabled": False}}
+
+
+def run_text_brief(strategist, tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return strategist.run({"campaign_id": name, "input_type": "text_file", "input_data": str(path)})
+
+
+def test_changed_product_line_does_not_reuse_near_duplicate_plan(tmp_path):
+    first, second = make_brief("AcmeFit Tracker"), make_brief("ZenSleep Mattress")
+    index = BriefIndex(strategist_config(tmp_path))
+    # Pehle se pata: SimHash ke hisaab se dono near-duplicate hain
+    assert index.find(index.fingerprint(first)) is None
+    index.add(index.fingerprint(first), {"product": "Acmefit Tracker"})
+    assert index.find(index.fingerprint(second)) is not None
+
+    strategist = Strategist(strategist_config(tmp_path / "strategist"))
+    assert run_text_brief(strategist, tmp_path, "first.txt", first)["action_plan"]["product"] == "Acmefit Tracker"
+    result = run_text_brief(strategist, tmp_path, "second.txt", second)
+    assert result["status"] == "success"
+    assert result["action_plan"]["product"] == "Zensleep Mattress"
+    assert "reused" not in result["message"]
+
+
+def test_unchanged_requirements_reuse_near_duplicate_plan(tmp_path):
+    strategist = Strategist(strategist_config(tmp_path))
+    brief = make_brief("AcmeFit Tracker")
+    run_text_brief(strategist, tmp_path, "first.txt", brief)
+
+    def extract(text):
+        raise AssertionError("requirement extraction should be skipped for a reusable near-duplicate")
+
+    strategist.requirement_extractor.extract = extract
+    result = run_text_brief(strategist, tmp_path, "edited.txt", brief.replace("campaign", "campaigns", 1))
+    assert "reused" in result["message"]
+    assert result["action_plan"]["product"] == "Acmefit Tracker"
+
+
+def test_briefs_added_by_another_process_are_found(tmp_path):
+    config = strategist_config(tmp_path)
+    worker_a, worker_b = BriefIndex(config), BriefIndex(config)
+    fingerprint = worker_a.fingerprint(make_brief("AcmeFit Tracker"))
+    worker_a.add(fingerprint, {"product": "Acmefit Tracker"})
+    assert worker_b.find(fingerprint)["action_plan"] == {"product": "Acmefit Tracker"}
+
+
+def test_changed_keywords_do_not_reuse_near_duplicate_plan(tmp_path):
+    strategist = Strategist(strategist_config(tmp_path))
+    brief = make_brief("AcmeFit Tracker")
+    run_text_brief(strategist, tmp_path, "first.txt", brief)
+    result = run_text_brief(strategist, tmp_path, "edited.txt", brief.replace("fitness", "yoga"))
+    assert "reused" not in result["message"]
+    assert "yoga" in result["action_plan"]["research_keywords"]
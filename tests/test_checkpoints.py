@@ -0,0 +1,95 @@
+import pytest
+
+from backend.ai_agent_manager.checkpoints import CheckpointStore, fingerprint
+from backend.ai_agent_manager.deadline import Deadline
+from backend.ai_agent_manager.job_queue import DuplicateJobError
+from backend.ai_agent_manager.manager import Manager
+
+ACTION_PLAN = {"product": "Zenfit Band", "audience": "runners", "research_keywords": ["fitness band"],
+               "download_count": 2, "clip_length": "15-60s"}
+
+
+@pytest.fixture
+def manager(app_config):
+    # Review wala case: extraction cache band hai, phir bhi file badalne par checkpoint invalid hona chahiye
+    app_config["extraction_cache"]["enabled"] = False
+    manager = Manager(app_config)
+    manager.strategist_calls = []
+
+    def run(campaign_details, extracted_text=None, deadline=None, cache_key=None):
+        manager.strategist_calls.append(campaign_details["campaign_id"])
+        return {"status": "success", "action_plan": dict(ACTION_PLAN)}
+
+    manager.strategist_agent.run = run
+    return manager
+
+
+def run_strategist_stage(manager, campaign_details):
+    context = {"campaign_id": campaign_details["campaign_id"], "campaign_details": campaign_details,
+               "prefetched_text": None, "deadline": Deadline(None, campaign_details["campaign_id"])}
+    return list(manager._run_strategist_stage(campaign_details, context))
+
+
+def make_details(path, **overrides):
+    details = {"campaign_id": "cp-1", "campaign_name": "Checkpoint", "input_type": "text_file", "input_data": str(path),
+               "required_length_sec": "15-60s", "target_product": "Zenfit Band", "social_media_platforms": ["instagram"]}
+    details.update(overrides)
+    return details
+
+
+def test_strategist_checkpoint_is_reused_for_unchanged_input(manager, tmp_path):
+    brief = tmp_path / "brief.txt"
+    brief.write_text("Product: Zenfit Band")
+    first = run_strategist_stage(manager, make_details(brief))
+    second = run_strategist_stage(manager, make_details(brief))
+
+    assert manager.strategist_calls == ["cp-1"]
+    assert first == second
+
+
+def test_strategist_checkpoint_is_invalidated_when_file_content_changes(manager, tmp_path):
+    brief = tmp_path / "brief.txt"
+    brief.write_text("Product: Zenfit Band")
+    run_strategist_stage(manager, make_details(brief))
+    # Same path, naya content
+    brief.write_text("Product: Zensleep Mattress")
+    run_strategist_stage(manager, make_details(brief))
+
+    assert manager.strategist_calls == ["cp-1", "cp-1"]
+
+
+def test_strategist_checkpoint_is_invalidated_when_details_change(manager, tmp_path):
+    brief = tmp_path / "brief.txt"
+    brief.write_text("Product: Zenfit Band")
+    run_strategist_stage(manager, make_details(brief))
+    run_strategist_stage(manager, make_details(brief, required_length_sec="30-90s"))
+
+    assert len(manager.strategist_calls) == 2
+
+
+def test_missing_input_file_is_never_served_from_a_checkpoint(manager, tmp_path):
+    missing = tmp_path / "missing.txt"
+    run_strategist_stage(manager, make_details(missing))
+    run_strategist_stage(manager, make_details(missing))
+
+    assert len(manager.strategist_calls) == 2
+
+
+def test_checkpoint_store_matches_fingerprint(app_config):
+    store = CheckpointStore(app_config)
+    store.save("cp-2", "researcher", fingerprint({"keywords": ["a"]}), [{"video_path": "a.mp4"}])
+
+    assert store.load("cp-2", "researcher", fingerprint({"keywords": ["a"]})) == [{"video_path": "a.mp4"}]
+    assert store.load("cp-2", "researcher", fingerprint({"keywords": ["b"]})) is None
+
+
+def test_resume_releases_claimed_lease_when_campaign_cannot_open(manager, app_config):
+    manager.state_store.create_campaign("orphan-2", {"campaign_id": "orphan-2", "campaign_name": "Orphan"}, status="running")
+
+    def open_deadline(campaign_id):
+        raise DuplicateJobError("busy")
+
+    manager.open_deadline = open_deadline
+    assert manager.resume_interrupted_campaigns() == []
+    # Lease chhoot chuki hai, isliye doosra worker process ise turant le sakta hai
+    assert CheckpointStore(app_config).acquire("orphan-2")
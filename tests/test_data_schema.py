@@ -0,0 +1,37 @@
+import pytest
+
+from backend.ai_agent_manager.validators import ValidatorRegistry
+
+
+def campaign(input_type, input_data):
+    return {
+        "campaign_name": "Launch", "input_type": input_type, "input_data": input_data,
+        "required_length_sec": "15-60s", "target_product": "AcmeFit", "social_media_platforms": ["youtube"]
+    }
+
+
+@pytest.fixture(scope="module")
+def registry():
+    return ValidatorRegistry({})
+
+
+@pytest.mark.parametrize("input_type, input_data", [
+    ("pdf_file", "/briefs/launch.pdf"),
+    ("pdf_file", "/briefs/LAUNCH.PDF"),
+    ("docx_file", "/briefs/launch.docx"),
+    ("url", "https://example.com/brief"),
+])
+def test_document_and_url_inputs_are_accepted(registry, input_type, input_data):
+    assert registry.validate("campaign_details", campaign(input_type, input_data)) is None
+
+
+@pytest.mark.parametrize("input_type, input_data", [
+    ("pdf_file", "/briefs/launch.docx"),
+    ("pdf_file", ""),
+    ("docx_file", "/briefs/launch.doc"),
+    ("url", "file:///etc/passwd"),
+    ("url", "example.com/brief"),
+    ("video_file", "/briefs/launch.mp4"),
+])
+def test_mismatched_input_data_is_rejected(registry, input_type, input_data):
+    assert registry.validate("campaign_details", campaign(input_type, input_data)) is not None
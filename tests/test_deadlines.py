@@ -0,0 +1,48 @@
+import time
+
+from backend.ai_agent_manager.manager import Manager
+
+
+def make_details(tmp_path, campaign_id):
+    brief = tmp_path / "brief.txt"
+    brief.write_text("Product: Zenfit Band", encoding="utf-8")
+    return {"campaign_id": campaign_id, "campaign_name": "Deadline", "input_type": "text_file", "input_data": str(brief),
+            "required_length_sec": "15-60s", "target_product": "Zenfit Band", "social_media_platforms": ["instagram"]}
+
+
+def make_manager(app_config, budget_sec):
+    app_config.setdefault("job_queue", {})["campaign_budget_sec"] = budget_sec
+    return Manager(app_config)
+
+
+def test_campaign_expired_in_the_queue_is_timed_out(app_config, tmp_path):
+    manager = make_manager(app_config, 0.05)
+    queued = []
+    manager.job_queue.submit = lambda job_id, func, *args, **kwargs: queued.append((func, args))
+
+    campaign_id = manager.submit_campaign(make_details(tmp_path, "late-1"))
+    time.sleep(0.1)
+    func, args = queued[0]
+    result = func(*args)
+
+    assert result["status"] == "error"
+    assert manager.get_workflow_status(campaign_id)["status"] == "timed_out"
+    assert manager.get_deadline(campaign_id) is None
+    assert manager.state_store.list_unfinished() == []
+
+
+def test_budget_running_out_inside_a_stage_times_out(app_config, tmp_path):
+    manager = make_manager(app_config, 0.2)
+
+    def slow_run(campaign_details, extracted_text=None, deadline=None):
+        # Lamba extraction jo budget se aage chala jaaye
+        deadline.sleep(5)
+        return {"status": "success", "action_plan": {}}
+
+    manager.strategist_agent.run = slow_run
+    started = time.monotonic()
+    result = manager.start_campaign_workflow(make_details(tmp_path, "slow-1"))
+
+    assert time.monotonic() - started < 2
+    assert result["status"] == "error"
+    assert manager.get_workflow_status("slow-1")["status"] == "timed_out"
@@ -0,0 +1,12 @@
+from backend.strategist_agent.tools.document_parser import DocumentParser
+
+
+def test_warm_up_starts_the_pdf_pool_workers(tmp_path):
+    parser = DocumentParser({"paths": {"data_dir": str(tmp_path)}, "pdf": {"workers": 2}})
+    try:
+        assert parser.warm_up() >= 1
+        processes = list(parser._pdf_pool._processes.values())
+        assert len(processes) == 2
+        assert all(process.is_alive() for process in processes)
+    finally:
+        parser._pdf_pool.shutdown()
@@ -0,0 +1,42 @@
+import docx
+import pytest
+
+from backend.ai_agent_manager.deadline import CampaignCancelledError, Deadline
+from backend.strategist_agent.tools.docx_reader import extract_docx_text
+
+
+@pytest.fixture
+def brief_docx(tmp_path):
+    document = docx.Document()
+    document.add_paragraph("Product: Zenfit Band")
+    table = document.add_table(rows=2, cols=2)
+    table.cell(0, 0).text = "Audience"
+    table.cell(0, 1).text = "Young Professionals"
+    table.cell(1, 0).text = "Keywords"
+    table.cell(1, 1).text = "sleep"
+    table.cell(1, 1).add_paragraph("fitness")
+    closing = document.add_paragraph("Deliver by")
+    closing.add_run().add_tab()
+    closing.add_run("Friday")
+    closing.add_run().add_break()
+    closing.add_run("Thanks")
+    path = tmp_path / "brief.docx"
+    document.save(str(path))
+    return str(path)
+
+
+def test_paragraphs_and_tables_are_read_in_document_order(brief_docx):
+    assert extract_docx_text(brief_docx).split("\n") == [
+        "Product: Zenfit Band",
+        "Audience\tYoung Professionals",
+        "Keywords\tsleep fitness",
+        "Deliver by\tFriday",
+        "Thanks",
+    ]
+
+
+def test_cancelled_deadline_stops_the_parse(brief_docx):
+    deadline = Deadline(30)
+    deadline.cancel()
+    with pytest.raises(CampaignCancelledError):
+        extract_docx_text(brief_docx, deadline)
@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from backend.ai_agent_manager.deadline import CampaignCancelledError, Deadline
+from backend.researcher_agent.tools.download_manager import DownloadManager
+from backend.researcher_agent.tools.video_catalog import VideoCatalog
+from tests.http_server import LocalServer
+
+VIDEO = bytes(range(256)) * 40
+
+
+@pytest.fixture
+def server():
+    server = LocalServer({
+        "/clip.mp4": (VIDEO, {"Content-Type": "video/mp4", "Accept-Ranges": "bytes", "ETag": '"clip"'}),
+        "/catalog.json": (json.dumps({"videos": [{"url": "http://example.com/a.mp4", "title": "Zenfit band review"}]}).encode(),
+                          {"Content-Type": "application/json"}),
+    })
+    yield server
+    server.close()
+
+
+def make_manager(tmp_path):
+    return DownloadManager({"paths": {"data_dir": str(tmp_path)}, "researcher": {"downloads": {"timeout_sec": 5}}})
+
+
+def test_interrupted_download_resumes_from_part_file(tmp_path, server):
+    manager = make_manager(tmp_path)
+    url = f"{server.url}/clip.mp4"
+    part_path = manager.target_path(url) + ".part"
+    with open(part_path, "wb") as f:
+        f.write(VIDEO[:1000])
+    with open(part_path + ".json", "w", encoding="utf-8") as f:
+        json.dump({"url": url, "total": len(VIDEO), "etag": '"clip"', "last_modified": None}, f)
+
+    result = manager.download(url)
+
+    assert result["status"] == "success" and result["resumed"] is True
+    with open(result["path"], "rb") as f:
+        assert f.read() == VIDEO
+    # Sirf bache hue bytes mange gaye, If-Range ke saath
+    _, _, headers = server.requests[-1]
+    assert headers["Range"].startswith("bytes=1000-")
+    assert headers["If-Range"] == '"clip"'
+    # Download ke baad path lock ki entry nahi bachti
+    assert manager._path_locks == {}
+
+
+def test_catalog_lookup_respects_the_deadline(tmp_path, server):
+    catalog = VideoCatalog({"researcher": {"catalog_url": f"{server.url}/catalog.json"}})
+    assert [video["url"] for video in catalog.search(["zenfit"], 5, Deadline(30))["videos"]] == ["http://example.com/a.mp4"]
+
+    deadline = Deadline(30)
+    deadline.cancel()
+    with pytest.raises(CampaignCancelledError):
+        catalog.search(["zenfit"], 5, deadline)
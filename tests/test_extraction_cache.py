@@ -0,0 +1,73 @@
+import os
+
+from backend.strategist_agent.tools.disk_cache import DiskCache
+from backend.strategist_agent.tools.extraction_cache import ExtractionCache
+
+
+def make_cache(tmp_path, **overrides):
+    cache_config = {"memory_entries": 2}
+    cache_config.update(overrides)
+    return ExtractionCache({"paths": {"data_dir": str(tmp_path)}, "extraction_cache": cache_config})
+
+
+def test_memory_and_disk_hits_and_misses(tmp_path):
+    brief = tmp_path / "brief.txt"
+    brief.write_text("Product: Zenfit Band", encoding="utf-8")
+    cache = make_cache(tmp_path)
+    key = cache.make_key("text_file", str(brief))
+
+    assert cache.get(key) is None
+    cache.put(key, "Product: Zenfit Band")
+    assert cache.get(key) == "Product: Zenfit Band"
+    assert cache.make_key("url", "https://example.com/brief") is None
+
+    # Naya instance (jaise restart ke baad) disk tier se padhta hai
+    restarted = make_cache(tmp_path)
+    assert restarted.get(key) == "Product: Zenfit Band"
+    assert restarted.get(key) == "Product: Zenfit Band"
+
+    assert (cache.stats["misses"], cache.stats["memory_hits"]) == (1, 1)
+    assert (restarted.stats["disk_hits"], restarted.stats["memory_hits"]) == (1, 1)
+
+
+def test_memory_tier_evicts_least_recently_used(tmp_path):
+    cache = make_cache(tmp_path)
+    for key in ("a" * 64, "b" * 64, "c" * 64):
+        cache.put(key, key[0])
+
+    stats = cache.get_stats()
+    assert (stats["memory_entries"], stats["memory_evictions"]) == (2, 1)
+    # Memory se nikli entry disk se milti hai
+    assert cache.get("a" * 64) == "a"
+    assert cache.stats["disk_hits"] == 1
+
+
+def test_disk_cache_evicts_oldest_entries_over_the_cap(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache"), max_bytes=250)
+    for key in ("aa01", "bb02", "cc03"):
+        cache.write(key, b"x" * 100)
+    cache.wait_loaded(5)
+
+    assert "aa01" not in cache
+    assert ("bb02" in cache, "cc03" in cache) == (True, True)
+    assert (cache.total_bytes, cache.evictions) == (200, 1)
+    assert not os.path.exists(cache.entry_path("aa01"))
+
+
+def test_disk_index_loads_in_the_background(tmp_path):
+    directory = str(tmp_path / "cache")
+    first = DiskCache(directory, max_bytes=1000)
+    first.write("aa01", b"old")
+    first.write("bb02", b"new")
+
+    reopened = DiskCache(directory, max_bytes=1000)
+    # Index load hone se pehle bhi maujood entries padhi ja sakti hain
+    assert reopened.read("aa01") == b"old"
+    assert reopened.wait_loaded(5)
+    assert (len(reopened), reopened.total_bytes) == (2, 6)
+    assert reopened.read("missing") is None
+
+    # Cap chhota ho to load ke baad purani entries hat jaati hain
+    capped = DiskCache(directory, max_bytes=4)
+    assert capped.wait_loaded(5)
+    assert len(capped) == 1 and capped.evictions == 1
@@ -0,0 +1,66 @@
+import wave
+
+import numpy as np
+
+from backend.storyteller_agent.tools.highlight_detector import HighlightDetector, parse_clip_length, top_k_windows
+
+SAMPLE_RATE = 8000
+FPS = 2
+
+
+def write_wav(path, samples):
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(SAMPLE_RATE)
+        wav_file.writeframes(samples.astype("<i2").tobytes())
+
+
+def quiet_audio(seconds, rng):
+    return (rng.standard_normal(seconds * SAMPLE_RATE) * 300).astype(np.int16)
+
+
+def static_frames(seconds, rng):
+    frame = rng.integers(0, 255, (36, 64), dtype=np.uint8)
+    return np.repeat(frame[None], seconds * FPS, axis=0)
+
+
+def test_loud_burst_in_a_wav_is_the_top_highlight(tmp_path):
+    rng = np.random.default_rng(1)
+    samples = quiet_audio(120, rng)
+    samples[60 * SAMPLE_RATE:70 * SAMPLE_RATE] = (rng.standard_normal(10 * SAMPLE_RATE) * 9000).astype(np.int16)
+    write_wav(tmp_path / "burst.wav", samples)
+
+    result = HighlightDetector({}).detect_from_wav(str(tmp_path / "burst.wav"), clip_length="10s", top_k=1)
+
+    assert result["status"] == "success"
+    assert result["duration_sec"] == 120.0
+    assert [(clip["start_sec"], clip["end_sec"]) for clip in result["highlights"]] == [(60.0, 70.0)]
+
+
+def test_scene_cut_and_burst_give_separate_highlights(tmp_path):
+    rng = np.random.default_rng(2)
+    samples = quiet_audio(120, rng)
+    samples[90 * SAMPLE_RATE:100 * SAMPLE_RATE] = (rng.standard_normal(10 * SAMPLE_RATE) * 9000).astype(np.int16)
+    frames = static_frames(120, rng)
+    # 30s par scene cut: baaki video mein naya (static) scene
+    frames[30 * FPS:] = rng.integers(0, 255, (36, 64), dtype=np.uint8)
+    write_wav(tmp_path / "clip.wav", samples)
+
+    result = HighlightDetector({}).detect_from_wav(str(tmp_path / "clip.wav"), frames=frames, fps=FPS, clip_length="10s", top_k=2)
+
+    clips = sorted((clip["start_sec"], clip["end_sec"]) for clip in result["highlights"])
+    assert len(clips) == 2
+    cut_clip, burst_clip = clips
+    assert cut_clip[0] <= 30.0 < cut_clip[1]
+    assert burst_clip == (90.0, 100.0)
+    # Clips overlap nahi karti aur clip length ke barabar hain
+    assert cut_clip[1] <= burst_clip[0]
+    assert all(end - start == 10.0 for start, end in clips)
+
+
+def test_top_k_windows_do_not_overlap():
+    scores = np.array([0, 5, 5, 0, 0, 4, 4, 0, 3, 0], dtype=np.float32)
+    assert top_k_windows(scores, 2, 3) == [(1, 10.0), (5, 8.0), (7, 3.0)]
+    assert parse_clip_length("15-60s") == (15.0, 60.0)
+    assert parse_clip_length("30s") == (30.0, 30.0)
@@ -0,0 +1,73 @@
+import pytest
+
+from backend.ai_agent_manager.job_queue import QueueFullError
+from backend.ai_agent_manager.manager import Manager
+
+
+def finish_immediately(manager):
+    # Bahut tez worker: submit ke andar hi campaign poora ho jaata hai
+    def workflow(campaign_details, prefetched_text=None):
+        campaign_id = campaign_details["campaign_id"]
+        manager.state_store.update_status(campaign_id, status="completed", message="done")
+        manager.close_deadline(campaign_id)
+
+    def submit(job_id, func, *args, **kwargs):
+        func(*args, **kwargs)
+
+    manager.start_campaign_workflow = workflow
+    manager.job_queue.submit = submit
+
+
+def test_fast_worker_status_is_not_reset_to_queued(app_config):
+    manager = Manager(app_config)
+    finish_immediately(manager)
+
+    campaign_id = manager.submit_campaign({"campaign_id": "fast-1", "campaign_name": "Fast"})
+
+    assert manager.get_workflow_status(campaign_id)["status"] == "completed"
+    assert campaign_id not in manager.state_store.list_unfinished()
+
+
+def test_rejected_submission_is_not_left_queued(app_config):
+    manager = Manager(app_config)
+
+    def submit(job_id, func, *args, **kwargs):
+        raise QueueFullError("full")
+
+    manager.job_queue.submit = submit
+    with pytest.raises(QueueFullError):
+        manager.submit_campaign({"campaign_id": "rejected-1", "campaign_name": "Rejected"})
+
+    assert manager.get_workflow_status("rejected-1")["status"] == "failed"
+    assert manager.state_store.list_unfinished() == []
+    assert manager.get_deadline("rejected-1") is None
+
+
+def test_resumed_campaign_keeps_its_final_status(app_config):
+    manager = Manager(app_config)
+    finish_immediately(manager)
+    # Mare hue process ka adhura campaign: running row, koi lease nahi
+    manager.state_store.create_campaign("orphan-1", {"campaign_id": "orphan-1", "campaign_name": "Orphan"}, status="running")
+
+    assert manager.resume_interrupted_campaigns() == ["orphan-1"]
+    assert manager.get_workflow_status("orphan-1")["status"] == "completed"
+
+
+def test_cancel_reaches_the_worker_that_owns_the_campaign(app_config):
+    # Do Managers same data_dir par = do gunicorn workers
+    owner, other = Manager(app_config), Manager(app_config)
+    owner.job_queue.submit = lambda job_id, func, *args, **kwargs: None
+    campaign_id = owner.submit_campaign({"campaign_id": "remote-1", "campaign_name": "Remote"})
+
+    cancellation = other.cancel_campaign(campaign_id)
+    assert cancellation["cancelled"] is True
+    assert other.apply_cancel_requests() == []
+
+    # Owner ka heartbeat request uthata hai; workflow phir "cancelled" likhta hai
+    assert owner.apply_cancel_requests() == [campaign_id]
+    result = owner.start_campaign_workflow({"campaign_id": campaign_id, "campaign_name": "Remote"})
+    assert result["status"] == "error"
+    assert owner.get_workflow_status(campaign_id)["status"] == "cancelled"
+    # Run khatam hone par request hat jaati hai, isliye same id ka naya submission cancel nahi hota
+    assert owner.checkpoints.cancel_reason(campaign_id) is None
+    assert other.cancel_campaign(campaign_id)["cancelled"] is False
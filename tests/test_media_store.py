@@ -0,0 +1,83 @@
+import os
+import threading
+import time
+
+import pytest
+
+from backend.ai_agent_manager.manager import Manager
+from backend.ai_agent_manager.media_store import MediaStore
+
+
+def make_store(tmp_path, quota_bytes=100):
+    config = {"paths": {"data_dir": str(tmp_path)}, "media_store": {"quota_gb": quota_bytes / 1024 ** 3}}
+    return MediaStore(config)
+
+
+def add_video(store, tmp_path, name, content, campaign_id):
+    source = tmp_path / f"{name}.download"
+    source.write_bytes(content)
+    return store.add_file(str(source), campaign_id, str(tmp_path / "raw" / campaign_id / f"{name}.mp4"), source_url=f"https://example.com/{name}")
+
+
+def test_duplicate_content_is_stored_once(tmp_path):
+    store = make_store(tmp_path, quota_bytes=10_000)
+    first = add_video(store, tmp_path, "a", b"x" * 60, "c1")
+    second = add_video(store, tmp_path, "b", b"x" * 60, "c2")
+
+    assert second["deduplicated"] and second["digest"] == first["digest"]
+    assert store.get_stats()["objects"] == 1
+
+
+def test_only_unreferenced_objects_are_evicted(tmp_path):
+    store = make_store(tmp_path, quota_bytes=100)
+    old = add_video(store, tmp_path, "old", b"o" * 60, "c1")
+    store.release("c1")
+    new = add_video(store, tmp_path, "new", b"n" * 60, "c2")
+
+    # Quota 100 bytes: bina reference wala purana object hata, campaign c2 ka object bacha
+    assert not os.path.exists(store.object_path(old["digest"]))
+    assert os.path.exists(new["path"])
+    assert store.lookup_source("https://example.com/old") is None
+    with pytest.raises(FileNotFoundError):
+        store.link(old["digest"], "c3", str(tmp_path / "raw" / "c3" / "old.mp4"))
+
+
+def test_eviction_waits_for_another_process_write_lock(tmp_path):
+    # Do MediaStore instances = do worker processes (alag thread locks, same SQLite index)
+    first = make_store(tmp_path, quota_bytes=10_000)
+    second = make_store(tmp_path, quota_bytes=50)
+    video = add_video(first, tmp_path, "shared", b"s" * 60, "c1")
+    first.release("c1")
+
+    evicted = threading.Event()
+    with first._write_lock() as conn:
+        thread = threading.Thread(target=lambda: (second.enforce_quota(), evicted.set()))
+        thread.start()
+        # Pehla process object link kar raha hai; doosre ka evict tab tak ruka rehta hai
+        assert not evicted.wait(0.3)
+        first._link(conn, video["digest"], "c2", str(tmp_path / "raw" / "c2" / "shared.mp4"))
+    thread.join()
+
+    assert evicted.is_set()
+    assert os.path.exists(first.object_path(video["digest"]))
+
+
+def test_sweep_releases_finished_campaigns_so_quota_can_evict(app_config, tmp_path):
+    app_config["media_store"]["quota_gb"] = 150 / 1024 ** 3
+    manager = Manager(app_config)
+    store = manager.media_store
+    videos = {}
+    for campaign_id, status in (("done-1", "completed"), ("done-2", "failed"), ("live-1", "running")):
+        manager.state_store.create_campaign(campaign_id, {"campaign_id": campaign_id}, status=status, submitted_at=time.time())
+        videos[campaign_id] = add_video(store, tmp_path, campaign_id, campaign_id.encode() * 20, campaign_id)
+    manager.state_store.flush()
+
+    # Teeno campaigns ke links zinda hain, isliye quota se upar hote hue bhi kuch evict nahi hua
+    assert store.get_stats()["size_bytes"] > store.quota_bytes
+    assert all(os.path.exists(video["path"]) for video in videos.values())
+
+    # Retention window beet jaane ke baad sweep khatam hue campaigns chhodta hai aur quota purane objects hatata hai
+    assert manager.sweep_campaign_media(cutoff=time.time() + 1) == ["done-1", "done-2"]
+    assert not os.path.exists(store.object_path(videos["done-1"]["digest"]))
+    assert store.get_stats()["size_bytes"] <= store.quota_bytes
+    assert os.path.exists(videos["live-1"]["path"])
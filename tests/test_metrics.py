@@ -0,0 +1,39 @@
+import re
+
+from backend.ai_agent_manager.api_routes import app
+from backend.ai_agent_manager.manager import Manager
+
+
+def run_campaign(app_config, tmp_path, campaign_id):
+    brief = tmp_path / "brief.txt"
+    brief.write_text("Product: Zenfit Band\nAudience: Runners\nKeywords: sleep, fitness\n", encoding="utf-8")
+    manager = Manager(app_config)
+    return manager.start_campaign_workflow({
+        "campaign_id": campaign_id, "campaign_name": "Observed", "input_type": "text_file", "input_data": str(brief),
+        "required_length_sec": "15-60s", "target_product": "Zenfit Band", "social_media_platforms": ["instagram"]
+    })
+
+
+def metric_value(text, name, **labels):
+    for line in text.splitlines():
+        match = re.match(rf"^{name}\{{(.*)\}} (\S+)$", line)
+        if match and all(f'{key}="{value}"' in match.group(1).split(",") for key, value in labels.items()):
+            return float(match.group(2))
+    return None
+
+
+def test_metrics_endpoint_has_stage_latency_and_outcomes(app_config, tmp_path):
+    before = app.test_client().get("/api/v1/metrics").get_data(as_text=True)
+    labels = {"stage": "strategist", "input_type": "text_file", "outcome": "success", "size_bucket": "lt_64kb"}
+    count_before = metric_value(before, "campaign_workflow_stage_total", **labels) or 0
+
+    assert run_campaign(app_config, tmp_path, "metrics-1")["status"] == "success"
+    response = app.test_client().get("/api/v1/metrics")
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    text = response.get_data(as_text=True)
+    assert metric_value(text, "campaign_workflow_stage_total", **labels) == count_before + 1
+    assert metric_value(text, "campaign_workflow_stage_duration_seconds_count", **labels) >= 1
+    assert metric_value(text, "campaign_workflow_stage_duration_seconds_bucket", le="+Inf", **labels) >= 1
+    assert metric_value(text, "strategist_tool_total", tool="requirement_extractor", input_type="text_file", outcome="success") >= 1
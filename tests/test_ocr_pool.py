@@ -0,0 +1,68 @@
+import threading
+
+from PIL import Image
+
+from backend.strategist_agent.tools import ocr_pool
+from backend.strategist_agent.tools.ocr_pool import OCRWorkerPool
+
+
+class FakeTessAPI:
+    # PyTessBaseAPI jaisa engine jo ginta hai ki kitni baar (kis thread par) bana
+    created = []
+
+    def __init__(self, path=None, lang="eng"):
+        FakeTessAPI.created.append(threading.current_thread().name)
+        self.image = None
+
+    def SetImage(self, image):
+        self.image = image
+
+    def Recognize(self, timeout=0):
+        return True
+
+    def GetUTF8Text(self):
+        return f"text {self.image.size[0]}"
+
+    def Clear(self):
+        pass
+
+    def End(self):
+        pass
+
+
+class FakeTesserocr:
+    PyTessBaseAPI = FakeTessAPI
+
+
+class BrokenTesserocr:
+    class PyTessBaseAPI:
+        def __init__(self, path=None, lang="eng"):
+            raise RuntimeError("Failed to init API, possibly an invalid tessdata path")
+
+
+def test_warm_up_creates_one_engine_per_worker_and_reuses_them(monkeypatch):
+    FakeTessAPI.created = []
+    monkeypatch.setattr(ocr_pool, "tesserocr", FakeTesserocr)
+    pool = OCRWorkerPool("tesseract", workers=3, batch_size=1, tessdata_dir="/tmp")
+    try:
+        assert pool.warm_up() == 3
+        assert len(set(FakeTessAPI.created)) == 3
+
+        images = [Image.new("L", (width, 10), 255) for width in range(10, 20)]
+        assert pool.ocr_images(images) == [f"text {width}" for width in range(10, 20)]
+        # Requests ke dauraan koi naya engine nahi bana
+        assert len(FakeTessAPI.created) == 3
+    finally:
+        pool.shutdown()
+
+
+def test_engine_init_failure_falls_back_to_cli(monkeypatch):
+    monkeypatch.setattr(ocr_pool, "tesserocr", BrokenTesserocr)
+    monkeypatch.setattr(OCRWorkerPool, "_run_tesseract", lambda self, path, timeout, deadline=None: "cli text")
+    pool = OCRWorkerPool("tesseract", workers=2, batch_size=1, tessdata_dir="/tmp")
+    try:
+        assert pool.warm_up() == 0
+        assert pool.engine == "cli"
+        assert pool.ocr_images([Image.new("L", (20, 10), 255)]) == ["cli text"]
+    finally:
+        pool.shutdown()
@@ -0,0 +1,52 @@
+from backend.ai_agent_manager.api_routes import app
+from backend.strategist_agent.strategist import Strategist
+
+
+class FakeManager:
+    def __init__(self, strategist):
+        self.strategist = strategist
+
+    def get_readiness(self):
+        return self.strategist.get_readiness()
+
+
+def get_ready(strategist):
+    app.config["AI_MANAGER"] = FakeManager(strategist)
+    try:
+        return app.test_client().get("/api/v1/ready")
+    finally:
+        app.config.pop("AI_MANAGER", None)
+
+
+def test_lazy_mode_is_ready_with_cold_tools():
+    strategist = Strategist({"startup": {"preload_tools": False}})
+    response = get_ready(strategist)
+
+    assert response.status_code == 200
+    assert response.get_json()["mode"] == "lazy"
+    assert set(response.get_json()["tools"].values()) == {"cold"}
+
+
+def test_preload_mode_waits_for_warm_up():
+    strategist = Strategist({"startup": {"preload_tools": True}})
+    assert get_ready(strategist).status_code == 503
+
+    # warm_up() ke baad jaisi state
+    strategist._tool_states = {name: "warm" for name in strategist._tool_states}
+    strategist.warmed_up = True
+    assert get_ready(strategist).status_code == 200
+
+
+def test_failed_warm_up_is_not_ready(tmp_path):
+    strategist = Strategist({"startup": {"preload_tools": True}, "paths": {"data_dir": str(tmp_path)}, "pdf": {"workers": 2}})
+
+    def broken_pool():
+        raise OSError("cannot spawn")
+
+    strategist.ocr_model.warm_up = lambda: 0
+    strategist.document_parser._get_pdf_pool = broken_pool
+    strategist.warm_up()
+
+    response = get_ready(strategist)
+    assert response.status_code == 503
+    assert response.get_json()["tools"]["document_parser"] == "failed"
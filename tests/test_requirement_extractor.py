@@ -0,0 +1,39 @@
+from backend.strategist_agent.tools.requirement_extractor import RequirementExtractor
+
+
+def extract(text, config=None):
+    result = RequirementExtractor(config or {}).extract(text)
+    assert result["status"] == "success"
+    return result["requirements"]
+
+
+def test_longest_prefix_wins():
+    assert extract("Product name: Zenfit Band\n")["product"] == "Zenfit Band"
+    assert extract("product: zenfit band")["product"] == "Zenfit Band"
+    assert extract("Target Audience: young professionals\n")["audience"] == "Young Professionals"
+
+
+def test_line_start_prefix_in_the_middle_of_a_line_is_ignored():
+    requirements = extract("Our best product: Old Gadget\n  Product: Zenfit Band\nWe love our audience: everyone\n")
+    assert requirements["product"] == "Zenfit Band"
+    assert requirements["audience"] is None
+    # "anywhere" anchor wala field line ke beech se bhi milta hai
+    assert extract("Brief for reels. Keywords: sleep, fitness\n")["research_keywords"] == ["sleep", "fitness"]
+
+
+def test_first_and_last_occurrence():
+    requirements = extract("Product: Old Gadget\nKeywords: a, b\nProduct: Zenfit Band\nKeywords: c\n")
+    assert requirements["product"] == "Zenfit Band"
+    assert requirements["research_keywords"] == ["a", "b"]
+
+
+def test_fields_can_be_overridden_from_config():
+    config = {"requirement_extractor": {"fields": {
+        "product": {"prefixes": ["brand:"], "occurrence": "first"},
+        "budget": {"prefixes": ["budget:"], "anchor": "anywhere"},
+    }}}
+    requirements = extract("Product: Ignored\nBrand: zenfit\nBrand: other\nTotal budget: 500 usd\n", config)
+    assert requirements["product"] == "Zenfit"
+    assert requirements["budget"] == "500 usd"
+    # Product na mile to keywords ke liye fallback
+    assert extract("Audience: runners\n")["research_keywords"] == ["Runners"]
@@ -0,0 +1,45 @@
+import io
+import json
+import logging
+
+from backend.ai_agent_manager.manager import Manager
+from backend.ai_agent_manager.structured_logging import CampaignContextFilter, JSONFormatter, campaign_context, stage_context
+
+
+def run_campaign(app_config, tmp_path, campaign_id):
+    brief = tmp_path / "brief.txt"
+    brief.write_text("Product: Zenfit Band\nAudience: Runners\nKeywords: sleep, fitness\n", encoding="utf-8")
+    manager = Manager(app_config)
+    return manager.start_campaign_workflow({
+        "campaign_id": campaign_id, "campaign_name": "Observed", "input_type": "text_file", "input_data": str(brief),
+        "required_length_sec": "15-60s", "target_product": "Zenfit Band", "social_media_platforms": ["instagram"]
+    })
+
+
+def test_json_log_records_carry_campaign_and_stage(app_config, tmp_path):
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.addFilter(CampaignContextFilter())
+    handler.setFormatter(JSONFormatter())
+    root = logging.getLogger()
+    previous_level = root.level
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+    try:
+        with campaign_context("log-0"), stage_context("researcher"):
+            logging.getLogger("test").warning("inside")
+        logging.getLogger("test").warning("outside")
+        run_campaign(app_config, tmp_path, "log-1")
+    finally:
+        root.removeHandler(handler)
+        root.setLevel(previous_level)
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    inside, outside = records[0], records[1]
+    assert (inside["campaign_id"], inside["stage"], inside["message"]) == ("log-0", "researcher", "inside")
+    assert inside["level"] == "WARNING" and inside["ts"].endswith("Z")
+    assert "campaign_id" not in outside and "stage" not in outside
+
+    strategist_records = [record for record in records if record.get("stage") == "strategist"]
+    assert strategist_records
+    assert {record["campaign_id"] for record in strategist_records} == {"log-1"}
@@ -0,0 +1,46 @@
+import threading
+
+from backend.marketer_agent.tools.tag_index import TagIndex
+
+
+def make_index(tmp_path, **overrides):
+    index_config = {"load_wait_sec": 1}
+    index_config.update(overrides)
+    index = TagIndex({"paths": {"data_dir": str(tmp_path)}, "marketer": {"tag_index": index_config}})
+    assert index.wait_until_loaded(5)
+    return index
+
+
+def video(source_url, title, tags, virality_score=10):
+    return {"video_path": f"/tmp/{source_url[-5:]}.mp4",
+            "metadata": {"source_url": source_url, "title": title, "tags": tags, "virality_score": virality_score}}
+
+
+def test_suggest_ranks_tags_of_matching_videos(tmp_path):
+    index = make_index(tmp_path)
+    index.add_videos("c1", [video("https://v/1", "Best fitness band review", ["FitnessBand", "review"]),
+                            video("https://v/2", "Cooking pasta at home", ["pasta"])])
+
+    suggestions = index.suggest(["fitness band"])
+    assert suggestions["hashtags"][0]["tag"] == "#fitnessband"
+    assert "#pasta" not in [item["tag"] for item in suggestions["hashtags"]]
+
+
+def test_videos_added_by_another_worker_are_picked_up(tmp_path):
+    first = make_index(tmp_path)
+    second = make_index(tmp_path)
+    assert second.suggest(["fitness band"])["hashtags"] == []
+
+    # Doosra worker process (alag TagIndex) campaign ke videos jodta hai
+    first.add_videos("c1", [video("https://v/1", "Best fitness band review", ["FitnessBand"])])
+
+    assert second.suggest(["fitness band"])["hashtags"][0]["tag"] == "#fitnessband"
+    assert second.get_stats()["videos"] == 1
+
+
+def test_slow_load_falls_back_to_empty_ranking(tmp_path):
+    index = make_index(tmp_path, load_wait_sec=0.05)
+    index._loaded = threading.Event() # Jaise startup load abhi chal raha ho
+
+    suggestions = index.suggest(["fitness band"])
+    assert suggestions == {"status": "success", "hashtags": [], "title_phrases": [], "matched_terms": 0}
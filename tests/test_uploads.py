@@ -0,0 +1,60 @@
+import io
+import os
+import time
+
+import pytest
+
+from backend.ai_agent_manager.manager import Manager
+from backend.ai_agent_manager.uploads import InvalidUploadError, UploadStore, UploadTooLargeError
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100
+WEBP = b"RIFF\x00\x00\x00\x00WEBPVP8 " + b"\x00" * 100
+
+
+def make_store(tmp_path, **overrides):
+    uploads_config = {"max_mb": 1024 / 1024 / 1024, "chunk_size": 64}
+    uploads_config.update(overrides)
+    return UploadStore({"paths": {"data_dir": str(tmp_path)}, "uploads": uploads_config})
+
+
+def test_formats_are_detected_from_the_first_bytes(tmp_path):
+    store = make_store(tmp_path)
+    png = store.save_stream(io.BytesIO(PNG))
+    assert (png["format"], png["size_bytes"]) == ("png", len(PNG))
+    assert store.path_for(png["upload_id"]) is not None
+    assert store.save_stream(io.BytesIO(WEBP))["format"] == "webp"
+
+    with pytest.raises(InvalidUploadError):
+        store.save_stream(io.BytesIO(b"%PDF-1.7 not an image"))
+    with pytest.raises(InvalidUploadError):
+        store.save_stream(io.BytesIO(b""))
+    assert store.path_for("../../etc/passwd") is None
+
+
+def test_oversized_uploads_are_rejected_without_leftovers(tmp_path):
+    store = make_store(tmp_path)
+    # Declared Content-Length par koi file khulti hi nahi
+    with pytest.raises(UploadTooLargeError):
+        store.open_writer(content_length=2048)
+    # Stream limit paar kare to .part file hat jaati hai
+    with pytest.raises(UploadTooLargeError):
+        store.save_stream(io.BytesIO(PNG * 20))
+    assert os.listdir(store.directory) == []
+
+
+def test_prune_keeps_uploads_of_unfinished_campaigns(app_config):
+    manager = Manager(app_config)
+    store = manager.upload_store
+    old, in_use, fresh = (store.save_stream(io.BytesIO(PNG))["upload_id"] for _ in range(3))
+    leftover = os.path.join(store.directory, "0" * 32 + ".part")
+    open(leftover, "wb").close()
+    past = time.time() - 2 * store.retention_sec
+    for path in (store.path_for(old), store.path_for(in_use), leftover):
+        os.utime(path, (past, past))
+    manager.state_store.create_campaign("waiting-1", {"campaign_id": "waiting-1", "input_type": "screenshot_file", "input_data": in_use},
+                                        status="queued", submitted_at=time.time())
+    manager.state_store.flush()
+
+    assert manager.prune_uploads() == 2
+    assert store.path_for(old) is None and not os.path.exists(leftover)
+    assert store.path_for(in_use) is not None and store.path_for(fresh) is not None
@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from backend.strategist_agent.tools.url_fetcher import URLFetcher
+from tests.http_server import LocalServer
+
+
+@pytest.fixture
+def server():
+    server = LocalServer({
+        "/brief": (b"<html><body><p>Product: Zenfit Band</p></body></html>", {"Content-Type": "text/html", "ETag": '"v1"'}),
+        "/big": (b"x" * 4000, {"Content-Type": "text/plain", "ETag": '"big"'}),
+        "/other": (b"y" * 4000, {"Content-Type": "text/plain", "ETag": '"other"'}),
+    })
+    yield server
+    server.close()
+
+
+def make_fetcher(tmp_path, **overrides):
+    fetcher_config = {"timeout_sec": 5}
+    fetcher_config.update(overrides)
+    return URLFetcher({"paths": {"data_dir": str(tmp_path)}, "url_fetcher": fetcher_config})
+
+
+def test_unchanged_url_is_revalidated_with_a_conditional_get(tmp_path, server):
+    fetcher = make_fetcher(tmp_path)
+    first = fetcher.fetch(f"{server.url}/brief")
+    second = fetcher.fetch(f"{server.url}/brief")
+
+    assert first["text"] == second["text"] == "Product: Zenfit Band"
+    assert (first["from_store"], second["from_store"]) == (False, True)
+    # Sirf GET requests, doosri If-None-Match ke saath; koi HEAD nahi
+    assert [method for method, _, _ in server.requests] == ["GET", "GET"]
+    assert server.requests[1][2].get("If-None-Match") == '"v1"'
+
+
+def test_http_store_is_size_capped(tmp_path, server):
+    fetcher = make_fetcher(tmp_path, store_max_mb=6000 / 1024 / 1024)
+    fetcher.fetch(f"{server.url}/big")
+    fetcher.fetch(f"{server.url}/other")
+
+    # Cap do bodies ke liye chhota hai, isliye purana URL evict hua
+    assert len(fetcher.store) == 1
+    assert fetcher.store.total_bytes <= 6000
+    assert fetcher.fetch(f"{server.url}/big")["from_store"] is False
+
+
+def test_fetch_async_uses_the_same_store(tmp_path, server):
+    httpx = pytest.importorskip("httpx")
+    fetcher = make_fetcher(tmp_path)
+    fetcher.fetch(f"{server.url}/brief")
+
+    async def fetch():
+        async with httpx.AsyncClient() as client:
+            return await fetcher.fetch_async(f"{server.url}/brief", client)
+
+    result = asyncio.run(fetch())
+    assert result["from_store"] is True
+    assert result["text"] == "Product: Zenfit Band"